@@ -0,0 +1,742 @@
+#!/usr/bin/env python3
+"""Benchmark enact-tasks.py against synthetic task directories.
+
+Generates throwaway tasks directories and exercises enact-tasks.py
+against them:
+
+- headers: task files carry long bodies (as they do once the Task
+  Refiner and QA Scenario Generator have appended to them); compares
+  reading whole files against the bounded header reader used by
+  load_tasks.
+- claim-stress: launches many concurrent `claim` processes and checks
+  that every claimer received a distinct task and that no update was
+  lost. Exits non-zero on failure.
+- batch-check: feeds `batch` a mix of valid and rejected records
+  and checks each result line's outcome and that it reports the
+  record's id whenever one parsed (e.g. for an unknown field). Exits
+  non-zero on failure.
+- suite: generates synthetic directories across a grid of task
+  counts, body lengths, tag cardinalities and blocked_by densities,
+  times parse_frontmatter, load_tasks and every subcommand except
+  watch and shard, both in-process and as a subprocess, and writes a
+  JSON report. Given a baseline report, exits non-zero if any case
+  regressed by more than the threshold.
+
+Usage:
+    bench-tasks.py headers [--tasks N] [--body-kb K]
+    bench-tasks.py claim-stress [--workers N] [--tasks M] [--rounds R]
+    bench-tasks.py batch-check
+    bench-tasks.py suite [--tasks N,...] [--body-kb K,...]
+        [--tag-cardinality C,...] [--density D,...] [--repeat R]
+        [--output report.json] [--baseline base.json]
+        [--threshold FRACTION]
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import itertools
+import json
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def load_enact_tasks():
+    """Import enact-tasks.py, whose file name is not a
+    valid module name."""
+    spec = importlib.util.spec_from_file_location(
+        "enact_tasks", SCRIPTS_DIR / "enact-tasks.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_bytes_counter() -> int | None:
+    """Return bytes read by this process so far, if the
+    platform exposes it (Linux /proc/self/io)."""
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def write_task(
+    path: Path,
+    task_id: int,
+    body_bytes: int,
+    chained: bool = True,
+    blocked_by: list[int] | None = None,
+    tags: list[str] | None = None,
+    status: str = "pending",
+) -> None:
+    """Write one synthetic task file with a long body.
+
+    Chained tasks are each blocked by the previous one,
+    unless blocked_by is given explicitly.
+    """
+    paragraph = (
+        "Lorem ipsum dolor sit amet, consectetur adipiscing "
+        "elit, sed do eiusmod tempor incididunt ut labore.\n"
+    )
+    repeats = max(1, body_bytes // len(paragraph))
+    if blocked_by is None:
+        blocked_by = [task_id - 1] if chained and task_id > 1 else []
+    if tags is None:
+        tags = ["backend", "db"]
+    blocked = "[" + ", ".join(str(b) for b in blocked_by) + "]"
+    text = (
+        "---\n"
+        f"id: {task_id}\n"
+        f"status: {status}\n"
+        'owner: ""\n'
+        f"tags: [{', '.join(tags)}]\n"
+        f"blocked_by: {blocked}\n"
+        "---\n"
+        "\n"
+        f"# Synthetic task {task_id}\n"
+        "\n"
+        "## Description\n"
+        "\n"
+        + paragraph * repeats
+    )
+    path.write_text(text, encoding="utf-8")
+
+
+def make_tasks_dir(
+    count: int, body_bytes: int, chained: bool = True
+) -> Path:
+    """Create a temporary tasks directory."""
+    tasks_dir = Path(tempfile.mkdtemp(prefix="enact-bench-"))
+    for i in range(1, count + 1):
+        write_task(
+            tasks_dir / f"task_{i:02d}.md", i, body_bytes, chained
+        )
+    return tasks_dir
+
+
+def measure(fn) -> tuple[float, int | None]:
+    """Run fn once, returning (seconds, bytes read)."""
+    before = read_bytes_counter()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    after = read_bytes_counter()
+    if before is None or after is None:
+        return elapsed, None
+    return elapsed, after - before
+
+
+def format_bytes(n: int | None) -> str:
+    """Format a byte count for display."""
+    if n is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def bench_headers(args) -> None:
+    """Compare whole-file and header-only task reads."""
+    et = load_enact_tasks()
+    tasks_dir = make_tasks_dir(args.tasks, args.body_kb * 1024)
+    try:
+        paths = sorted(tasks_dir.glob("task_*.md"))
+        total = sum(p.stat().st_size for p in paths)
+
+        def full_read():
+            for p in paths:
+                with open(p, "r", encoding="utf-8") as f:
+                    et.task_from_text(f.read())
+
+        def header_read():
+            for p in paths:
+                et.make_task(*et.read_task_header(p))
+
+        print(
+            f"{len(paths)} task files, "
+            f"{format_bytes(total)} on disk"
+        )
+        print()
+        print(f"{'Reader':<10}  {'Time':>10}  {'Read':>10}")
+        for name, fn in (
+            ("full", full_read),
+            ("header", header_read),
+        ):
+            elapsed, nread = measure(fn)
+            print(
+                f"{name:<10}  {elapsed * 1000:>8.1f}ms"
+                f"  {format_bytes(nread):>10}"
+            )
+    finally:
+        shutil.rmtree(tasks_dir)
+
+
+def run_claim_round(
+    tasks_dir: Path, workers: int
+) -> tuple[list[str], int]:
+    """Run one round of concurrent claimers.
+
+    Returns (problems found, number of tasks claimed).
+    """
+    script = SCRIPTS_DIR / "enact-tasks.py"
+    procs = []
+    for w in range(workers):
+        owner = f"worker-{w}"
+        proc = subprocess.Popen(
+            [sys.executable, str(script), str(tasks_dir),
+             "claim", "--owner", owner],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        procs.append((owner, proc))
+
+    problems = []
+    claimed: dict[int, str] = {}
+    for owner, proc in procs:
+        out, err = proc.communicate()
+        if proc.returncode != 0:
+            problems.append(f"{owner} exited {proc.returncode}: {err}")
+            continue
+        m = re.match(r"Claimed task (\d+)\.", out)
+        if not m:
+            continue
+        task_id = int(m.group(1))
+        if task_id in claimed:
+            problems.append(
+                f"task {task_id} claimed by both "
+                f"{claimed[task_id]} and {owner}"
+            )
+        claimed[task_id] = owner
+
+    et = load_enact_tasks()
+    for task_id, owner in claimed.items():
+        path = et.resolve_task_path(str(tasks_dir), task_id)
+        fm, _ = et.read_task_header(path)
+        if fm.get("owner") != owner:
+            problems.append(
+                f"task {task_id}: owner is {fm.get('owner')!r}, "
+                f"expected {owner!r} (lost update)"
+            )
+        if fm.get("status") != "in_progress":
+            problems.append(
+                f"task {task_id}: status is {fm.get('status')!r}"
+            )
+    return problems, len(claimed)
+
+
+def bench_claim_stress(args) -> None:
+    """Check that concurrent claimers get distinct tasks."""
+    failed = False
+    for r in range(1, args.rounds + 1):
+        tasks_dir = make_tasks_dir(args.tasks, 512, chained=False)
+        try:
+            start = time.perf_counter()
+            problems, claimed = run_claim_round(
+                tasks_dir, args.workers
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            shutil.rmtree(tasks_dir)
+
+        expected = min(args.workers, args.tasks)
+        if claimed != expected:
+            problems.append(
+                f"{claimed} tasks claimed, expected {expected}"
+            )
+        status = "FAIL" if problems else "ok"
+        print(
+            f"round {r}: {args.workers} claimers, "
+            f"{claimed} claims, {elapsed * 1000:.0f}ms  {status}"
+        )
+        for p in problems:
+            print(f"  {p}")
+        failed = failed or bool(problems)
+
+    if failed:
+        sys.exit(1)
+
+
+# (record line, expected ok, expected "id" in the result or None)
+BATCH_CHECKS = [
+    ('{"id": 1, "status": "completed"}', True, 1),
+    ('{"id": 2, "priority": "high"}', False, 2),
+    ('{"id": "3", "status": 5}', False, 3),
+    ('{"id": 4, "status": "a\\nb"}', False, 4),
+    ('{"id": 5}', False, 5),
+    ('{"id": 99, "status": "completed"}', False, 99),
+    ('{"status": "completed"}', False, None),
+    ('{"id": true, "status": "completed"}', False, None),
+    ('not json', False, None),
+    ('{"id": 2, "owner": "bench"}', True, 2),
+]
+
+
+def bench_batch_check(args) -> None:
+    """Check batch's per-record results, including the id
+    of records rejected after their id parsed."""
+    tasks_dir = make_tasks_dir(5, 512, chained=False)
+    try:
+        proc = subprocess.run(
+            [sys.executable, str(SCRIPTS_DIR / "enact-tasks.py"),
+             str(tasks_dir), "batch"],
+            input="".join(line + "\n" for line, _, _ in BATCH_CHECKS),
+            capture_output=True, text=True, check=False,
+        )
+    finally:
+        shutil.rmtree(tasks_dir)
+
+    problems = []
+    if proc.returncode != 1:
+        problems.append(f"batch exited {proc.returncode}, expected 1")
+    results = [json.loads(line) for line in proc.stdout.splitlines()]
+    if len(results) != len(BATCH_CHECKS):
+        problems.append(
+            f"{len(results)} result lines, expected {len(BATCH_CHECKS)}"
+        )
+    for (line, ok, task_id), result in zip(BATCH_CHECKS, results):
+        if result.get("ok") != ok or result.get("id") != task_id:
+            problems.append(
+                f"{line}: got {json.dumps(result)}, expected "
+                f"ok={ok} id={task_id}"
+            )
+
+    print(
+        f"{len(BATCH_CHECKS)} batch records  "
+        f"{'FAIL' if problems else 'ok'}"
+    )
+    for p in problems:
+        print(f"  {p}")
+    if problems:
+        sys.exit(1)
+
+
+def make_synthetic_dir(
+    count: int,
+    body_bytes: int,
+    tag_cardinality: int,
+    density: float,
+    seed: int = 0,
+) -> Path:
+    """Create a tasks directory with a realistic mix.
+
+    Each task gets one to three tags drawn from
+    `tag_cardinality` distinct tags and on average
+    `density` blockers among the 50 preceding tasks.
+    About 40% of tasks are completed and 10% in progress.
+    """
+    rng = random.Random(seed)
+    tag_pool = [f"tag{i}" for i in range(max(1, tag_cardinality))]
+    tasks_dir = Path(tempfile.mkdtemp(prefix="enact-bench-"))
+    for i in range(1, count + 1):
+        window = list(range(max(1, i - 50), i))
+        n = int(density) + (rng.random() < density % 1)
+        blocked = sorted(rng.sample(window, min(n, len(window))))
+        tags = rng.sample(tag_pool, min(len(tag_pool), rng.randint(1, 3)))
+        roll = rng.random()
+        status = (
+            "completed" if roll < 0.4
+            else "in_progress" if roll < 0.5
+            else "pending"
+        )
+        write_task(
+            tasks_dir / f"task_{i:02d}.md", i, body_bytes,
+            blocked_by=blocked, tags=tags, status=status,
+        )
+    return tasks_dir
+
+
+def time_runs(fn, repeat: int, setup=None) -> dict:
+    """Time fn `repeat` times, returning summary stats
+    in milliseconds. `setup` runs untimed before each."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(samples[len(samples) // 2], 3),
+        "min_ms": round(samples[0], 3),
+        "max_ms": round(samples[-1], 3),
+        "runs": repeat,
+    }
+
+
+def quiet(fn, *args, **kwargs):
+    """Return a callable running fn with stdout discarded."""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn(*args, **kwargs)
+    return run
+
+
+def run_script(*args: str, stdin: str | None = None):
+    """Return a callable running enact-tasks.py, feeding it
+    `stdin` if given."""
+    cmd = [sys.executable, str(SCRIPTS_DIR / "enact-tasks.py"), *args]
+
+    def run():
+        subprocess.run(
+            cmd, input=stdin, text=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    return run
+
+
+# Records per timed batch call, one task each.
+BATCH_RECORDS = 50
+
+CLAIMED_RE = re.compile(r"Claimed task (\d+)\.")
+
+
+def batch_payload(count: int, status: str) -> str:
+    """Return NDJSON setting the status of the first tasks."""
+    return "".join(
+        json.dumps({"id": i, "status": status}) + "\n"
+        for i in range(1, min(count, BATCH_RECORDS) + 1)
+    )
+
+
+def claim_runs(et, tasks_dir: str):
+    """Return (inproc, subprocess, release) callables for
+    timing claim.
+
+    Both claim callables record the task they took;
+    release hands those back (pending, no owner) so that
+    repeated claims see the same directory.
+    """
+    claimed = []
+    cmd = [
+        sys.executable, str(SCRIPTS_DIR / "enact-tasks.py"),
+        tasks_dir, "claim", "--owner", "bench",
+    ]
+
+    def record(output: str) -> None:
+        m = CLAIMED_RE.search(output)
+        if m:
+            claimed.append(int(m.group(1)))
+
+    def inproc():
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            et.cmd_claim(tasks_dir, "bench")
+        record(out.getvalue())
+
+    def subproc():
+        proc = subprocess.run(
+            cmd, capture_output=True, text=True, check=False,
+        )
+        record(proc.stdout)
+
+    def release():
+        while claimed:
+            quiet(
+                et.cmd_update, tasks_dir, claimed.pop(),
+                status="pending", owner="",
+            )()
+
+    return inproc, subproc, release
+
+
+def suite_cases(
+    et, tasks_dir: Path, repeat: int
+) -> list[tuple[str, str, dict]]:
+    """Return (case, mode, stats) for one synthetic directory."""
+    d = str(tasks_dir)
+    sample = next(tasks_dir.glob("task_*.md")).read_text("utf-8")
+    target = 1
+
+    def drop_index():
+        for name in (et.INDEX_FILE, et.JOURNAL_FILE):
+            with contextlib.suppress(OSError):
+                (tasks_dir / name).unlink()
+
+    statuses = itertools.cycle(["pending", "in_progress"])
+    batch_statuses = itertools.cycle(["pending", "in_progress"])
+    count = sum(1 for _ in tasks_dir.glob("task_*.md"))
+    claim_inproc, claim_subproc, release = claim_runs(et, d)
+
+    results = [
+        ("parse_frontmatter", "inproc", time_runs(
+            lambda: et.parse_frontmatter(sample), repeat,
+        )),
+        ("load_tasks_cold", "inproc", time_runs(
+            lambda: et.load_tasks(d), repeat, setup=drop_index,
+        )),
+        ("load_tasks_warm", "inproc", time_runs(
+            lambda: et.load_tasks(d), repeat,
+        )),
+        ("next-id", "inproc", time_runs(
+            quiet(et.cmd_next_id, d), repeat,
+        )),
+        ("reserve-id", "inproc", time_runs(
+            quiet(et.cmd_reserve_id, d), repeat,
+        )),
+        ("list", "inproc", time_runs(
+            quiet(et.cmd_list, d), repeat,
+        )),
+        ("available", "inproc", time_runs(
+            quiet(et.cmd_available, d), repeat,
+        )),
+        ("update", "inproc", time_runs(
+            lambda: quiet(
+                et.cmd_update, d, target, status=next(statuses),
+            )(), repeat,
+        )),
+        ("batch", "inproc", time_runs(
+            lambda: quiet(
+                et.cmd_batch, d,
+                io.StringIO(batch_payload(count, next(batch_statuses))),
+            )(), repeat,
+        )),
+        ("claim", "inproc", time_runs(
+            claim_inproc, repeat, setup=release,
+        )),
+        ("schedule", "inproc", time_runs(
+            quiet(et.cmd_schedule, d), repeat,
+        )),
+    ]
+    release()
+    for case, run in (
+        ("next-id", run_script(d, "next-id")),
+        ("reserve-id", run_script(d, "reserve-id")),
+        ("list", run_script(d, "list")),
+        ("available", run_script(d, "available")),
+        ("update", run_script(
+            d, "update", str(target), "--status", "pending",
+        )),
+        ("batch", run_script(
+            d, "batch", stdin=batch_payload(count, "pending"),
+        )),
+        ("claim", claim_subproc),
+        ("schedule", run_script(d, "schedule")),
+    ):
+        setup = release if case == "claim" else None
+        results.append((case, "subprocess", time_runs(
+            run, repeat, setup=setup,
+        )))
+    release()
+    return results
+
+
+def parse_list(value: str, kind):
+    """Parse a comma-separated command line list."""
+    return [kind(v) for v in value.split(",") if v.strip()]
+
+
+def result_key(r: dict) -> tuple:
+    """Identify a result across reports."""
+    return (
+        r["case"], r["mode"], r["tasks"], r["body_kb"],
+        r["tag_cardinality"], r["density"],
+    )
+
+
+def compare_reports(
+    report: dict, baseline: dict, threshold: float, min_ms: float
+) -> list[str]:
+    """Return descriptions of cases that regressed.
+
+    A case regresses if its median exceeds the baseline
+    median by more than `threshold` (a fraction) and by
+    more than `min_ms`, which absorbs timer noise on very
+    fast cases.
+    """
+    base = {result_key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in report["results"]:
+        b = base.get(result_key(r))
+        if b is None:
+            continue
+        old, new = b["median_ms"], r["median_ms"]
+        if new - old > min_ms and new > old * (1 + threshold):
+            regressions.append(
+                f"{r['case']} ({r['mode']}, {r['tasks']} tasks, "
+                f"{r['body_kb']} KiB, {r['tag_cardinality']} tags, "
+                f"density {r['density']}): "
+                f"{old:.2f}ms -> {new:.2f}ms"
+            )
+    return regressions
+
+
+def bench_suite(args) -> None:
+    """Run the benchmark grid and write a JSON report."""
+    et = load_enact_tasks()
+
+    results = []
+    grid = itertools.product(
+        parse_list(args.tasks, int),
+        parse_list(args.body_kb, int),
+        parse_list(args.tag_cardinality, int),
+        parse_list(args.density, float),
+    )
+    for count, body_kb, tag_card, density in grid:
+        tasks_dir = make_synthetic_dir(
+            count, body_kb * 1024, tag_card, density,
+        )
+        try:
+            cases = suite_cases(et, tasks_dir, args.repeat)
+            for case, mode, stats in cases:
+                row = {
+                    "case": case,
+                    "mode": mode,
+                    "tasks": count,
+                    "body_kb": body_kb,
+                    "tag_cardinality": tag_card,
+                    "density": density,
+                    **stats,
+                }
+                results.append(row)
+                print(
+                    f"{case:<18} {mode:<10} {count:>7} tasks "
+                    f"{body_kb:>4} KiB {tag_card:>3} tags "
+                    f"d={density:<4} {stats['median_ms']:>10.2f}ms",
+                    file=sys.stderr,
+                )
+        finally:
+            shutil.rmtree(tasks_dir)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(text)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text("utf-8"))
+        regressions = compare_reports(
+            report, baseline, args.threshold, args.min_ms,
+        )
+        base_keys = {result_key(r) for r in baseline.get("results", [])}
+        unmatched = sum(
+            1 for r in report["results"]
+            if result_key(r) not in base_keys
+        )
+        if unmatched:
+            print(
+                f"{unmatched} cases have no baseline entry and were"
+                " not compared.",
+                file=sys.stderr,
+            )
+        if regressions:
+            print("Regressions:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print("No regressions against baseline.", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark enact-tasks.py operations."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    headers = sub.add_parser(
+        "headers",
+        help="Compare whole-file and header-only reads",
+    )
+    headers.add_argument("--tasks", type=int, default=1000)
+    headers.add_argument(
+        "--body-kb",
+        type=int,
+        default=256,
+        help="Approximate body size of each task file",
+    )
+
+    stress = sub.add_parser(
+        "claim-stress",
+        help="Verify concurrent claimers get distinct tasks",
+    )
+    stress.add_argument("--workers", type=int, default=16)
+    stress.add_argument("--tasks", type=int, default=24)
+    stress.add_argument("--rounds", type=int, default=5)
+
+    sub.add_parser(
+        "batch-check",
+        help="Verify batch reports each record's outcome and id",
+    )
+
+    suite = sub.add_parser(
+        "suite",
+        help="Time load_tasks and every subcommand over a grid",
+    )
+    suite.add_argument(
+        "--tasks", default="100,1000",
+        help="Comma-separated task counts",
+    )
+    suite.add_argument(
+        "--body-kb", default="1,64",
+        help="Comma-separated body sizes in KiB",
+    )
+    suite.add_argument(
+        "--tag-cardinality", default="8",
+        help="Comma-separated numbers of distinct tags",
+    )
+    suite.add_argument(
+        "--density", default="1.5",
+        help="Comma-separated mean blocked_by counts",
+    )
+    suite.add_argument("--repeat", type=int, default=5)
+    suite.add_argument(
+        "--output", help="Write the JSON report here",
+    )
+    suite.add_argument(
+        "--baseline", help="Compare against this JSON report",
+    )
+    suite.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Allowed slowdown as a fraction (default 0.25)",
+    )
+    suite.add_argument(
+        "--min-ms", type=float, default=1.0,
+        help="Ignore slowdowns smaller than this",
+    )
+
+    args = parser.parse_args()
+    if args.command == "suite":
+        bench_suite(args)
+    elif args.command == "headers":
+        bench_headers(args)
+    elif args.command == "claim-stress":
+        bench_claim_stress(args)
+    elif args.command == "batch-check":
+        bench_batch_check(args)
+    else:
+        parser.print_usage(sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,734 @@
+#!/usr/bin/env python3
+"""Benchmark enact-transcripts.py against a synthetic projects tree.
+
+Generates a throwaway HOME containing ~/.claude/projects/ with many
+sessions, one enact orchestrator with subagents, and a handful of
+team-member sessions, then exercises enact-transcripts.py against it:
+
+- jobs: times a full lookup with --jobs N for each worker count, both
+  scanning directly (--no-catalog) and building the catalog from
+  cold. Checks that every worker count prints identical output.
+- labels: writes one large orchestrator transcript with Task calls
+  spread through it and times build_agent_label_map, checking that
+  every spawned agent got its label.
+- parse: writes one large transcript dominated by progress records
+  and times reading it through summarize-session.py's iter_transcript:
+  decoding every line with the json module (as before type
+  prefiltering), then skipping unsummarized record types with each
+  JSON backend.
+- summarize: times summarize-session.py run once per agent, the way
+  the meta pipeline did, against one --enact run per --jobs worker
+  count, checking that both produce the same summaries. Every run
+  passes --no-cache, so repeat runs parse transcripts instead of
+  reading the summary cache.
+- resume: writes one large transcript and times summarize-session.py
+  with --no-cache, then from the summary cache with the file
+  unchanged and after appending to it, checking that every run
+  prints the same summary as --no-cache.
+- resolve: times summarize-session.py resolving an agent ID, a team
+  reference, an abbreviated agent ID and an unknown identifier, by
+  scanning (--no-catalog) and through the warm catalog index.
+
+Usage:
+    bench-transcripts.py jobs [--projects P] [--sessions S]
+        [--filler F] [--jobs 1,2,4,8,16] [--repeat R] [--keep DIR]
+    bench-transcripts.py labels [--size-mb M] [--agents A] [--repeat R]
+    bench-transcripts.py parse [--size-mb M] [--repeat R]
+    bench-transcripts.py summarize [--agents A] [--filler F]
+        [--jobs 1,4] [--repeat R]
+    bench-transcripts.py resume [--size-mb M] [--append-kb K] [--repeat R]
+    bench-transcripts.py resolve [--projects P] [--sessions S]
+        [--filler F] [--repeat R]
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from transcript_io import transcript_stem
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+ENACT_ID = "1771028742"
+OTHER_ENACT_ID = "1771000000"
+
+
+def load_script(name: str):
+    """Import a script from scripts/, whose file name is not a
+    valid module name."""
+    spec = importlib.util.spec_from_file_location(
+        name.replace("-", "_"), SCRIPTS_DIR / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timestamp(i: int) -> str:
+    return f"2026-02-14T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000Z"
+
+
+def write_jsonl(path: Path, records: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+def filler_records(session_id: str, n: int, start: int) -> list[dict]:
+    """Return n rounds of the progress/assistant/user records that
+    make up the bulk of a real transcript."""
+    out = []
+    for i in range(n):
+        ts = timestamp(start + i)
+        out.append({
+            "type": "progress", "sessionId": session_id,
+            "data": "x" * 200,
+        })
+        out.append({
+            "type": "assistant", "sessionId": session_id,
+            "timestamp": ts,
+            "message": {
+                "id": f"m{start + i}", "model": "synthetic",
+                "content": [{"type": "text", "text": "hello " * 20}],
+            },
+        })
+        out.append({
+            "type": "user", "sessionId": session_id, "timestamp": ts,
+            "message": {"content": "prompt text"},
+        })
+    return out
+
+
+def task_records(session_id: str, k: int, start: int) -> list[dict]:
+    """Return the Task tool_use and tool_result records that spawn
+    subagent k."""
+    agent_id = f"a{k:06x}"
+    return [
+        {
+            "type": "assistant", "sessionId": session_id,
+            "timestamp": timestamp(start),
+            "message": {
+                "id": f"mo{k}", "model": "synthetic",
+                "content": [{
+                    "type": "tool_use", "id": f"tu{k}", "name": "Task",
+                    "input": {
+                        "description": f"Feature Coder: task {k}",
+                        "prompt": f"Work in ~/.enact/{ENACT_ID}/task_{k}",
+                    },
+                }],
+            },
+        },
+        {
+            "type": "user", "sessionId": session_id,
+            "timestamp": timestamp(start + 1),
+            "toolUseResult": {"agentId": agent_id, "status": "completed"},
+            "message": {"content": [{
+                "type": "tool_result", "tool_use_id": f"tu{k}",
+                "content": [{
+                    "type": "text",
+                    "text": f"done\nagentId: {agent_id} (for resuming)",
+                }],
+            }]},
+        },
+    ]
+
+
+def make_home(
+    home: Path, projects: int, sessions: int, filler: int, agents: int = 8
+) -> None:
+    """Populate a synthetic HOME for enact-transcripts.py, with
+    `agents` subagents under the orchestrator."""
+    (home / ".enact" / ENACT_ID).mkdir(parents=True, exist_ok=True)
+    (home / ".enact" / OTHER_ENACT_ID).mkdir(parents=True, exist_ok=True)
+    projects_dir = home / ".claude" / "projects"
+
+    for p in range(projects):
+        project_dir = projects_dir / f"-proj-{p}"
+        for s in range(sessions):
+            sid = f"{p:04d}{s:04d}-aaaa-bbbb-cccc-000000000000"
+            write_jsonl(
+                project_dir / f"{sid}.jsonl",
+                [{"type": "system", "sessionId": sid}]
+                + filler_records(sid, filler, s),
+            )
+
+    project_dir = projects_dir / "-proj-0"
+    sid = "orch0000-aaaa-bbbb-cccc-000000000000"
+    records = [{
+        "type": "user", "sessionId": sid, "timestamp": timestamp(1),
+        "cwd": "/work", "version": "2.0",
+        "message": {"content": "/enact build it"},
+    }]
+    for k in range(agents):
+        agent_id = f"a{k:06x}"
+        records += task_records(sid, k, 2 + 2 * k)
+        write_jsonl(
+            project_dir / sid / "subagents" / f"agent-{agent_id}.jsonl",
+            [{
+                "type": "user", "sessionId": sid, "agentId": agent_id,
+                "timestamp": timestamp(100 - k),
+                "message": {"content": f"task {k} in ~/.enact/{ENACT_ID}/"},
+            }] + filler_records(sid, filler, 100 - k),
+        )
+    records += filler_records(sid, filler, 200)
+    write_jsonl(project_dir / f"{sid}.jsonl", records)
+
+    teams = [
+        (f"{ENACT_ID}-review-foundation", "reviewer-1"),
+        (f"{ENACT_ID}-review-foundation", "reviewer-2"),
+        (f"{ENACT_ID}-qa", "tester-1"),
+        (f"{OTHER_ENACT_ID}-qa", "tester-9"),
+    ]
+    for t, (team, agent) in enumerate(teams):
+        tsid = f"team{t:04d}-aaaa-bbbb-cccc-000000000000"
+        write_jsonl(
+            projects_dir / f"-proj-{t % max(projects, 1)}" / f"{tsid}.jsonl",
+            [
+                {"type": "system", "sessionId": tsid},
+                {
+                    "type": "user", "sessionId": tsid,
+                    "timestamp": timestamp(50 - t),
+                    "teamName": team, "agentName": agent,
+                    "message": {"content": "team work"},
+                },
+            ] + filler_records(tsid, filler, 50 - t),
+        )
+
+
+def tree_size(root: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def run_lookup(home: Path, *args: str) -> tuple[float, str]:
+    """Run enact-transcripts.py with HOME pointed at the synthetic
+    tree, returning (seconds, stdout)."""
+    cmd = [
+        sys.executable, str(SCRIPTS_DIR / "enact-transcripts.py"),
+        *args, ENACT_ID,
+    ]
+    env = dict(os.environ, HOME=str(home))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd, env=env, capture_output=True, text=True, check=False,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr, end="")
+        print(
+            f"Error: {' '.join(args)} exited {proc.returncode}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return elapsed, proc.stdout
+
+
+def bench_jobs(args) -> None:
+    worker_counts = [int(v) for v in args.jobs.split(",") if v]
+    tmp = Path(args.keep) if args.keep else Path(
+        tempfile.mkdtemp(prefix="bench-transcripts-")
+    )
+    home = tmp / "home"
+    catalog = home / ".enact" / "transcript-catalog.sqlite"
+    try:
+        if not (home / ".claude" / "projects").is_dir():
+            make_home(home, args.projects, args.sessions, args.filler)
+        size = tree_size(home / ".claude" / "projects")
+        print(
+            f"{args.projects} projects x {args.sessions} sessions,"
+            f" {size / (1 << 20):.1f} MiB of transcripts,"
+            f" best of {args.repeat}"
+        )
+        print(f"{'jobs':>5}  {'scan s':>8}  {'speedup':>7}"
+              f"  {'catalog s':>9}  {'speedup':>7}")
+
+        reference = None
+        base_scan = base_cat = None
+        for n in worker_counts:
+            scan_times, cat_times = [], []
+            for _ in range(args.repeat):
+                t, out = run_lookup(home, "--no-catalog", "--jobs", str(n))
+                scan_times.append(t)
+                catalog.unlink(missing_ok=True)
+                t, cat_out = run_lookup(home, "--jobs", str(n))
+                cat_times.append(t)
+                for o in (out, cat_out):
+                    if reference is None:
+                        reference = o
+                    elif o != reference:
+                        print(
+                            f"Error: output with --jobs {n} differs",
+                            file=sys.stderr,
+                        )
+                        sys.exit(1)
+            scan, cat = min(scan_times), min(cat_times)
+            base_scan = base_scan or scan
+            base_cat = base_cat or cat
+            print(
+                f"{n:>5}  {scan:>8.3f}  {base_scan / scan:>6.2f}x"
+                f"  {cat:>9.3f}  {base_cat / cat:>6.2f}x"
+            )
+        print("Output identical across worker counts.")
+    finally:
+        if not args.keep:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bench_labels(args) -> None:
+    module = load_script("enact-transcripts")
+    tmp = Path(tempfile.mkdtemp(prefix="bench-transcripts-"))
+    try:
+        path = tmp / "orchestrator.jsonl"
+        sid = "orch0000-aaaa-bbbb-cccc-000000000000"
+        target = args.size_mb << 20
+        every = max(1, target // max(args.agents, 1) // 2200)
+        spawned = 0
+        i = 0
+        with open(path, "w") as f:
+            while f.tell() < target:
+                records = filler_records(sid, 1, i)
+                if i % every == 0 and spawned < args.agents:
+                    records += task_records(sid, spawned, i)
+                    spawned += 1
+                for r in records:
+                    f.write(json.dumps(r) + "\n")
+                i += 1
+        size = path.stat().st_size
+
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            labels = module.build_agent_label_map(path)
+            times.append(time.perf_counter() - start)
+        if len(labels) != spawned:
+            print(
+                f"Error: expected {spawned} labels, got {len(labels)}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        best = min(times)
+        print(
+            f"{size / (1 << 20):.0f} MiB, {spawned} agents:"
+            f" {best:.3f}s ({size / (1 << 20) / best:.0f} MiB/s),"
+            f" best of {args.repeat}"
+        )
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def session_records(session_id: str, i: int) -> list[dict]:
+    """Return one round of a real session's records: a user prompt,
+    a streamed assistant message split over two chunks, its tool
+    result, and the progress and snapshot records around them."""
+    common = {
+        "parentUuid": f"p{i}", "isSidechain": False, "cwd": "/work",
+        "sessionId": session_id, "version": "2.1.0",
+        "gitBranch": "main",
+    }
+    ts = timestamp(i)
+    out = [{
+        **common, "type": "user", "timestamp": ts, "uuid": f"u{i}",
+        "message": {"role": "user", "content": "prompt text " * 10},
+    }]
+    for c, block in enumerate([
+        {"type": "text", "text": "Let me look. " * 20},
+        {"type": "tool_use", "id": f"tu{i}", "name": "Bash",
+         "input": {"command": "ls -la src/"}},
+    ]):
+        out.append({
+            **common, "type": "assistant", "timestamp": ts,
+            "uuid": f"a{i}.{c}",
+            "message": {
+                "id": f"m{i}", "model": "synthetic", "role": "assistant",
+                "content": [block],
+                "usage": {"input_tokens": 10, "output_tokens": 200},
+            },
+        })
+    for p in range(12):
+        out.append({
+            **common, "type": "progress", "timestamp": ts,
+            "uuid": f"g{i}.{p}", "toolUseID": f"tu{i}",
+            "data": {
+                "type": "bash_progress", "output": "line of output\n" * 20,
+                "elapsedTimeSeconds": p,
+            },
+        })
+    out.append({
+        **common, "type": "user", "timestamp": ts, "uuid": f"r{i}",
+        "message": {"role": "user", "content": [{
+            "type": "tool_result", "tool_use_id": f"tu{i}",
+            "content": "file.py\n" * 30,
+        }]},
+    })
+    out.append({
+        "type": "file-history-snapshot", "messageId": f"u{i}",
+        "snapshot": {"trackedFileBackups": {}, "timestamp": ts},
+    })
+    out.append({
+        **common, "type": "system", "subtype": "turn_duration",
+        "timestamp": ts, "durationMs": 1200,
+    })
+    return out
+
+
+def bench_parse(args) -> None:
+    module = load_script("summarize-session")
+    transcript_io = sys.modules["transcript_io"]
+    orjson = transcript_io.orjson
+    tmp = Path(tempfile.mkdtemp(prefix="bench-transcripts-"))
+    try:
+        path = tmp / "session.jsonl"
+        sid = "sess0000-aaaa-bbbb-cccc-000000000000"
+        target = args.size_mb << 20
+        counts: dict[str, int] = {}
+        i = 0
+        with open(path, "w") as f:
+            while f.tell() < target:
+                for r in session_records(sid, i):
+                    counts[r["type"]] = counts.get(r["type"], 0) + 1
+                    f.write(json.dumps(r) + "\n")
+                i += 1
+        size = path.stat().st_size
+        mib = size / (1 << 20)
+        total = sum(counts.values())
+        print(
+            f"{mib:.0f} MiB, {total} records ("
+            + ", ".join(
+                f"{n * 100 // total}% {t}"
+                for t, n in sorted(counts.items(), key=lambda kv: -kv[1])
+            )
+            + f"), best of {args.repeat}"
+        )
+
+        def decode_all():
+            with open(path) as f:
+                return [json.loads(line) for line in f if line.strip()]
+
+        def prefiltered():
+            return list(module.iter_transcript(path, module.SUMMARY_TYPES))
+
+        runs = [("decode every line (json)", None, decode_all)]
+        runs.append(("type prefilter (json)", None, prefiltered))
+        if orjson is not None:
+            runs.append(("type prefilter (orjson)", orjson, prefiltered))
+        else:
+            print("orjson is not installed; skipping its run.")
+
+        reference = None
+        for name, backend, fn in runs:
+            transcript_io.orjson = backend
+            times = []
+            for _ in range(args.repeat):
+                entries = None
+                gc.collect()
+                gc.disable()
+                start = time.perf_counter()
+                entries = fn()
+                times.append(time.perf_counter() - start)
+                gc.enable()
+            kept = [
+                e for e in entries
+                if e.get("type") in module.SUMMARY_TYPES
+            ]
+            if reference is None:
+                reference = kept
+            elif kept != reference:
+                print(f"Error: {name} decoded differently", file=sys.stderr)
+                sys.exit(1)
+            best = min(times)
+            print(f"{name:<26} {best:>7.3f}s  {mib / best:>6.0f} MiB/s")
+        transcript_io.orjson = orjson
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bench_summarize(args) -> None:
+    worker_counts = [int(v) for v in args.jobs.split(",") if v]
+    tmp = Path(tempfile.mkdtemp(prefix="bench-transcripts-"))
+    home = tmp / "home"
+    env = dict(os.environ, HOME=str(home))
+    script = str(SCRIPTS_DIR / "summarize-session.py")
+    try:
+        make_home(home, 4, 20, args.filler, args.agents)
+        _, listing = run_lookup(home, "--paths")
+        paths = [Path(p) for p in listing.splitlines()]
+        print(
+            f"{len(paths)} transcripts"
+            f" ({tree_size(home / '.claude' / 'projects') / (1 << 20):.1f}"
+            f" MiB in the projects tree), best of {args.repeat}"
+        )
+
+        def per_agent() -> dict[str, str]:
+            out = {}
+            for path in paths:
+                ident = transcript_stem(path).removeprefix("agent-")
+                proc = subprocess.run(
+                    [sys.executable, script, "--no-cache", ident],
+                    env=env,
+                    capture_output=True, text=True, check=True,
+                )
+                out[f"{transcript_stem(path)}.md"] = proc.stdout
+            return out
+
+        def enact(n: int) -> dict[str, str]:
+            out_dir = tmp / f"out-{n}"
+            shutil.rmtree(out_dir, ignore_errors=True)
+            subprocess.run(
+                [sys.executable, script, "--no-cache",
+                 "--enact", ENACT_ID, "--jobs", str(n),
+                 "--output-dir", str(out_dir)],
+                env=env, capture_output=True, check=True,
+            )
+            return {
+                f.name: f.read_text() for f in out_dir.iterdir()
+                if f.name != "index.md"
+            }
+
+        runs = [("one run per agent", per_agent)]
+        runs += [
+            (f"--enact --jobs {n}", partial(enact, n))
+            for n in worker_counts
+        ]
+        reference = None
+        base = None
+        for name, fn in runs:
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                summaries = fn()
+                times.append(time.perf_counter() - start)
+            if reference is None:
+                reference = summaries
+            elif summaries != reference:
+                print(f"Error: {name} summaries differ", file=sys.stderr)
+                sys.exit(1)
+            best = min(times)
+            base = base or best
+            print(f"{name:<20} {best:>8.3f}s  {base / best:>6.2f}x")
+        print("Summaries identical.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bench_resume(args) -> None:
+    tmp = Path(tempfile.mkdtemp(prefix="bench-transcripts-"))
+    env = dict(os.environ, HOME=str(tmp))
+    script = str(SCRIPTS_DIR / "summarize-session.py")
+    cache = tmp / ".enact" / "summary-cache.sqlite"
+    try:
+        path = tmp / "session.jsonl"
+        sid = "sess0000-aaaa-bbbb-cccc-000000000000"
+        i = 0
+        with open(path, "w") as f:
+            while f.tell() < args.size_mb << 20:
+                for r in session_records(sid, i):
+                    f.write(json.dumps(r) + "\n")
+                i += 1
+
+        def append() -> None:
+            nonlocal i
+            with open(path, "a") as f:
+                start = f.tell()
+                while f.tell() - start < args.append_kb << 10:
+                    for r in session_records(sid, i):
+                        f.write(json.dumps(r) + "\n")
+                    i += 1
+
+        def summarize(*flags: str) -> tuple[float, str]:
+            start = time.perf_counter()
+            proc = subprocess.run(
+                [sys.executable, script, *flags, str(path)], env=env,
+                capture_output=True, text=True, check=True,
+            )
+            return time.perf_counter() - start, proc.stdout
+
+        print(
+            f"{path.stat().st_size / (1 << 20):.0f} MiB transcript,"
+            f" {args.append_kb} KiB appended, best of {args.repeat}"
+        )
+        runs = {"--no-cache": [], "unchanged": [], "appended": []}
+        for _ in range(args.repeat):
+            cache.unlink(missing_ok=True)
+            t, reference = summarize("--no-cache")
+            runs["--no-cache"].append(t)
+            summarize()
+            t, unchanged = summarize()
+            runs["unchanged"].append(t)
+            append()
+            t, appended = summarize()
+            runs["appended"].append(t)
+            _, reference_appended = summarize("--no-cache")
+            if unchanged != reference or appended != reference_appended:
+                print("Error: cached summary differs", file=sys.stderr)
+                sys.exit(1)
+        base = min(runs["--no-cache"])
+        for name, times in runs.items():
+            best = min(times)
+            print(f"{name:<12} {best:>8.3f}s  {base / best:>6.1f}x")
+        print("Cached summaries identical to --no-cache.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bench_resolve(args) -> None:
+    tmp = Path(tempfile.mkdtemp(prefix="bench-transcripts-"))
+    home = tmp / "home"
+    env = dict(os.environ, HOME=str(home))
+    script = str(SCRIPTS_DIR / "summarize-session.py")
+    try:
+        make_home(home, args.projects, args.sessions, args.filler)
+        size = tree_size(home / ".claude" / "projects")
+        print(
+            f"{args.projects} projects x {args.sessions} sessions,"
+            f" {size / (1 << 20):.1f} MiB of transcripts,"
+            f" best of {args.repeat}"
+        )
+
+        def resolve(identifier: str, *flags: str) -> tuple[float, str]:
+            start = time.perf_counter()
+            proc = subprocess.run(
+                [sys.executable, script, "--no-cache", *flags, identifier],
+                env=env, capture_output=True, text=True, check=False,
+            )
+            elapsed = time.perf_counter() - start
+            return elapsed, proc.stderr.splitlines()[0]
+
+        # Build the catalog before timing warm lookups.
+        resolve("nonexistent")
+        print(f"{'identifier':<28} {'scan s':>8} {'index s':>8}")
+        for identifier in [
+            "a000007", "review-foundation/reviewer-2", "a00000",
+            "a000007ff",
+        ]:
+            scan = [
+                resolve(identifier, "--no-catalog")
+                for _ in range(args.repeat)
+            ]
+            index = [resolve(identifier) for _ in range(args.repeat)]
+            found = index[0][1]
+            if scan[0][1] != found and not identifier == "a00000":
+                print(
+                    f"Error: {identifier} resolved differently",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            print(
+                f"{identifier:<28} {min(t for t, _ in scan):>8.3f}"
+                f" {min(t for t, _ in index):>8.3f}  {found}"
+            )
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark enact-transcripts.py operations."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    jobs = sub.add_parser(
+        "jobs",
+        help="Time lookups across --jobs worker counts",
+    )
+    jobs.add_argument("--projects", type=int, default=20)
+    jobs.add_argument(
+        "--sessions", type=int, default=50,
+        help="Sessions per project",
+    )
+    jobs.add_argument(
+        "--filler", type=int, default=100,
+        help="Filler rounds per transcript (~0.7 KiB each)",
+    )
+    jobs.add_argument(
+        "--jobs", default="1,2,4,8,16",
+        help="Comma-separated worker counts",
+    )
+    jobs.add_argument("--repeat", type=int, default=3)
+    jobs.add_argument(
+        "--keep",
+        help="Generate the tree here and keep it between runs",
+    )
+
+    labels = sub.add_parser(
+        "labels",
+        help="Time build_agent_label_map on a large orchestrator",
+    )
+    labels.add_argument("--size-mb", type=int, default=500)
+    labels.add_argument("--agents", type=int, default=200)
+    labels.add_argument("--repeat", type=int, default=3)
+
+    parse = sub.add_parser(
+        "parse",
+        help="Time transcript decoding with and without type prefiltering",
+    )
+    parse.add_argument("--size-mb", type=int, default=200)
+    parse.add_argument("--repeat", type=int, default=3)
+
+    summarize = sub.add_parser(
+        "summarize",
+        help="Time per-agent summarize-session.py runs against --enact",
+    )
+    summarize.add_argument("--agents", type=int, default=40)
+    summarize.add_argument(
+        "--filler", type=int, default=300,
+        help="Filler rounds per transcript (~0.7 KiB each)",
+    )
+    summarize.add_argument(
+        "--jobs", default="1,4",
+        help="Comma-separated --enact worker counts",
+    )
+    summarize.add_argument("--repeat", type=int, default=3)
+
+    resume = sub.add_parser(
+        "resume",
+        help="Time summarize-session.py resuming from the summary cache",
+    )
+    resume.add_argument("--size-mb", type=int, default=100)
+    resume.add_argument("--append-kb", type=int, default=256)
+    resume.add_argument("--repeat", type=int, default=3)
+
+    resolve = sub.add_parser(
+        "resolve",
+        help="Time summarize-session.py identifier resolution",
+    )
+    resolve.add_argument("--projects", type=int, default=20)
+    resolve.add_argument("--sessions", type=int, default=100)
+    resolve.add_argument(
+        "--filler", type=int, default=20,
+        help="Filler rounds per transcript (~0.7 KiB each)",
+    )
+    resolve.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args()
+    if args.command == "jobs":
+        bench_jobs(args)
+    elif args.command == "labels":
+        bench_labels(args)
+    elif args.command == "parse":
+        bench_parse(args)
+    elif args.command == "summarize":
+        bench_summarize(args)
+    elif args.command == "resume":
+        bench_resume(args)
+    elif args.command == "resolve":
+        bench_resolve(args)
+    else:
+        parser.print_usage(sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
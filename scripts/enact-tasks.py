@@ -3,15 +3,78 @@
 
 Usage:
     enact-tasks.py <tasks_dir> next-id
-    enact-tasks.py <tasks_dir> list [--status S] [--tags T]
+    enact-tasks.py <tasks_dir> reserve-id
+    enact-tasks.py <tasks_dir> list [--status S] [--owner O]
+        [--tags T] [--blocked-by ID] [--blocks ID]
+        [--format table|json|ndjson|tsv]
     enact-tasks.py <tasks_dir> available
+        [--format table|json|ndjson|tsv]
     enact-tasks.py <tasks_dir> update <id> [--status S]
         [--owner O]
+    enact-tasks.py <tasks_dir> claim --owner O
+    enact-tasks.py <tasks_dir> batch < updates.ndjson
+    enact-tasks.py <tasks_dir> watch [--interval SECONDS]
+    enact-tasks.py <tasks_dir> schedule [--concurrency N]
+    enact-tasks.py <tasks_dir> shard
+
+Parsed task headers are cached in <tasks_dir>/.task-index.json
+(plus an append-only .task-index.log), keyed by file path, mtime,
+size and inode; .task-postings.json holds the posting lists that
+list filters use. These are rebuilt automatically and are safe to
+delete.
+
+<tasks_dir>/.next-id holds the next free ID. reserve-id advances it,
+and so does writing or first indexing a task file with a higher ID;
+task file names are only scanned when it is missing. Delete .next-id
+along with the task files when resetting a directory; deleting it on
+its own may reissue IDs reserved but not yet written.
+
+Task files may live at the top level or in shard directories
+named by ID // 1000 (e.g. 012/task_12345.md).
 """
 
+import contextlib
+import fcntl
+import json
 import os
 import re
 import sys
+import time
+
+TASK_FILE_RE = re.compile(r"^task_(\d+)\.md$")
+
+# Sidecar cache of parsed task headers, keyed by file
+# name and validated against each file's mtime, size and
+# inode.
+INDEX_FILE = ".task-index.json"
+INDEX_VERSION = 4
+
+# Posting lists (field -> value -> task file paths) for
+# list filters, written alongside INDEX_FILE.
+POSTINGS_FILE = ".task-postings.json"
+
+# Task headers are read in small chunks and never past
+# this many bytes, however long the task body grows.
+HEADER_CHUNK = 4096
+HEADER_READ_LIMIT = 64 * 1024
+
+# Index updates are appended here and folded back into
+# INDEX_FILE, under the tasks lock, once the journal
+# reaches this many lines.
+JOURNAL_FILE = ".task-index.log"
+JOURNAL_COMPACT_LINES = 512
+
+# Writers serialize on an exclusive flock of this file.
+LOCK_FILE = ".tasks.lock"
+
+# Holds the next free task ID. Kept above every reserved
+# ID and every task file (see advance_counter).
+COUNTER_FILE = ".next-id"
+
+# Large task sets may be split into numbered shard
+# subdirectories, e.g. 012/task_12345.md.
+SHARD_SIZE = 1000
+SHARD_DIR_RE = re.compile(r"^\d+$")
 
 
 def parse_frontmatter(text):
@@ -33,8 +96,15 @@ def parse_frontmatter(text):
     if end is None:
         return {}, text
 
+    fm = parse_frontmatter_lines(lines[1:end])
+    body = "\n".join(lines[end + 1:])
+    return fm, body
+
+
+def parse_frontmatter_lines(lines):
+    """Parse the lines between the frontmatter fences."""
     fm = {}
-    for line in lines[1:end]:
+    for line in lines:
         line = line.strip()
         if not line or ":" not in line:
             continue
@@ -42,9 +112,7 @@ def parse_frontmatter(text):
         key = key.strip()
         val = val.strip()
         fm[key] = parse_value(val)
-
-    body = "\n".join(lines[end + 1:])
-    return fm, body
+    return fm
 
 
 def parse_value(val):
@@ -84,42 +152,491 @@ def strip_quotes(s):
 
 def extract_subject(body):
     """Extract the first H1 heading from the markdown body."""
-    for line in body.split("\n"):
-        line = line.strip()
-        if line.startswith("# "):
-            return line[2:].strip()
+    return extract_subject_lines(body.split("\n"))
+
+
+def iter_header_lines(f, limit=HEADER_READ_LIMIT):
+    """Yield decoded lines from a binary file, reading it
+    in HEADER_CHUNK pieces and stopping at `limit` bytes.
+
+    A trailing partial line is only yielded at end of
+    file, never when the limit cuts it off.
+    """
+    pending = b""
+    consumed = 0
+    while consumed < limit:
+        chunk = f.read(min(HEADER_CHUNK, limit - consumed))
+        if not chunk:
+            if pending:
+                yield pending.decode("utf-8")
+            return
+        consumed += len(chunk)
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8")
+
+
+def scan_header(lines):
+    """Scan task file lines for frontmatter and subject.
+
+    Consumes `lines` only up to the closing `---` and the
+    first H1 heading, matching what parse_frontmatter and
+    extract_subject would return for the whole file.
+    Returns (frontmatter, subject).
+    """
+    first = next(lines, None)
+    if first is None:
+        return {}, ""
+
+    if first.strip() != "---":
+        return {}, extract_subject_lines([first], lines)
+
+    fm_lines = []
+    for line in lines:
+        if line.strip() == "---":
+            fm = parse_frontmatter_lines(fm_lines)
+            return fm, extract_subject_lines(lines)
+        fm_lines.append(line)
+
+    # Unterminated frontmatter is treated as body text.
+    return {}, extract_subject_lines([first], fm_lines)
+
+
+def extract_subject_lines(*sources):
+    """Return the first H1 heading found in line sources."""
+    for source in sources:
+        for line in source:
+            line = line.strip()
+            if line.startswith("# "):
+                return line[2:].strip()
     return ""
 
 
-def load_tasks(tasks_dir):
-    """Load all task files from the directory."""
-    tasks = []
-    if not os.path.isdir(tasks_dir):
-        return tasks
+def read_task_header(path):
+    """Read only the frontmatter and subject of a task file.
+
+    Returns (frontmatter, subject).
+    """
+    with open(path, "rb", buffering=0) as f:
+        return scan_header(iter_header_lines(f))
+
+
+def make_task(fm, subject):
+    """Build a task record from parsed frontmatter.
+
+    Every frontmatter field is kept; the core fields get
+    defaults and `subject` comes from the H1 heading.
+    """
+    return {
+        **fm,
+        "id": fm.get("id", 0),
+        "status": fm.get("status", ""),
+        "owner": fm.get("owner", ""),
+        "tags": fm.get("tags", ""),
+        "blocked_by": fm.get("blocked_by", []),
+        "subject": subject,
+    }
+
 
-    for fname in os.listdir(tasks_dir):
-        match = re.match(r"^task_(\d+)\.md$", fname)
-        if not match:
+def task_from_text(text):
+    """Build a task record from a task file's text."""
+    fm, body = parse_frontmatter(text)
+    return make_task(fm, extract_subject(body))
+
+
+def task_postings(task):
+    """Yield the (field, value) pairs a task is indexed
+    under for list filters.
+
+    Values are strings, as they arrive from the command
+    line.
+    """
+    yield "id", str(task.get("id", 0))
+    yield "status", str(task.get("status", ""))
+    yield "owner", str(task.get("owner") or "")
+    for tag in set(tag_values(task.get("tags", ""))):
+        yield "tags", tag
+    for b in set(blockers_of(task)):
+        yield "blocked_by", str(b)
+
+
+def post_entry(postings, rel, entry, add=True):
+    """Add a task file's index entry to (or remove it
+    from) the posting lists of its field values."""
+    if (not isinstance(entry, dict)
+            or not isinstance(entry.get("task"), dict)):
+        return
+    for field, value in task_postings(entry["task"]):
+        values = postings.setdefault(field, {})
+        if add:
+            values.setdefault(value, []).append(rel)
             continue
-        path = os.path.join(tasks_dir, fname)
+        rels = values.get(value)
+        if rels and rel in rels:
+            rels.remove(rel)
+            if not rels:
+                del values[value]
+
+
+def build_postings(entries):
+    """Build posting lists (field -> value -> relative
+    paths of task files) over index entries."""
+    postings = {}
+    for rel, entry in entries.items():
+        post_entry(postings, rel, entry)
+    return postings
+
+
+def read_json_file(path):
+    """Return a file's decoded JSON, or None if it is
+    missing or corrupt."""
+    try:
         with open(path, "r", encoding="utf-8") as f:
-            text = f.read()
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_index(tasks_dir, with_postings=False):
+    """Read the sidecar task index and its journal.
+
+    Returns (entries, postings, journal_lines). Entries
+    are empty if the index is missing, corrupt, or was
+    written by a different version; corrupt journal lines
+    are skipped. Posting lists are only read with
+    with_postings=True (otherwise postings is None); they
+    come from POSTINGS_FILE if it was written with this
+    index, and journaled entries are applied to them one
+    by one.
+    """
+    entries = {}
+    generation = None
+    data = read_json_file(os.path.join(tasks_dir, INDEX_FILE))
+    if (isinstance(data, dict)
+            and data.get("version") == INDEX_VERSION
+            and isinstance(data.get("entries"), dict)):
+        entries = data["entries"]
+        generation = data.get("generation")
+
+    postings = None
+    if with_postings:
+        data = read_json_file(
+            os.path.join(tasks_dir, POSTINGS_FILE),
+        )
+        if (isinstance(data, dict)
+                and generation is not None
+                and data.get("generation") == generation
+                and isinstance(data.get("postings"), dict)):
+            postings = data["postings"]
+        else:
+            postings = build_postings(entries)
+
+    journal_lines = 0
+    path = os.path.join(tasks_dir, JOURNAL_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                journal_lines += 1
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if (isinstance(rec, dict)
+                        and rec.get("version") == INDEX_VERSION
+                        and isinstance(rec.get("file"), str)):
+                    rel = rec["file"]
+                    if postings is not None:
+                        post_entry(
+                            postings, rel, entries.get(rel),
+                            add=False,
+                        )
+                    entries[rel] = rec.get("entry")
+                    if postings is not None:
+                        post_entry(postings, rel, entries[rel])
+    except OSError:
+        pass
+    return entries, postings, journal_lines
+
+
+def write_json_file(path, data):
+    """Atomically replace a file with JSON data. Raises
+    OSError."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_index(tasks_dir, entries, postings=None):
+    """Atomically replace the sidecar task index and its
+    posting lists, and discard the journal they now
+    include.
+
+    `postings` must match `entries`; they are rebuilt if
+    not given. Both files carry the same generation, so a
+    reader never pairs posting lists with another index.
+    The index is only a cache, so failures to write it
+    are ignored.
+    """
+    if postings is None:
+        postings = build_postings(entries)
+    generation = f"{time.time_ns()}-{os.getpid()}"
+    try:
+        write_json_file(os.path.join(tasks_dir, POSTINGS_FILE), {
+            "generation": generation,
+            "postings": postings,
+        })
+        write_json_file(os.path.join(tasks_dir, INDEX_FILE), {
+            "version": INDEX_VERSION,
+            "generation": generation,
+            "entries": entries,
+        })
+        os.unlink(os.path.join(tasks_dir, JOURNAL_FILE))
+    except OSError:
+        pass
+
+
+def append_index_journal(tasks_dir, entries):
+    """Append index entries to the journal.
+
+    This costs O(changed files) instead of rewriting the
+    whole index; load_tasks folds the journal back into
+    the index once it grows past JOURNAL_COMPACT_LINES.
+    """
+    lines = "".join(
+        json.dumps({
+            "version": INDEX_VERSION,
+            "file": rel,
+            "entry": entry,
+        }, separators=(",", ":")) + "\n"
+        for rel, entry in entries.items()
+    )
+    path = os.path.join(tasks_dir, JOURNAL_FILE)
+    try:
+        fd = os.open(
+            path, os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644,
+        )
+        try:
+            os.write(fd, lines.encode("utf-8"))
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def file_sig(st):
+    """Return the (mtime_ns, size, inode) signature of a
+    stat result.
+
+    Task files are replaced by rename, so the inode tells
+    apart two same-size writes within one mtime tick.
+    """
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def index_entry_valid(entry, sig):
+    """Check whether a cached entry matches a file's
+    signature from file_sig."""
+    return (
+        isinstance(entry, dict)
+        and entry.get("mtime_ns") == sig[0]
+        and entry.get("size") == sig[1]
+        and entry.get("ino") == sig[2]
+        and isinstance(entry.get("task"), dict)
+    )
 
-        fm, body = parse_frontmatter(text)
-        task = {
-            "id": fm.get("id", 0),
-            "status": fm.get("status", ""),
-            "owner": fm.get("owner", ""),
-            "tags": fm.get("tags", ""),
-            "blocked_by": fm.get("blocked_by", []),
-            "subject": extract_subject(body),
-        }
-        tasks.append(task)
 
+def make_index_entry(sig, task):
+    """Build an index entry for a task file."""
+    return {
+        "mtime_ns": sig[0],
+        "size": sig[1],
+        "ino": sig[2],
+        "task": task,
+    }
+
+
+def shard_name(task_id):
+    """Name of the shard subdirectory for a task ID."""
+    return f"{task_id // SHARD_SIZE:03d}"
+
+
+def iter_task_entries(tasks_dir):
+    """Yield (relative path, DirEntry) for every task file,
+    both at the top level and in shard subdirectories.
+
+    Uses scandir, so no file is opened or stat'ed.
+    """
+    with os.scandir(tasks_dir) as it:
+        shards = []
+        for entry in it:
+            if TASK_FILE_RE.match(entry.name):
+                yield entry.name, entry
+            elif (SHARD_DIR_RE.match(entry.name)
+                    and entry.is_dir(follow_symlinks=False)):
+                shards.append(entry)
+    for shard in shards:
+        try:
+            with os.scandir(shard.path) as it:
+                for entry in it:
+                    if TASK_FILE_RE.match(entry.name):
+                        rel = f"{shard.name}/{entry.name}"
+                        yield rel, entry
+        except OSError:
+            continue
+
+
+def scan_task_files(tasks_dir):
+    """Map each task file's relative path to its
+    file_sig signature without opening any file."""
+    sigs = {}
+    for rel, entry in iter_task_entries(tasks_dir):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        sigs[rel] = file_sig(st)
+    return sigs
+
+
+def compact_index(tasks_dir, entries, postings=None,
+                  locked=False):
+    """Rewrite the index from `entries` (and their
+    `postings`, if loaded), folding in the journal.
+
+    Writers journal under tasks_lock, so compaction takes
+    it too and first merges any entries journaled since
+    `entries` was read. If another process holds the lock
+    compaction is skipped; a later load will retry. Pass
+    locked=True if the caller already holds it.
+    """
+    lock = (
+        contextlib.nullcontext(True) if locked
+        else tasks_lock(tasks_dir, blocking=False)
+    )
+    with lock as acquired:
+        if not acquired:
+            return
+        current, _, _ = read_index(tasks_dir)
+        for rel, entry in current.items():
+            if entries.get(rel) == entry:
+                continue
+            try:
+                sig = file_sig(
+                    os.stat(os.path.join(tasks_dir, rel))
+                )
+            except OSError:
+                continue
+            if not index_entry_valid(entry, sig):
+                continue
+            if postings is not None:
+                post_entry(postings, rel, entries.get(rel),
+                           add=False)
+                post_entry(postings, rel, entry)
+            entries[rel] = entry
+        write_index(tasks_dir, entries, postings)
+
+
+def load_task_index(tasks_dir, locked=False,
+                    with_postings=False):
+    """Bring the sidecar index up to date with the task
+    files.
+
+    Files whose path, mtime, size and inode match the
+    index are served from it without being opened.
+    Re-read files are journaled; the index itself is
+    rewritten (see compact_index) only when files
+    disappear or the journal needs compacting. New files
+    advance the ID counter past their IDs. Pass
+    locked=True if the caller holds tasks_lock.
+
+    Returns (entries, postings): the index entry of every
+    task file by relative path and, with
+    with_postings=True, posting lists over them (see
+    task_postings), patched only for files that changed.
+    Otherwise postings is None.
+    """
+    if not os.path.isdir(tasks_dir):
+        return {}, {} if with_postings else None
+
+    index, postings, journal_lines = read_index(
+        tasks_dir, with_postings,
+    )
+    sigs = scan_task_files(tasks_dir)
+    fresh = {}
+    changed = {}
+
+    for rel, sig in sigs.items():
+        entry = index.get(rel)
+        if not index_entry_valid(entry, sig):
+            path = os.path.join(tasks_dir, rel)
+            try:
+                task = make_task(*read_task_header(path))
+            except OSError:
+                continue
+            new = make_index_entry(sig, task)
+            if postings is not None:
+                post_entry(postings, rel, entry, add=False)
+                post_entry(postings, rel, new)
+            entry = changed[rel] = new
+        fresh[rel] = entry
+
+    added = [
+        entry["task"]["id"] for rel, entry in changed.items()
+        if rel not in index
+    ]
+    top = max(
+        (i for i in added
+         if isinstance(i, int) and not isinstance(i, bool)),
+        default=None,
+    )
+    if top is not None and top >= (read_counter(tasks_dir) or 0):
+        advance_counter(tasks_dir, top, locked)
+    removed = len(index) > len(fresh) - len(added)
+    if removed and postings is not None:
+        for rel in index.keys() - fresh.keys():
+            post_entry(postings, rel, index[rel], add=False)
+    if (removed or journal_lines + len(changed)
+            > JOURNAL_COMPACT_LINES):
+        compact_index(tasks_dir, fresh, postings, locked)
+    elif changed:
+        append_index_journal(tasks_dir, changed)
+
+    return fresh, postings
+
+
+def load_tasks(tasks_dir, locked=False):
+    """Load all task files from the directory, in ID
+    order, through the sidecar index (see
+    load_task_index)."""
+    entries, _ = load_task_index(tasks_dir, locked)
+    tasks = [entry["task"] for entry in entries.values()]
     tasks.sort(key=lambda t: t["id"])
     return tasks
 
 
+def update_index_entry(tasks_dir, path, text):
+    """Write a just-saved task file through to the index
+    journal."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    rel = os.path.relpath(path, tasks_dir)
+    sig = file_sig(st)
+    entry = make_index_entry(sig, task_from_text(text))
+    append_index_journal(tasks_dir, {rel: entry})
+
+
 def format_blocked_by(blocked_by):
     """Format blocked_by list for display."""
     if not blocked_by:
@@ -162,102 +679,628 @@ def print_table(tasks):
         print(fmt_row(row))
 
 
+OUTPUT_FORMATS = ("table", "json", "ndjson", "tsv")
+
+TSV_COLUMNS = [
+    "id", "status", "owner", "tags", "blocked_by", "subject",
+]
+
+
+def format_tsv_cell(val):
+    """Format a value as a single TSV cell."""
+    if isinstance(val, list):
+        val = ",".join(str(x) for x in val)
+    text = str(val)
+    for ch in ("\t", "\r", "\n"):
+        text = text.replace(ch, " ")
+    return text
+
+
+def print_tasks(tasks, fmt, empty_message):
+    """Print tasks in one of OUTPUT_FORMATS.
+
+    Machine formats stream one record at a time and never
+    compute column widths. Only the table view prints
+    `empty_message` when there are no tasks.
+    """
+    out = sys.stdout
+    if fmt == "json":
+        out.write("[")
+        for i, t in enumerate(tasks):
+            out.write(",\n" if i else "\n")
+            out.write(json.dumps(t))
+        out.write("\n]\n" if tasks else "]\n")
+    elif fmt == "ndjson":
+        for t in tasks:
+            out.write(json.dumps(t))
+            out.write("\n")
+    elif fmt == "tsv":
+        out.write("\t".join(TSV_COLUMNS) + "\n")
+        for t in tasks:
+            out.write("\t".join(
+                format_tsv_cell(t.get(c, ""))
+                for c in TSV_COLUMNS
+            ))
+            out.write("\n")
+    elif not tasks:
+        print(empty_message)
+    else:
+        print_table(tasks)
+
+
+def read_counter(tasks_dir):
+    """Return the ID stored in the counter file, or None
+    if it is missing or corrupt."""
+    path = os.path.join(tasks_dir, COUNTER_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            value = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def write_counter(tasks_dir, value):
+    """Atomically record the next free ID in the counter
+    file. Raises OSError."""
+    path = os.path.join(tasks_dir, COUNTER_FILE)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(f"{value}\n")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def next_file_id(tasks_dir):
+    """Return one more than the highest task file ID,
+    from file names alone."""
+    max_id = 0
+    for _, entry in iter_task_entries(tasks_dir):
+        m = TASK_FILE_RE.match(entry.name)
+        max_id = max(max_id, int(m.group(1)))
+    return max_id + 1
+
+
+def peek_next_id(tasks_dir):
+    """Return the ID reserve_next_id would hand out,
+    without reserving it.
+
+    Served from the counter; task file names are only
+    scanned when it is missing or corrupt. IDs whose task
+    file already exists are skipped, in case a file was
+    written without a reservation.
+    """
+    next_id = read_counter(tasks_dir)
+    if next_id is None:
+        return next_file_id(tasks_dir)
+    while resolve_task_path(tasks_dir, next_id) is not None:
+        next_id += 1
+    return next_id
+
+
+def reserve_next_id(tasks_dir):
+    """Hand out the next task ID and advance the counter.
+
+    The caller must hold tasks_lock. The counter only
+    moves forward, so an ID is never handed out twice
+    while it exists.
+    """
+    next_id = peek_next_id(tasks_dir)
+    write_counter(tasks_dir, next_id + 1)
+    return next_id
+
+
+def advance_counter(tasks_dir, task_id, locked=False):
+    """Move the counter past a task file's ID.
+
+    Called whenever a task file is written or first
+    indexed, so the counter stays above every task file
+    even if it was created without reserve-id. A missing
+    counter is seeded from file names.
+
+    Takes tasks_lock unless locked=True, and is skipped
+    if another process holds it: peek_next_id still skips
+    existing files, and a later load will retry. Failures
+    to write the counter are ignored.
+    """
+    lock = (
+        contextlib.nullcontext(True) if locked
+        else tasks_lock(tasks_dir, blocking=False)
+    )
+    with lock as acquired:
+        if not acquired:
+            return
+        counter = read_counter(tasks_dir)
+        if counter is not None and counter > task_id:
+            return
+        if counter is None:
+            counter = next_file_id(tasks_dir)
+        try:
+            write_counter(tasks_dir, max(counter, task_id + 1))
+        except OSError:
+            pass
+
+
 def cmd_next_id(tasks_dir):
-    """Print the next available task ID."""
-    tasks = load_tasks(tasks_dir)
-    if not tasks:
-        print(1)
+    """Print the next free task ID without reserving it.
+
+    Read-only and served from the counter: repeated calls
+    print the same ID until a task file or reservation
+    takes it.
+    """
+    print(peek_next_id(tasks_dir))
+
+
+def cmd_reserve_id(tasks_dir):
+    """Reserve and print the next task ID.
+
+    Each call hands out a new ID, so concurrent callers
+    never receive the same one.
+    """
+    with tasks_lock(tasks_dir):
+        print(reserve_next_id(tasks_dir))
+
+
+def cmd_shard(tasks_dir):
+    """Move top-level task files into shard directories."""
+    moved = 0
+    with tasks_lock(tasks_dir):
+        index, _, _ = read_index(tasks_dir)
+        for rel, entry in list(iter_task_entries(tasks_dir)):
+            if "/" in rel:
+                continue
+            m = TASK_FILE_RE.match(rel)
+            shard = shard_name(int(m.group(1)))
+            os.makedirs(
+                os.path.join(tasks_dir, shard), exist_ok=True,
+            )
+            dest = f"{shard}/{rel}"
+            os.replace(entry.path, os.path.join(tasks_dir, dest))
+            if rel in index:
+                index[dest] = index.pop(rel)
+            moved += 1
+        if moved:
+            write_index(tasks_dir, index)
+    print(f"Moved {moved} task files into shards.")
+
+
+# List flags mapped to the field each filters on. All
+# but --blocks have posting lists in the index.
+QUERY_FLAGS = {
+    "--status": "status",
+    "--owner": "owner",
+    "--tags": "tags",
+    "--blocked-by": "blocked_by",
+    "--blocks": "blocks",
+}
+
+
+def tag_values(tags):
+    """Split a tags value into individual tags.
+
+    Accepts a parsed list or a comma-separated string.
+    """
+    if isinstance(tags, list):
+        items = tags
+    elif tags in ("", None):
+        items = []
     else:
-        max_id = max(t["id"] for t in tasks)
-        print(max_id + 1)
+        items = str(tags).split(",")
+    result = []
+    for item in items:
+        item = str(item).strip()
+        if item:
+            result.append(item)
+    return result
+
+
+def lookup_rels(entries, postings, field, value):
+    """Return the set of task file paths matching one
+    value."""
+    by_id = postings.get("id", {})
+    if field != "blocks":
+        return set(postings.get(field, {}).get(value, ()))
+    # --blocks N: the tasks that task N is blocked by.
+    try:
+        value = str(int(value))
+    except ValueError:
+        pass
+    blockers = set()
+    for rel in by_id.get(value, ()):
+        if rel in entries:
+            blockers.update(blockers_of(entries[rel]["task"]))
+    rels = set()
+    for b in blockers:
+        rels.update(by_id.get(str(b), ()))
+    return rels
+
+
+def query_tasks(entries, postings, filters):
+    """Return tasks matching every filter, in ID order.
+
+    `filters` maps a field to a list of values. A task
+    matches a field if it matches any plain value and
+    none of the values prefixed with `!`. Work is
+    proportional to the posting lists touched and the
+    result size, not the number of tasks, unless a field
+    has only negated values. `entries` and `postings`
+    come from load_task_index(with_postings=True).
+    """
+    required = []
+    excluded = set()
+    for field, values in filters.items():
+        wanted = None
+        for value in values:
+            negate = value.startswith("!")
+            ids = lookup_rels(
+                entries, postings, field,
+                value[1:] if negate else value,
+            )
+            if negate:
+                excluded |= ids
+            else:
+                wanted = ids if wanted is None else (
+                    wanted | ids
+                )
+        if wanted is not None:
+            required.append(wanted)
+
+    if required:
+        required.sort(key=len)
+        result = set(required[0])
+        for ids in required[1:]:
+            result &= ids
+    else:
+        result = set(entries)
+    result -= excluded
 
+    tasks = [
+        entries[rel]["task"] for rel in result
+        if rel in entries
+    ]
+    tasks.sort(key=lambda t: t["id"])
+    return tasks
 
-def cmd_list(tasks_dir, status=None, tags=None):
-    """List tasks, optionally filtered by status or tags."""
-    tasks = load_tasks(tasks_dir)
 
-    if status:
-        tasks = [
-            t for t in tasks if t["status"] == status
-        ]
-    if tags:
-        tasks = [t for t in tasks if t["tags"] == tags]
+def cmd_list(tasks_dir, filters=None, fmt="table"):
+    """List tasks, optionally filtered by field values.
 
-    if not tasks:
-        print("No tasks found.")
-        return
+    See query_tasks for how `filters` are matched.
+    """
+    if filters:
+        entries, postings = load_task_index(
+            tasks_dir, with_postings=True,
+        )
+        tasks = query_tasks(entries, postings, filters)
+    else:
+        tasks = load_tasks(tasks_dir)
 
-    print_table(tasks)
+    print_tasks(tasks, fmt, "No tasks found.")
 
 
-def cmd_available(tasks_dir):
-    """List pending, unowned, unblocked tasks."""
-    all_tasks = load_tasks(tasks_dir)
+def find_available(tasks, graph=None):
+    """Return pending, unowned tasks whose blockers are
+    all completed, highest scheduling priority first.
 
+    Pass a graph from build_task_graph to avoid
+    rebuilding it.
+    """
     completed_ids = set()
-    for t in all_tasks:
+    for t in tasks:
         if t["status"] == "completed":
             completed_ids.add(t["id"])
 
-    available = []
-    for t in all_tasks:
-        if t["status"] != "pending":
+    available = [
+        t for t in tasks if is_ready(t, completed_ids)
+    ]
+
+    if graph is None:
+        graph = build_task_graph(tasks)
+    available.sort(key=lambda t: priority_key(graph, t))
+    return available
+
+
+def is_ready(task, completed_ids):
+    """Check whether a task is pending, unowned and not
+    blocked by any task outside completed_ids."""
+    if task["status"] != "pending":
+        return False
+    if task["owner"] not in ("", None):
+        return False
+    return all(
+        b in completed_ids for b in blockers_of(task)
+    )
+
+
+def blockers_of(task):
+    """Return a task's blocked_by IDs as a list."""
+    blocked = task.get("blocked_by", [])
+    if isinstance(blocked, list):
+        return blocked
+    if blocked in ("", None):
+        return []
+    return [blocked]
+
+
+def build_task_graph(tasks):
+    """Build the blocked_by dependency graph in O(V+E).
+
+    Returns a dict with:
+      dependents: id -> IDs of tasks it blocks
+      order:      topologically sorted IDs
+      cycle:      sorted IDs that sit on or behind a
+                  dependency cycle (empty if acyclic)
+      level:      id -> topological level over unfinished
+                  work: 0 if every known blocker is
+                  completed, else one more than its
+                  highest unfinished blocker's level
+      critical:   id -> length of the longest chain of
+                  unfinished work this task starts,
+                  counting itself (0 once completed)
+
+    Blockers that name unknown task IDs add no edges.
+    """
+    by_id = {t["id"]: t for t in tasks}
+    dependents = {tid: [] for tid in by_id}
+    indegree = {tid: 0 for tid in by_id}
+    for tid, t in by_id.items():
+        for b in set(blockers_of(t)):
+            if b in by_id and b != tid:
+                dependents[b].append(tid)
+                indegree[tid] += 1
+            elif b == tid:
+                indegree[tid] += 1
+
+    order = [tid for tid in by_id if indegree[tid] == 0]
+    level = {tid: 0 for tid in order}
+    i = 0
+    while i < len(order):
+        tid = order[i]
+        i += 1
+        step = 0 if by_id[tid]["status"] == "completed" else 1
+        for d in dependents[tid]:
+            level[d] = max(level.get(d, 0), level[tid] + step)
+            indegree[d] -= 1
+            if indegree[d] == 0:
+                order.append(d)
+
+    cycle = sorted(tid for tid in by_id if indegree[tid] > 0)
+
+    critical = {}
+    for tid in reversed(order):
+        if by_id[tid]["status"] == "completed":
+            critical[tid] = 0
             continue
-        if t["owner"] not in ("", None):
+        longest = 0
+        for d in dependents[tid]:
+            longest = max(longest, critical.get(d, 0))
+        critical[tid] = longest + 1
+
+    return {
+        "dependents": dependents,
+        "order": order,
+        "cycle": cycle,
+        "level": level,
+        "critical": critical,
+    }
+
+
+def priority_key(graph, task):
+    """Sort key putting the task that unblocks the most
+    downstream work first: longest critical path, then
+    most direct dependents, then lowest ID."""
+    tid = task["id"]
+    return (
+        -graph["critical"].get(tid, 0),
+        -len(graph["dependents"].get(tid, ())),
+        tid,
+    )
+
+
+def warn_cycle(graph):
+    """Print a warning if the graph has a cycle."""
+    if graph["cycle"]:
+        ids = ", ".join(str(x) for x in graph["cycle"])
+        print(
+            f"Warning: dependency cycle among tasks {ids}.",
+            file=sys.stderr,
+        )
+
+
+def cmd_available(tasks_dir, fmt="table"):
+    """List pending, unowned, unblocked tasks, the one
+    that unblocks the most downstream work first."""
+    tasks = load_tasks(tasks_dir)
+    graph = build_task_graph(tasks)
+    warn_cycle(graph)
+    available = find_available(tasks, graph)
+
+    print_tasks(available, fmt, "No available tasks.")
+
+
+def project_waves(tasks, graph, concurrency):
+    """Simulate execution in unit-length waves.
+
+    Each wave runs up to `concurrency` ready tasks,
+    in_progress tasks first, then by priority_key. A
+    task is ready once all its blockers have finished.
+    Returns (waves, stuck) where waves is a list of task
+    lists and stuck lists tasks that can never run.
+    """
+    by_id = {t["id"]: t for t in tasks}
+    done = {
+        tid for tid, t in by_id.items()
+        if t["status"] == "completed"
+    }
+    remaining = {}
+    ready = []
+    for tid, t in by_id.items():
+        if tid in done:
             continue
-        blocked = t.get("blocked_by", [])
-        if blocked:
-            all_done = all(
-                b in completed_ids for b in blocked
-            )
-            if not all_done:
-                continue
-        available.append(t)
+        blockers = set(blockers_of(t)) - done
+        remaining[tid] = len(blockers)
+        if not blockers:
+            ready.append(t)
+
+    def wave_key(t):
+        running = t["status"] == "in_progress"
+        return (not running, priority_key(graph, t))
+
+    waves = []
+    while ready:
+        ready.sort(key=wave_key)
+        wave = ready[:concurrency]
+        ready = ready[concurrency:]
+        waves.append(wave)
+        for t in wave:
+            for d in graph["dependents"][t["id"]]:
+                if d not in remaining:
+                    continue
+                remaining[d] -= 1
+                if remaining[d] == 0:
+                    ready.append(by_id[d])
+            del remaining[t["id"]]
+
+    stuck = sorted(
+        (by_id[tid] for tid in remaining),
+        key=lambda t: t["id"],
+    )
+    return waves, stuck
+
+
+def cmd_schedule(tasks_dir, concurrency=3):
+    """Print the projected wave-by-wave execution, with
+    each task's topological level and critical path."""
+    tasks = load_tasks(tasks_dir)
+    graph = build_task_graph(tasks)
+    if graph["cycle"]:
+        ids = ", ".join(str(x) for x in graph["cycle"])
+        print(
+            f"Error: dependency cycle among tasks {ids}.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    waves, stuck = project_waves(tasks, graph, concurrency)
+    if not waves and not stuck:
+        print("No remaining tasks.")
+        return
 
-    if not available:
-        print("No available tasks.")
+    critical = max(graph["critical"].values(), default=0)
+    print(
+        f"{len(waves)} waves at concurrency {concurrency} "
+        f"(critical path: {critical} tasks)"
+    )
+    for n, wave in enumerate(waves, 1):
+        ids = ", ".join(
+            f"{t['id']} (level {graph['level'][t['id']]}, "
+            f"path {graph['critical'][t['id']]})"
+            for t in wave
+        )
+        print(f"Wave {n}: {ids}")
+    if stuck:
+        ids = ", ".join(str(t["id"]) for t in stuck)
+        print(f"Unschedulable (blocked by missing tasks): {ids}")
+
+
+class TaskError(Exception):
+    """A task file could not be found or updated."""
+
+
+@contextlib.contextmanager
+def tasks_lock(tasks_dir, blocking=True):
+    """Hold an exclusive lock on the tasks directory.
+
+    Every writer takes this lock around its
+    read-modify-write, so concurrent updates and claims
+    are serialized. Readers do not need it because task
+    files are replaced atomically.
+
+    Yields True once the lock is held. With
+    blocking=False, yields False instead of waiting if
+    the lock is taken or cannot be created.
+    """
+    path = os.path.join(tasks_dir, LOCK_FILE)
+    try:
+        f = open(path, "a")
+    except OSError:
+        if blocking:
+            raise
+        yield False
         return
+    with f:
+        try:
+            fcntl.flock(
+                f.fileno(),
+                fcntl.LOCK_EX if blocking
+                else fcntl.LOCK_EX | fcntl.LOCK_NB,
+            )
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
-    print_table(available)
+
+def write_task_file(path, text):
+    """Atomically replace a task file with new text."""
+    directory, fname = os.path.split(path)
+    tmp = os.path.join(
+        directory, f".{fname}.{os.getpid()}.tmp",
+    )
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except OSError:
+        mode = None
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 def resolve_task_path(tasks_dir, task_id):
     """Find the actual task file, trying both padded
-    and unpadded names (e.g. task_1.md, task_01.md).
+    and unpadded names (e.g. task_1.md, task_01.md), at
+    the top level and then in the task's shard.
     """
-    candidates = [
+    names = [
         f"task_{task_id}.md",
         f"task_{task_id:02d}.md",
     ]
-    for name in candidates:
-        path = os.path.join(tasks_dir, name)
-        if os.path.isfile(path):
-            return path
+    for directory in (tasks_dir, os.path.join(
+            tasks_dir, shard_name(task_id))):
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                return path
     return None
 
 
-def cmd_update(tasks_dir, task_id, status=None,
-               owner=None):
-    """Update a task file's frontmatter fields."""
-    path = resolve_task_path(tasks_dir, task_id)
-    if path is None:
-        print(
-            f"Error: task file for ID {task_id} "
-            "not found.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
-
+def set_frontmatter_fields(text, updates):
+    """Return text with frontmatter fields replaced or
+    added. Raises TaskError if there is no frontmatter.
+    """
     lines = text.split("\n")
     if not lines or lines[0].strip() != "---":
-        print(
-            "Error: no YAML frontmatter found.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+        raise TaskError("no YAML frontmatter found.")
 
     end = None
     for i in range(1, len(lines)):
@@ -266,26 +1309,9 @@ def cmd_update(tasks_dir, task_id, status=None,
             break
 
     if end is None:
-        print(
-            "Error: unterminated frontmatter.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    updates = {}
-    if status is not None:
-        updates["status"] = status
-    if owner is not None:
-        updates["owner"] = owner
-
-    if not updates:
-        print(
-            "Error: no fields to update. "
-            "Use --status and/or --owner.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+        raise TaskError("unterminated frontmatter.")
 
+    updates = dict(updates)
     for i in range(1, end):
         line = lines[i]
         stripped = line.strip()
@@ -309,31 +1335,368 @@ def cmd_update(tasks_dir, task_id, status=None,
             lines.insert(end, f"{key}: {val}")
         end += 1
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    return "\n".join(lines)
+
+
+def update_task(tasks_dir, task_id, updates):
+    """Apply frontmatter updates to one task file.
+
+    The caller must hold tasks_lock. Raises TaskError.
+    """
+    path = resolve_task_path(tasks_dir, task_id)
+    if path is None:
+        raise TaskError(
+            f"task file for ID {task_id} not found."
+        )
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except UnicodeDecodeError:
+        raise TaskError(
+            f"task file for ID {task_id} is not valid UTF-8."
+        )
+
+    text = set_frontmatter_fields(text, updates)
+    write_task_file(path, text)
+    update_index_entry(tasks_dir, path, text)
+    advance_counter(tasks_dir, task_id, locked=True)
+
+
+def cmd_update(tasks_dir, task_id, status=None,
+               owner=None):
+    """Update a task file's frontmatter fields."""
+    updates = {}
+    if status is not None:
+        updates["status"] = status
+    if owner is not None:
+        updates["owner"] = owner
+
+    if not updates:
+        print(
+            "Error: no fields to update. "
+            "Use --status and/or --owner.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    try:
+        with tasks_lock(tasks_dir):
+            update_task(tasks_dir, task_id, updates)
+    except TaskError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
     print(f"Updated task {task_id}.")
 
 
+def is_claimed(task):
+    """Check whether someone has taken a task."""
+    return (
+        task["status"] == "in_progress"
+        or task["owner"] not in ("", None)
+    )
+
+
+class TaskWatcher:
+    """In-memory task graph kept current by polling.
+
+    Each poll stats the task files with one scandir pass
+    and re-reads only files whose signature changed.
+    Availability is re-evaluated only for changed tasks
+    and the dependents of tasks whose completion state
+    changed.
+    """
+
+    def __init__(self, tasks_dir):
+        self.tasks_dir = tasks_dir
+        self.files = {}
+        self.tasks = {}
+        self.dependents = {}
+        self.completed = set()
+        self.available = set()
+
+    def _link(self, task, add):
+        """Add or remove a task's blocked_by edges."""
+        for b in set(blockers_of(task)):
+            deps = self.dependents.setdefault(b, set())
+            if add:
+                deps.add(task["id"])
+            else:
+                deps.discard(task["id"])
+
+    def _read(self, fname):
+        path = os.path.join(self.tasks_dir, fname)
+        try:
+            return make_task(*read_task_header(path))
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def poll(self, initial=False):
+        """Apply file changes since the last poll.
+
+        Returns a list of event dicts. On the initial poll
+        only `available` events are reported.
+        """
+        sigs = scan_task_files(self.tasks_dir)
+        changes = []
+        for fname in self.files.keys() - sigs.keys():
+            old = self.files.pop(fname)[1]
+            changes.append((old, None))
+        for fname, sig in sigs.items():
+            prev = self.files.get(fname)
+            if prev is not None and prev[0] == sig:
+                continue
+            new = self._read(fname)
+            if new is None:
+                continue
+            self.files[fname] = (sig, new)
+            changes.append((prev[1] if prev else None, new))
+
+        events = []
+        affected = set()
+        for old, new in changes:
+            if old is not None:
+                self._link(old, add=False)
+                if self.tasks.get(old["id"]) is old:
+                    del self.tasks[old["id"]]
+                affected.add(old["id"])
+            if new is not None:
+                self._link(new, add=True)
+                self.tasks[new["id"]] = new
+                affected.add(new["id"])
+
+            was_done = new is not None and (
+                new["id"] in self.completed
+            )
+            for task in (old, new):
+                if task is not None:
+                    self._sync_completed(task["id"], affected)
+            if initial or new is None:
+                continue
+            now_done = new["status"] == "completed"
+            if now_done and not was_done:
+                events.append(self._event("completed", new))
+            elif (is_claimed(new) and not now_done
+                    and (old is None or not is_claimed(old))):
+                events.append(self._event("claimed", new))
+
+        for tid in sorted(affected):
+            task = self.tasks.get(tid)
+            ready = (
+                task is not None
+                and is_ready(task, self.completed)
+            )
+            if ready and tid not in self.available:
+                self.available.add(tid)
+                events.append(self._event("available", task))
+            elif not ready:
+                self.available.discard(tid)
+        return events
+
+    def _sync_completed(self, tid, affected):
+        """Update the completed set for one task ID, adding
+        its dependents to `affected` if it changed."""
+        task = self.tasks.get(tid)
+        done = task is not None and task["status"] == "completed"
+        if done == (tid in self.completed):
+            return
+        if done:
+            self.completed.add(tid)
+        else:
+            self.completed.discard(tid)
+        affected |= self.dependents.get(tid, set())
+
+    def _event(self, kind, task):
+        return {
+            "event": kind,
+            "id": task["id"],
+            "status": task["status"],
+            "owner": task["owner"],
+            "subject": task["subject"],
+        }
+
+
+def cmd_watch(tasks_dir, interval=1.0):
+    """Emit NDJSON events as tasks become available,
+    claimed or completed, until interrupted."""
+    watcher = TaskWatcher(tasks_dir)
+    initial = True
+    try:
+        while True:
+            for event in watcher.poll(initial=initial):
+                print(json.dumps(event), flush=True)
+            initial = False
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+# Fields a batch record may set, as with update's flags.
+BATCH_FIELDS = ("status", "owner")
+
+
+def parse_batch_record(line):
+    """Decode one NDJSON batch record into a dict. Raises
+    TaskError."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise TaskError(f"invalid JSON: {e}")
+    if not isinstance(record, dict):
+        raise TaskError("record is not a JSON object.")
+    return record
+
+
+def batch_record_id(record):
+    """Return a batch record's task ID. Raises TaskError."""
+    task_id = record.get("id")
+    if isinstance(task_id, str) and task_id.isdigit():
+        task_id = int(task_id)
+    if (not isinstance(task_id, int)
+            or isinstance(task_id, bool)):
+        raise TaskError("record needs an integer 'id'.")
+    return task_id
+
+
+def batch_record_updates(record):
+    """Return the frontmatter updates a batch record asks
+    for. Raises TaskError."""
+    updates = {}
+    for key, val in record.items():
+        if key == "id":
+            continue
+        if key not in BATCH_FIELDS:
+            raise TaskError(f"unknown field '{key}'.")
+        if not isinstance(val, str) or "\n" in val:
+            raise TaskError(
+                f"field '{key}' must be a one-line string."
+            )
+        updates[key] = val
+
+    if not updates:
+        raise TaskError(
+            "no fields to update. Use status and/or owner."
+        )
+    return updates
+
+
+def cmd_batch(tasks_dir, stream):
+    """Apply NDJSON update records from a stream.
+
+    Each non-blank line is an object such as
+    {"id": 3, "status": "completed"}. All records are
+    applied under one lock.
+    Prints one NDJSON result per record, with its "id"
+    whenever that parsed, and exits 1 if any record
+    failed.
+    """
+    failed = 0
+    with tasks_lock(tasks_dir):
+        for lineno, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            result = {"line": lineno}
+            try:
+                record = parse_batch_record(line)
+                task_id = result["id"] = batch_record_id(record)
+                updates = batch_record_updates(record)
+                update_task(tasks_dir, task_id, updates)
+                result["ok"] = True
+            except (TaskError, OSError, ValueError) as e:
+                result["ok"] = False
+                result["error"] = str(e)
+                failed += 1
+            print(json.dumps(result))
+
+    if failed:
+        sys.exit(1)
+
+
+def cmd_claim(tasks_dir, owner):
+    """Claim the next available task for an owner.
+
+    Picking the task, setting its owner and moving it to
+    in_progress happen under one lock, so concurrent
+    claimers never receive the same task.
+    """
+    with tasks_lock(tasks_dir):
+        tasks = load_tasks(tasks_dir, locked=True)
+        available = find_available(tasks)
+        if not available:
+            print("No available tasks.")
+            return
+        task = available[0]
+        try:
+            update_task(tasks_dir, task["id"], {
+                "status": "in_progress",
+                "owner": owner,
+            })
+        except TaskError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    print(f"Claimed task {task['id']}.")
+
+
 def print_usage():
     """Print usage help."""
     print(
         "Usage:\n"
         "  enact-tasks.py <tasks_dir> next-id\n"
+        "  enact-tasks.py <tasks_dir> reserve-id\n"
         "  enact-tasks.py <tasks_dir> list"
-        " [--status S] [--tags T]\n"
-        "  enact-tasks.py <tasks_dir> available\n"
+        " [--status S] [--owner O] [--tags T]\n"
+        "      [--blocked-by ID] [--blocks ID] [--format F]\n"
+        "  enact-tasks.py <tasks_dir> available"
+        " [--format F]\n"
         "  enact-tasks.py <tasks_dir> update <id>"
         " [--status S] [--owner O]\n"
+        "  enact-tasks.py <tasks_dir> claim --owner O\n"
+        "  enact-tasks.py <tasks_dir> batch"
+        " < updates.ndjson\n"
+        "  enact-tasks.py <tasks_dir> watch"
+        " [--interval SECONDS]\n"
+        "  enact-tasks.py <tasks_dir> schedule"
+        " [--concurrency N]\n"
+        "  enact-tasks.py <tasks_dir> shard\n"
         "\n"
         "Commands:\n"
-        "  next-id    Print next available task ID\n"
+        "  next-id    Print the next free task ID\n"
+        "  reserve-id Reserve and print the next task ID\n"
         "  list       List tasks (filterable)\n"
-        "  available  List pending unblocked tasks\n"
-        "  update     Update task frontmatter fields"
+        "  available  List pending unblocked tasks,"
+        " critical path first\n"
+        "  update     Update task frontmatter fields\n"
+        "  claim      Atomically take the next available task\n"
+        "  batch      Apply NDJSON updates read from stdin\n"
+        "  watch      Stream NDJSON task events as files change\n"
+        "  schedule   Project wave-by-wave execution order\n"
+        "  shard      Move task files into NNN/ shard"
+        " subdirectories\n"
+        "\n"
+        "List filters take comma-separated values; prefix a"
+        " value with ! to\n"
+        "exclude it (e.g. --status '!completed'). --tags"
+        " matches individual tags.\n"
+        "\n"
+        "Formats (list, available): table (default), json,"
+        " ndjson, tsv"
     )
 
 
+def parse_format(value):
+    """Validate a --format argument, exiting on error."""
+    if value not in OUTPUT_FORMATS:
+        print(
+            f"Error: invalid format '{value}'. Use one of: "
+            + ", ".join(OUTPUT_FORMATS) + ".",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return value
+
+
 def main():
     args = sys.argv[1:]
 
@@ -359,22 +1722,36 @@ def main():
 
     if command == "next-id":
         cmd_next_id(tasks_dir)
+    elif command == "reserve-id":
+        cmd_reserve_id(tasks_dir)
     elif command == "list":
-        status = None
-        tags = None
+        filters = {}
+        fmt = "table"
         i = 0
         while i < len(rest):
-            if rest[i] == "--status" and i + 1 < len(rest):
-                status = rest[i + 1]
+            if rest[i] in QUERY_FLAGS and i + 1 < len(rest):
+                field = QUERY_FLAGS[rest[i]]
+                values = filters.setdefault(field, [])
+                values.extend(
+                    v.strip() for v in rest[i + 1].split(",")
+                )
                 i += 2
-            elif rest[i] == "--tags" and i + 1 < len(rest):
-                tags = rest[i + 1]
+            elif rest[i] == "--format" and i + 1 < len(rest):
+                fmt = parse_format(rest[i + 1])
                 i += 2
             else:
                 i += 1
-        cmd_list(tasks_dir, status=status, tags=tags)
+        cmd_list(tasks_dir, filters=filters, fmt=fmt)
     elif command == "available":
-        cmd_available(tasks_dir)
+        fmt = "table"
+        i = 0
+        while i < len(rest):
+            if rest[i] == "--format" and i + 1 < len(rest):
+                fmt = parse_format(rest[i + 1])
+                i += 2
+            else:
+                i += 1
+        cmd_available(tasks_dir, fmt=fmt)
     elif command == "update":
         if not rest:
             print(
@@ -409,6 +1786,69 @@ def main():
             tasks_dir, task_id,
             status=upd_status, owner=upd_owner,
         )
+    elif command == "claim":
+        claim_owner = None
+        i = 0
+        while i < len(rest):
+            if (rest[i] == "--owner"
+                    and i + 1 < len(rest)):
+                claim_owner = rest[i + 1]
+                i += 2
+            else:
+                i += 1
+        if not claim_owner:
+            print(
+                "Error: claim requires --owner.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        cmd_claim(tasks_dir, claim_owner)
+    elif command == "watch":
+        interval = 1.0
+        i = 0
+        while i < len(rest):
+            if (rest[i] == "--interval"
+                    and i + 1 < len(rest)):
+                try:
+                    interval = float(rest[i + 1])
+                except ValueError:
+                    interval = -1.0
+                if interval <= 0:
+                    print(
+                        "Error: invalid interval "
+                        f"'{rest[i + 1]}'.",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+                i += 2
+            else:
+                i += 1
+        cmd_watch(tasks_dir, interval=interval)
+    elif command == "shard":
+        cmd_shard(tasks_dir)
+    elif command == "batch":
+        cmd_batch(tasks_dir, sys.stdin)
+    elif command == "schedule":
+        concurrency = 3
+        i = 0
+        while i < len(rest):
+            if (rest[i] == "--concurrency"
+                    and i + 1 < len(rest)):
+                try:
+                    concurrency = int(rest[i + 1])
+                except ValueError:
+                    concurrency = 0
+                if concurrency < 1:
+                    print(
+                        "Error: invalid concurrency "
+                        f"'{rest[i + 1]}'.",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+                i += 2
+            else:
+                i += 1
+        cmd_schedule(tasks_dir, concurrency=concurrency)
     else:
         print(
             f"Error: unknown command '{command}'",
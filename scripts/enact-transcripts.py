@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
-"""Find and output all transcripts for a given Enact session.
+"""Find and output all transcripts for given Enact sessions.
 
-Given an enact ID, finds the orchestrator session, all subagent
-transcripts, and all team member sessions, then outputs their paths
-(or contents) to stdout.
+Given one or more enact IDs, finds each orchestrator session, all
+subagent transcripts, and all team member sessions, then outputs their
+paths (or contents) to stdout. Several sessions are resolved in a
+single pass over the projects tree.
 
 Usage:
     enact-transcripts.py [enact_id]
@@ -11,27 +12,92 @@ Usage:
         (latest session if omitted)
     enact-transcripts.py --cat [enact_id]     # output transcript contents
     enact-transcripts.py --paths [enact_id]   # list bare paths only
+    enact-transcripts.py --timeline [enact_id]  # merge all by timestamp
+    enact-transcripts.py --tree [--depth N] [enact_id]  # full agent tree
+    enact-transcripts.py --no-catalog [enact_id]  # scan without catalog
+    enact-transcripts.py --jobs 8 [enact_id]  # probe files in parallel
+    enact-transcripts.py ID1 ID2 ...          # several sessions, one scan
+    enact-transcripts.py --all | --since 2026-02-01  # every/recent session
+
+Lookups go through a transcript catalog in
+~/.enact/transcript-catalog.sqlite that is refreshed incrementally on
+every run; see transcript_catalog.py.
 """
 
 import argparse
+import heapq
+import io
 import json
+import os
 import re
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+from transcript_io import (
+    READ_ERRORS,
+    is_compressed,
+    list_transcripts,
+    loads,
+    open_transcript,
+    record_type,
+    transcript_stem,
+)
+
+try:
+    from transcript_catalog import TranscriptCatalog
+except ImportError:  # Python built without sqlite3
+    TranscriptCatalog = None
+
+
+def parallel_map(fn, items, jobs: int = 1, processes: bool = False) -> list:
+    """Map fn over items with up to `jobs` workers.
+
+    Results are returned in input order, so output stays deterministic
+    regardless of the worker count. Threads suit I/O-bound probes;
+    processes suit JSON parsing, which holds the GIL. fn must be a
+    module-level function (or a partial of one) when processes=True.
+    """
+    items = list(items)
+    if jobs <= 1 or len(items) <= 1:
+        return list(map(fn, items))
+    pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    workers = min(jobs, len(items))
+    with pool_cls(max_workers=workers) as pool:
+        if processes:
+            chunksize = max(1, len(items) // (workers * 4))
+            return list(pool.map(fn, items, chunksize=chunksize))
+        return list(pool.map(fn, items))
+
+
+def list_enact_ids() -> list[str]:
+    """List enact IDs (numeric directory names under ~/.enact/),
+    oldest first."""
+    enact_dir = Path.home() / ".enact"
+    if not enact_dir.is_dir():
+        return []
+    ids = [
+        int(d.name) for d in enact_dir.iterdir()
+        if d.is_dir() and d.name.isdigit()
+    ]
+    return [str(i) for i in sorted(ids)]
+
 
 def find_latest_enact_id() -> str | None:
     """Find the most recent enact ID (highest numeric directory name)."""
-    enact_dir = Path.home() / ".enact"
-    if not enact_dir.is_dir():
-        return None
-    candidates = []
-    for d in enact_dir.iterdir():
-        if d.is_dir() and d.name.isdigit():
-            candidates.append(int(d.name))
-    if not candidates:
-        return None
-    return str(max(candidates))
+    ids = list_enact_ids()
+    return ids[-1] if ids else None
+
+
+def parse_since(value: str) -> int:
+    """Parse a --since value: epoch seconds (an enact ID) or an ISO
+    date/time in local time. Raises ValueError."""
+    if value.isdigit():
+        return int(value)
+    return int(datetime.fromisoformat(value).timestamp())
 
 
 def find_project_dirs() -> list[Path]:
@@ -42,55 +108,272 @@ def find_project_dirs() -> list[Path]:
     return [d for d in projects_dir.iterdir() if d.is_dir()]
 
 
-def find_orchestrator_session(
-    enact_id: str, project_dirs: list[Path]
-) -> tuple[Path, Path] | None:
-    """Find the orchestrator session that contains the enact ID.
+def open_catalog(project_dirs: list[Path], jobs: int = 1):
+    """Open and refresh the transcript catalog.
+
+    Returns None if the catalog is unavailable, in which case callers
+    fall back to scanning transcripts directly.
+    """
+    if TranscriptCatalog is None:
+        return None
+    try:
+        catalog = TranscriptCatalog()
+        catalog.refresh(
+            project_dirs,
+            map_fn=partial(parallel_map, jobs=jobs, processes=True),
+        )
+    except Exception as e:  # sqlite3 errors, unwritable ~/.enact, ...
+        print(
+            f"Warning: transcript catalog unavailable ({e}); "
+            "scanning transcripts directly",
+            file=sys.stderr,
+        )
+        return None
+    return catalog
+
+
+# Transcripts are searched in chunks of this size, so memory use does
+# not grow with transcript size.
+SEARCH_CHUNK = 1 << 20
+
+
+def file_contains(path: Path, needle: bytes) -> bool:
+    """Check whether a file contains `needle`, stopping at the first
+    match. Consecutive chunks overlap so matches spanning a chunk
+    boundary are found."""
+    keep = len(needle) - 1
+    tail = b""
+    with open_transcript(path) as f:
+        while True:
+            chunk = f.read(SEARCH_CHUNK)
+            if not chunk:
+                return False
+            buf = tail + chunk if tail else chunk
+            if needle in buf:
+                return True
+            tail = buf[-keep:] if keep else b""
+
+
+def file_search(path: Path, needles: list[bytes]) -> set[bytes]:
+    """Return which of `needles` occur in a file, stopping once all
+    have been seen. Chunks overlap as in file_contains."""
+    pattern = re.compile(b"|".join(re.escape(n) for n in needles))
+    keep = max(len(n) for n in needles) - 1
+    found: set[bytes] = set()
+    tail = b""
+    with open_transcript(path) as f:
+        while len(found) < len(needles):
+            chunk = f.read(SEARCH_CHUNK)
+            if not chunk:
+                break
+            buf = tail + chunk if tail else chunk
+            found.update(pattern.findall(buf))
+            tail = buf[-keep:] if keep else b""
+    return found
+
+
+def referenced_ids(
+    path: Path, enact_ids: tuple[str, ...]
+) -> list[str] | None:
+    """Return which of the enact IDs a transcript mentions, or None
+    if it cannot be read."""
+    try:
+        st = path.stat()
+        candidates = [i for i in enact_ids if may_reference(st, i)]
+        if len(candidates) <= 1:
+            return [
+                i for i in candidates
+                if file_contains(path, i.encode("utf-8"))
+            ]
+        found = file_search(path, [i.encode("utf-8") for i in candidates])
+    except READ_ERRORS:
+        return None
+    return [i for i in candidates if i.encode("utf-8") in found]
+
 
-    Returns (project_dir, session_jsonl_path) or None.
-    Identifies the orchestrator by finding sessions that both reference the
-    enact ID AND have a subagents/ directory (i.e., they spawned subagents).
-    Falls back to any session referencing the enact ID if no subagent dir found.
+def may_reference(st, enact_id: str) -> bool:
+    """Cheap pre-check before searching a transcript for an enact ID.
+
+    Enact IDs are creation timestamps (`date +%s`), so a transcript
+    last modified before the ID existed cannot mention it. Files too
+    small to hold the ID are skipped too.
     """
-    candidates_with_subagents: list[tuple[Path, Path, int]] = []
-    candidates_without: list[tuple[Path, Path]] = []
+    if st.st_size < len(enact_id):
+        return False
+    if enact_id.isdigit() and st.st_mtime < int(enact_id):
+        return False
+    return True
+
+
+def pick_orchestrator(
+    candidates: list[tuple[Path, Path, int]],
+) -> tuple[Path, Path] | None:
+    """Pick the orchestrator from (project_dir, path, subagent_count)
+    candidates: the one with the most subagents, else the first."""
+    with_subagents = [c for c in candidates if c[2] > 0]
+    if with_subagents:
+        with_subagents.sort(key=lambda x: x[2], reverse=True)
+        return (with_subagents[0][0], with_subagents[0][1])
+    if candidates:
+        return (candidates[0][0], candidates[0][1])
+    return None
+
+
+def _referenced_job(
+    job: tuple[Path, tuple[str, ...]]
+) -> list[str] | None:
+    """Run referenced_ids for a (path, enact_ids) job."""
+    path, enact_ids = job
+    return referenced_ids(path, enact_ids)
 
-    for project_dir in project_dirs:
-        for jsonl_file in sorted(project_dir.glob("*.jsonl")):
-            session_id = jsonl_file.stem
-            session_dir = project_dir / session_id
 
+def scan_for_enact_ids(
+    enact_ids: list[str],
+    project_dirs: list[Path],
+    jobs: int = 1,
+    catalog=None,
+) -> dict[str, list[tuple[Path, Path, int]]]:
+    """Read every session transcript once, searching for all the
+    enact IDs together.
+
+    Returns {enact_id: [(project_dir, path, subagent_count), ...]}
+    for the transcripts mentioning each ID, in project order.
+
+    With a catalog, results are recorded per transcript along with
+    its mtime and size, and a transcript is only searched again for
+    an ID once it has changed.
+    """
+    candidates: dict[str, list[tuple[Path, Path, int]]] = {
+        i: [] for i in enact_ids
+    }
+    cached = catalog.id_scans(enact_ids) if catalog is not None else {}
+    files = []
+    for project_dir in project_dirs:
+        for jsonl_file in list_transcripts(project_dir):
             try:
-                with open(jsonl_file) as f:
-                    content = f.read()
-            except (OSError, UnicodeDecodeError):
+                st = jsonl_file.stat()
+            except OSError:
                 continue
+            sig = (st.st_mtime_ns, st.st_size)
+            found, pending = [], []
+            for enact_id in enact_ids:
+                hit = cached.get((enact_id, str(jsonl_file)))
+                if hit is not None and hit[:2] == sig:
+                    if hit[2]:
+                        found.append(enact_id)
+                else:
+                    pending.append(enact_id)
+            files.append((project_dir, jsonl_file, sig, found, pending))
+
+    to_scan = [f for f in files if f[4]]
+    matches = parallel_map(
+        _referenced_job,
+        [(jsonl_file, tuple(pending))
+         for _, jsonl_file, _, _, pending in to_scan],
+        jobs,
+    )
+    records = []
+    for (_, jsonl_file, sig, found, pending), ids in zip(to_scan, matches):
+        if ids is None:
+            continue
+        found.extend(ids)
+        records.extend(
+            (i, str(jsonl_file), *sig, i in ids) for i in pending
+        )
+    if catalog is not None and records:
+        catalog.record_id_scans(records)
+
+    for project_dir, jsonl_file, _, found, _ in files:
+        if not found:
+            continue
+        subagents_dir = (
+            project_dir / transcript_stem(jsonl_file) / "subagents"
+        )
+        subagent_count = len(list_transcripts(subagents_dir, "agent-"))
+        for enact_id in enact_ids:
+            if enact_id in found:
+                candidates[enact_id].append(
+                    (project_dir, jsonl_file, subagent_count)
+                )
+    return candidates
+
+
+def find_orchestrator_sessions(
+    enact_ids: list[str],
+    project_dirs: list[Path],
+    catalog=None,
+    jobs: int = 1,
+) -> dict[str, tuple[Path, Path]]:
+    """Find the orchestrator session for each enact ID in one pass.
+
+    Returns {enact_id: (project_dir, session_jsonl_path)}, omitting IDs
+    with no matching session. Identifies each orchestrator by finding
+    sessions that both reference the enact ID AND have subagent
+    transcripts (i.e., they spawned subagents). Falls back to the first
+    session referencing the enact ID if none did.
+
+    With a catalog, candidates are the sessions it records as
+    referencing `.enact/<enact_id>`. IDs it has no candidates for
+    (e.g. only ever mentioned bare) and every ID without a catalog
+    are searched for by reading each transcript once, matching any
+    occurrence of the ID; the catalog remembers these results, so
+    only transcripts that changed are read again.
+    """
+    candidates: dict[str, list[tuple[Path, Path, int]]] = {
+        i: [] for i in enact_ids
+    }
+    if catalog is not None:
+        order = {str(d): i for i, d in enumerate(project_dirs)}
+        for enact_id in enact_ids:
+            found = [
+                c for c in catalog.sessions_referencing(enact_id)
+                if str(c[0]) in order
+            ]
+            found.sort(key=lambda c: (order[str(c[0])], str(c[1])))
+            candidates[enact_id] = found
+    missing = [i for i in enact_ids if not candidates[i]]
+    if missing:
+        candidates.update(
+            scan_for_enact_ids(missing, project_dirs, jobs, catalog)
+        )
 
-            if enact_id not in content:
-                continue
+    sessions = {}
+    for enact_id in enact_ids:
+        picked = pick_orchestrator(candidates[enact_id])
+        if picked is not None:
+            sessions[enact_id] = picked
+    return sessions
 
-            has_subagents = (session_dir / "subagents").is_dir()
-            entry = (project_dir, jsonl_file)
 
-            if has_subagents:
-                subagent_count = len(
-                    list((session_dir / "subagents").glob("agent-*.jsonl"))
-                )
-                candidates_with_subagents.append((*entry, subagent_count))
-            else:
-                candidates_without.append(entry)
+def find_orchestrator_session(
+    enact_id: str, project_dirs: list[Path], catalog=None, jobs: int = 1
+) -> tuple[Path, Path] | None:
+    """Find the orchestrator session that contains the enact ID.
 
-    if candidates_with_subagents:
-        candidates_with_subagents.sort(key=lambda x: x[2], reverse=True)
-        return (
-            candidates_with_subagents[0][0],
-            candidates_with_subagents[0][1],
-        )
+    Returns (project_dir, session_jsonl_path) or None. See
+    find_orchestrator_sessions.
+    """
+    sessions = find_orchestrator_sessions(
+        [enact_id], project_dirs, catalog, jobs
+    )
+    return sessions.get(enact_id)
 
-    if candidates_without:
-        return candidates_without[0]
 
-    return None
+AGENT_ID_RE = re.compile(r"agentId: (a[0-9a-f]+)")
+
+
+def tool_result_agent_id(result: dict) -> str | None:
+    """Extract the spawned agent's ID from a Task tool_result's text."""
+    content = result.get("content", [])
+    if isinstance(content, str):
+        text = content
+    else:
+        text = ""
+        for part in content:
+            if isinstance(part, dict):
+                text += part.get("text", "")
+    m = AGENT_ID_RE.search(text)
+    return m.group(1) if m else None
 
 
 def build_agent_label_map(orchestrator_jsonl: Path) -> dict[str, str]:
@@ -98,20 +381,41 @@ def build_agent_label_map(orchestrator_jsonl: Path) -> dict[str, str]:
 
     Parses Task tool_use calls and their corresponding tool_result responses
     to match each agentId to the short description given when it was spawned.
+    Lines that cannot hold either are skipped before JSON decoding, and the
+    structured toolUseResult.agentId is preferred over the result text.
     """
     label_map: dict[str, str] = {}
     pending: dict[str, str] = {}
 
     try:
-        with open(orchestrator_jsonl) as f:
+        with open_transcript(orchestrator_jsonl) as f:
             for line in f:
+                if not (
+                    b'"Task"' in line
+                    or (pending and b'"tool_result"' in line)
+                ):
+                    continue
+                if record_type(line) not in (None, "assistant", "user"):
+                    # e.g. progress records echoing a subagent's calls
+                    continue
                 try:
-                    d = json.loads(line)
-                except json.JSONDecodeError:
+                    d = loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if not isinstance(d, dict):
+                    continue
+                kind = d.get("type")
+                if kind not in ("assistant", "user"):
+                    continue
+                message = d.get("message")
+                if not isinstance(message, dict):
+                    continue
+                content = message.get("content", [])
+                if not isinstance(content, list):
                     continue
 
-                if d.get("type") == "assistant" and "message" in d:
-                    for c in d["message"].get("content", []):
+                if kind == "assistant":
+                    for c in content:
                         if (
                             isinstance(c, dict)
                             and c.get("type") == "tool_use"
@@ -120,126 +424,533 @@ def build_agent_label_map(orchestrator_jsonl: Path) -> dict[str, str]:
                             pending[c["id"]] = c.get("input", {}).get(
                                 "description", ""
                             )
+                    continue
 
-                elif d.get("type") == "user" and "message" in d:
-                    content = d["message"].get("content", [])
-                    if not isinstance(content, list):
-                        continue
-                    for c in content:
-                        if not isinstance(c, dict):
-                            continue
-                        if c.get("type") != "tool_result":
-                            continue
-                        tool_use_id = c.get("tool_use_id", "")
-                        if tool_use_id not in pending:
-                            continue
-                        text = ""
-                        for part in c.get("content", []):
-                            if isinstance(part, dict):
-                                text += part.get("text", "")
-                        m = re.search(r"agentId: (a[0-9a-f]+)", text)
-                        if m:
-                            label_map[m.group(1)] = pending[tool_use_id]
-    except (OSError, UnicodeDecodeError):
+                results = [
+                    c for c in content
+                    if isinstance(c, dict)
+                    and c.get("type") == "tool_result"
+                    and c.get("tool_use_id", "") in pending
+                ]
+                structured = d.get("toolUseResult")
+                structured_id = None
+                if len(results) == 1 and isinstance(structured, dict):
+                    structured_id = structured.get("agentId")
+                for c in results:
+                    agent_id = structured_id or tool_result_agent_id(c)
+                    if agent_id:
+                        label_map[agent_id] = pending[c["tool_use_id"]]
+    except READ_ERRORS:
         pass
 
     return label_map
 
 
-def get_start_timestamp(transcript_path: Path) -> str:
-    """Extract the earliest timestamp from a transcript for sorting."""
+# How far into a transcript probe_header reads. The fields it looks
+# for appear in the first few records; the cap stops one huge file
+# without them from stalling discovery.
+HEADER_PROBE_BYTES = 1 << 20
+
+# The byte pattern that must appear on a line before it is decoded
+# for each header field.
+HEADER_NEEDLES = {
+    "timestamp": b'"timestamp"',
+    "sessionId": b'"sessionId"',
+    "teamName": b'"teamName"',
+    "model": b'"model"',
+}
+
+_header_cache: dict[tuple[str, int], dict] = {}
+
+
+def scan_header(
+    transcript_path: Path, limit: int = HEADER_PROBE_BYTES
+) -> dict:
+    """Read the first `limit` bytes of a transcript once, collecting
+    the first timestamp, sessionId, teamName/agentName pair and
+    model. Missing fields are absent from the result.
+
+    Only lines containing a still-missing key are JSON-decoded, and
+    reading stops as soon as every field is found.
+    """
+    header: dict = {}
+    remaining = limit
     try:
-        with open(transcript_path) as f:
-            for line in f:
+        with open_transcript(transcript_path) as f:
+            while remaining > 0:
+                wanted = [
+                    k for k, needle in HEADER_NEEDLES.items()
+                    if k not in header
+                ]
+                if not wanted:
+                    break
+                line = f.readline(remaining)
+                if not line.endswith(b"\n"):
+                    # EOF, a partial last line, or cut off by the cap.
+                    break
+                remaining -= len(line)
+                if not any(HEADER_NEEDLES[k] in line for k in wanted):
+                    continue
                 try:
-                    d = json.loads(line)
-                except json.JSONDecodeError:
+                    d = loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
-                if "timestamp" in d:
-                    return d["timestamp"]
-    except (OSError, UnicodeDecodeError):
+                if not isinstance(d, dict):
+                    continue
+                if "timestamp" not in header and d.get("timestamp"):
+                    header["timestamp"] = d["timestamp"]
+                if "sessionId" not in header and d.get("sessionId"):
+                    header["sessionId"] = d["sessionId"]
+                if (
+                    "teamName" not in header
+                    and d.get("teamName")
+                    and d.get("agentName")
+                ):
+                    header["teamName"] = d["teamName"]
+                    header["agentName"] = d["agentName"]
+                message = d.get("message")
+                if (
+                    "model" not in header
+                    and isinstance(message, dict)
+                    and message.get("model")
+                ):
+                    header["model"] = message["model"]
+    except READ_ERRORS:
         pass
-    return ""
+    return header
+
+
+def probe_headers(
+    paths: list[Path], jobs: int = 1, limit: int = HEADER_PROBE_BYTES
+) -> list[dict]:
+    """Return scan_header results for paths, in order.
+
+    Results are memoized for the rest of the run, so sorting and team
+    detection share a single read of each file. Uncached files are
+    scanned with up to `jobs` worker processes.
+    """
+    keys = [(str(p), limit) for p in paths]
+    missing = list(dict.fromkeys(
+        k for k in keys if k not in _header_cache
+    ))
+    scanned = parallel_map(
+        partial(scan_header, limit=limit),
+        [Path(k[0]) for k in missing],
+        jobs,
+        processes=True,
+    )
+    _header_cache.update(zip(missing, scanned))
+    return [_header_cache[k] for k in keys]
+
+
+def probe_header(
+    transcript_path: Path, limit: int = HEADER_PROBE_BYTES
+) -> dict:
+    """Memoized scan_header for a single transcript."""
+    return probe_headers([transcript_path], limit=limit)[0]
+
+
+def get_start_timestamp(
+    transcript_path: Path, limit: int = HEADER_PROBE_BYTES
+) -> str:
+    """Extract the earliest timestamp from a transcript for sorting."""
+    return probe_header(transcript_path, limit).get("timestamp", "")
 
 
-def get_team_info(transcript_path: Path) -> tuple[str, str] | None:
+def get_team_info(
+    transcript_path: Path, limit: int = HEADER_PROBE_BYTES
+) -> tuple[str, str] | None:
     """Extract teamName and agentName from a team member transcript.
 
     Returns (teamName, agentName) or None if not a team member session.
     """
-    try:
-        with open(transcript_path) as f:
-            for line in f:
-                try:
-                    d = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                team = d.get("teamName")
-                agent = d.get("agentName")
-                if team and agent:
-                    return (team, agent)
-    except (OSError, UnicodeDecodeError):
-        pass
-    return None
+    header = probe_header(transcript_path, limit)
+    if "teamName" not in header:
+        return None
+    return (header["teamName"], header["agentName"])
 
 
-def find_team_member_sessions(
-    enact_id: str, project_dirs: list[Path], orchestrator_jsonl: Path
-) -> list[tuple[Path, str, str]]:
-    """Find all team member sessions for the given enact ID.
+def find_team_members(
+    enact_ids: list[str],
+    project_dirs: list[Path],
+    orchestrators: dict[str, Path],
+    catalog=None,
+    jobs: int = 1,
+    probe_bytes: int = HEADER_PROBE_BYTES,
+) -> dict[str, list[tuple[Path, str, str]]]:
+    """Find team member sessions for each enact ID in one pass.
 
     Team members are sessions in project directories whose teamName field
-    starts with '<enact_id>-'. Returns a list of (path, teamName, agentName)
+    starts with '<enact_id>-', other than that ID's orchestrator session.
+    Returns {enact_id: [(path, teamName, agentName), ...]} with each list
     sorted by start timestamp.
     """
-    prefix = f"{enact_id}-"
-    orchestrator_path = str(orchestrator_jsonl)
-    results: list[tuple[Path, str, str]] = []
+    results: dict[str, list[tuple[Path, str, str]]] = {
+        i: [] for i in enact_ids
+    }
+
+    if catalog is not None:
+        dirs = {str(d) for d in project_dirs}
+        for enact_id in enact_ids:
+            orchestrator_path = str(orchestrators.get(enact_id, ""))
+            members = [
+                m for m in catalog.team_members(f"{enact_id}-")
+                if str(m[0]) != orchestrator_path
+                and str(m[0].parent) in dirs
+            ]
+            members.sort(key=lambda m: (m[3], str(m[0])))
+            results[enact_id] = [
+                (path, team, agent) for path, team, agent, _ in members
+            ]
+        return results
+
+    files = [
+        jsonl_file
+        for project_dir in project_dirs
+        for jsonl_file in list_transcripts(project_dir)
+    ]
+    headers = probe_headers(files, jobs, probe_bytes)
+    timestamps: dict[str, list[str]] = {i: [] for i in enact_ids}
+    for jsonl_file, header in zip(files, headers):
+        team_name = header.get("teamName")
+        if team_name is None:
+            continue
+        # Enact IDs are numeric, so the ID is everything before the
+        # first '-'.
+        enact_id = team_name.partition("-")[0]
+        if enact_id not in results or not team_name.startswith(
+            f"{enact_id}-"
+        ):
+            continue
+        if jsonl_file == orchestrators.get(enact_id):
+            continue
+        results[enact_id].append(
+            (jsonl_file, team_name, header["agentName"])
+        )
+        timestamps[enact_id].append(header.get("timestamp", ""))
 
-    for project_dir in project_dirs:
-        for jsonl_file in project_dir.glob("*.jsonl"):
-            if str(jsonl_file) == orchestrator_path:
-                continue
+    for enact_id, members in results.items():
+        ts = timestamps[enact_id]
+        order = sorted(range(len(members)), key=lambda i: ts[i])
+        results[enact_id] = [members[i] for i in order]
+    return results
 
-            info = get_team_info(jsonl_file)
-            if info is None:
-                continue
 
-            team_name, agent_name = info
-            if team_name.startswith(prefix):
-                results.append((jsonl_file, team_name, agent_name))
+def find_team_member_sessions(
+    enact_id: str,
+    project_dirs: list[Path],
+    orchestrator_jsonl: Path,
+    catalog=None,
+    jobs: int = 1,
+    probe_bytes: int = HEADER_PROBE_BYTES,
+) -> list[tuple[Path, str, str]]:
+    """Find all team member sessions for the given enact ID.
 
-    results.sort(key=lambda x: get_start_timestamp(x[0]))
-    return results
+    Returns a list of (path, teamName, agentName) sorted by start
+    timestamp. See find_team_members.
+    """
+    return find_team_members(
+        [enact_id], project_dirs, {enact_id: orchestrator_jsonl},
+        catalog, jobs, probe_bytes,
+    )[enact_id]
 
 
 def collect_transcripts(
-    project_dir: Path, orchestrator_jsonl: Path
+    project_dir: Path,
+    orchestrator_jsonl: Path,
+    jobs: int = 1,
+    probe_bytes: int = HEADER_PROBE_BYTES,
 ) -> list[Path]:
     """Collect the orchestrator transcript and all direct subagent transcripts,
-    sorted by start timestamp."""
+    sorted by start timestamp (then name)."""
     transcripts = [orchestrator_jsonl]
 
-    session_dir = project_dir / orchestrator_jsonl.stem
+    session_dir = project_dir / transcript_stem(orchestrator_jsonl)
     subagents_dir = session_dir / "subagents"
     if subagents_dir.is_dir():
-        subagent_files = list(subagents_dir.glob("agent-*.jsonl"))
-        subagent_files.sort(key=get_start_timestamp)
-        transcripts.extend(subagent_files)
+        subagent_files = list_transcripts(subagents_dir, "agent-")
+        timestamps = [
+            h.get("timestamp", "")
+            for h in probe_headers(subagent_files, jobs, probe_bytes)
+        ]
+        order = sorted(
+            range(len(subagent_files)), key=lambda i: timestamps[i]
+        )
+        transcripts.extend(subagent_files[i] for i in order)
 
     return transcripts
 
 
+def session_subtree(
+    project_dir: Path,
+    session_jsonl: Path,
+    node: dict,
+    depth: int,
+    max_depth: int | None,
+    jobs: int = 1,
+    probe_bytes: int = HEADER_PROBE_BYTES,
+) -> None:
+    """Attach a session's subagents under `node`, nested by spawner.
+
+    Every transcript in the session is read once by
+    build_agent_label_map; an agent spawned by a Task call in another
+    subagent's transcript is placed under that subagent rather than
+    the session. `node` is at `depth`; nothing deeper than
+    `max_depth` is attached.
+    """
+    if max_depth is not None and depth >= max_depth:
+        return
+    transcripts = collect_transcripts(
+        project_dir, session_jsonl, jobs, probe_bytes
+    )
+    label_maps = parallel_map(
+        build_agent_label_map, transcripts, jobs, processes=True
+    )
+    agent_ids = [
+        transcript_stem(t).removeprefix("agent-") for t in transcripts
+    ]
+    index = {agent_id: i for i, agent_id in enumerate(agent_ids)}
+    index.pop(agent_ids[0], None)
+
+    # parent[i] is the transcript whose Task call spawned transcript i.
+    parent = [0] * len(transcripts)
+    for i, label_map in enumerate(label_maps):
+        for agent_id in label_map:
+            child = index.get(agent_id)
+            if child is not None and child != i:
+                parent[child] = i
+    labels = [""] * len(transcripts)
+    for i in range(1, len(transcripts)):
+        labels[i] = label_maps[parent[i]].get(agent_ids[i], agent_ids[i])
+
+    # Agents whose spawn chain loops (a corrupt transcript) hang off
+    # the session itself.
+    for i in range(1, len(transcripts)):
+        seen = {i}
+        p = parent[i]
+        while p != 0:
+            if p in seen:
+                parent[i] = 0
+                break
+            seen.add(p)
+            p = parent[p]
+
+    nodes = {0: node}
+    depths = {0: depth}
+
+    def attach(i: int) -> dict | None:
+        if i in nodes:
+            return nodes[i]
+        up = attach(parent[i])
+        if up is None:
+            return None
+        d = depths[parent[i]] + 1
+        if max_depth is not None and d > max_depth:
+            return None
+        child = {
+            "label": labels[i],
+            "full_label": labels[i] if up is node and depth == 0
+            else f"{up['full_label']} > {labels[i]}",
+            "path": transcripts[i],
+            "children": [],
+        }
+        up["children"].append(child)
+        nodes[i] = child
+        depths[i] = d
+        return child
+
+    for i in range(1, len(transcripts)):
+        attach(i)
+
+
+def build_hierarchy(
+    enact_id: str,
+    project_dir: Path,
+    orchestrator_jsonl: Path,
+    team_members: list[tuple[Path, str, str]],
+    max_depth: int | None = None,
+    jobs: int = 1,
+    probe_bytes: int = HEADER_PROBE_BYTES,
+) -> dict:
+    """Build the full agent tree of an enact session.
+
+    The orchestrator is the root. Beneath it are its subagents
+    (nested by which agent spawned them) and one node per team, whose
+    members carry their own subagents. Nodes are dicts with `label`,
+    `full_label` (as used in --timeline), `path` (None for team
+    groupings) and `children`; none deeper than `max_depth` are built.
+    """
+    root = {
+        "label": "Orchestrator",
+        "full_label": "Orchestrator",
+        "path": orchestrator_jsonl,
+        "children": [],
+    }
+    session_subtree(
+        project_dir, orchestrator_jsonl, root, 0, max_depth,
+        jobs, probe_bytes,
+    )
+    if max_depth is not None and max_depth < 1:
+        return root
+
+    teams: dict[str, dict] = {}
+    for path, team_name, agent_name in team_members:
+        short_team = team_name.removeprefix(f"{enact_id}-")
+        if short_team not in teams:
+            teams[short_team] = {
+                "label": f"Team: {short_team}",
+                "full_label": f"Team: {short_team}",
+                "path": None,
+                "children": [],
+            }
+            root["children"].append(teams[short_team])
+        if max_depth is not None and max_depth < 2:
+            continue
+        member = {
+            "label": agent_name,
+            "full_label": format_team_label(team_name, agent_name, enact_id),
+            "path": path,
+            "children": [],
+        }
+        teams[short_team]["children"].append(member)
+        session_subtree(
+            path.parent, path, member, 2, max_depth, jobs, probe_bytes,
+        )
+    return root
+
+
+def flatten_hierarchy(node: dict) -> list[tuple[Path, str]]:
+    """Return (path, full_label) for every transcript in the tree,
+    depth first."""
+    out = []
+    if node["path"] is not None:
+        out.append((node["path"], node["full_label"]))
+    for child in node["children"]:
+        out.extend(flatten_hierarchy(child))
+    return out
+
+
+def print_tree(
+    node: dict, prefix: str = "", last: bool = True, top: bool = True
+) -> None:
+    """Print the agent tree with box-drawing connectors, each label
+    followed by its transcript path."""
+    if top:
+        print(node["label"])
+        child_prefix = ""
+    else:
+        print(f"{prefix}{'└── ' if last else '├── '}{node['label']}")
+        child_prefix = prefix + ("    " if last else "│   ")
+    children = node["children"]
+    if node["path"] is not None:
+        bar = "│ " if children else "  "
+        print(f"{child_prefix}{bar}{node['path']}")
+    for i, child in enumerate(children):
+        print_tree(child, child_prefix, i == len(children) - 1, False)
+
+
+# Buffer size for the copyfileobj fallback in cat_transcript.
+COPY_CHUNK = 1 << 20
+
+
+def stdout_fd() -> int | None:
+    """Return stdout's file descriptor, or None if it has none."""
+    try:
+        return sys.stdout.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
 def cat_transcript(transcript_path: Path) -> None:
-    """Output the raw contents of a transcript to stdout."""
+    """Output the raw contents of a transcript to stdout.
+
+    Bytes are copied verbatim: with os.sendfile when stdout is a
+    file or pipe, else through stdout's binary buffer in large
+    chunks, else (stdout replaced by a text stream) decoded.
+    Compressed transcripts are decompressed as they are copied.
+    """
+    sys.stdout.flush()
     try:
-        with open(transcript_path) as f:
+        with open_transcript(transcript_path) as f:
+            out_fd = stdout_fd()
+            if (
+                out_fd is not None
+                and hasattr(os, "sendfile")
+                and not is_compressed(transcript_path)
+            ):
+                in_fd = f.fileno()
+                offset = 0
+                try:
+                    while True:
+                        sent = os.sendfile(out_fd, in_fd, offset, COPY_CHUNK)
+                        if sent == 0:
+                            return
+                        offset += sent
+                except OSError as e:
+                    if isinstance(e, BrokenPipeError):
+                        raise
+                    # sendfile is not supported for this pair of
+                    # descriptors; copy the rest another way.
+                    f.seek(offset)
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is not None:
+                shutil.copyfileobj(f, buffer, COPY_CHUNK)
+                buffer.flush()
+            else:
+                while chunk := f.read(COPY_CHUNK):
+                    sys.stdout.write(chunk.decode("utf-8", "replace"))
+    except BrokenPipeError:
+        raise
+    except READ_ERRORS as e:
+        print(f"Error reading {transcript_path}: {e}", file=sys.stderr)
+
+
+def timeline_entries(transcript_path: Path, label: bytes):
+    """Yield (timestamp, label, line) for each line of a transcript.
+
+    Lines without a timestamp (e.g. progress records) take the one
+    before them, so they stay next to their neighbours in the merge;
+    leading ones take the transcript's start timestamp.
+    """
+    last_ts = get_start_timestamp(transcript_path).encode("utf-8")
+    try:
+        with open_transcript(transcript_path) as f:
             for line in f:
-                sys.stdout.write(line)
-    except (OSError, UnicodeDecodeError) as e:
+                if b'"timestamp"' in line:
+                    try:
+                        d = loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        d = None
+                    if isinstance(d, dict) and isinstance(
+                        d.get("timestamp"), str
+                    ):
+                        last_ts = d["timestamp"].encode("utf-8")
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                yield last_ts, label, line
+    except READ_ERRORS as e:
         print(f"Error reading {transcript_path}: {e}", file=sys.stderr)
 
 
+def write_timeline(labelled: list[tuple[Path, str]]) -> None:
+    """Write every line of the labelled transcripts to stdout in
+    timestamp order, as `timestamp<TAB>label<TAB>json`.
+
+    Each transcript is already chronological, so a k-way heap merge
+    streams the result holding one pending line per transcript.
+    Ties keep the order transcripts were given in.
+    """
+    streams = [
+        timeline_entries(path, label.encode("utf-8"))
+        for path, label in labelled
+    ]
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    for ts, label, line in heapq.merge(*streams, key=lambda e: e[0]):
+        out.write(ts + b"\t" + label + b"\t" + line)
+    out.flush()
+
+
 def format_team_label(team_name: str, agent_name: str, enact_id: str) -> str:
     """Format a human-readable label for a team member.
 
@@ -252,75 +963,62 @@ def format_team_label(team_name: str, agent_name: str, enact_id: str) -> str:
     return f"[team: {short_team}] {agent_name}"
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Find and output all transcripts for an Enact session."
-    )
-    parser.add_argument(
-        "enact_id",
-        nargs="?",
-        default=None,
-        help="The enact session ID (defaults to most recent)",
-    )
-    parser.add_argument(
-        "--cat",
-        action="store_true",
-        help="Output transcript contents instead of paths",
-    )
-    parser.add_argument(
-        "--paths",
-        action="store_true",
-        help="Output bare paths only (no labels)",
+def output_hierarchy(
+    args,
+    enact_id: str,
+    project_dir: Path,
+    orchestrator_jsonl: Path,
+    team_members: list[tuple[Path, str, str]],
+    jobs: int = 1,
+) -> None:
+    """Print one enact session's full agent tree (--tree/--depth)."""
+    root = build_hierarchy(
+        enact_id, project_dir, orchestrator_jsonl, team_members,
+        args.depth, jobs, args.probe_bytes,
     )
-    args = parser.parse_args()
-
-    enact_id = args.enact_id
-    if enact_id is None:
-        enact_id = find_latest_enact_id()
-        if enact_id is None:
-            print(
-                "Error: No enact sessions found under ~/.enact/",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-
-    enact_dir = Path.home() / ".enact" / enact_id
-    if not enact_dir.is_dir():
-        print(
-            f"Error: Enact scratch directory not found: {enact_dir}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+    labelled = flatten_hierarchy(root)
+    print(f"Found {len(labelled)} transcripts", file=sys.stderr)
+    print(file=sys.stderr)
 
-    project_dirs = find_project_dirs()
-    if not project_dirs:
-        print(
-            "Error: No project directories found under ~/.claude/projects/",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+    if args.timeline:
+        write_timeline(labelled)
+    elif args.cat:
+        for t, _ in labelled:
+            print(f"=== {t} ===", file=sys.stderr)
+            cat_transcript(t)
+    elif args.paths:
+        for t, _ in labelled:
+            print(t)
+    else:
+        print_tree(root)
 
-    result = find_orchestrator_session(enact_id, project_dirs)
-    if result is None:
-        print(
-            "Error: No session transcript found "
-            f"containing enact ID '{enact_id}'",
-            file=sys.stderr,
-        )
-        sys.exit(1)
 
-    project_dir, orchestrator_jsonl = result
-    session_id = orchestrator_jsonl.stem
+def output_session(
+    args,
+    enact_id: str,
+    project_dir: Path,
+    orchestrator_jsonl: Path,
+    team_members: list[tuple[Path, str, str]],
+    jobs: int = 1,
+) -> None:
+    """Print one enact session's transcripts in the mode args selects."""
+    session_id = transcript_stem(orchestrator_jsonl)
 
     print(f"Enact ID: {enact_id}", file=sys.stderr)
     print(f"Session ID: {session_id}", file=sys.stderr)
     print(f"Project dir: {project_dir}", file=sys.stderr)
 
-    transcripts = collect_transcripts(project_dir, orchestrator_jsonl)
-    label_map = build_agent_label_map(orchestrator_jsonl)
-    team_members = find_team_member_sessions(
-        enact_id, project_dirs, orchestrator_jsonl
+    if args.tree or args.depth is not None:
+        output_hierarchy(
+            args, enact_id, project_dir, orchestrator_jsonl,
+            team_members, jobs,
+        )
+        return
+
+    transcripts = collect_transcripts(
+        project_dir, orchestrator_jsonl, jobs, args.probe_bytes
     )
+    label_map = build_agent_label_map(orchestrator_jsonl)
 
     # Build a label map for team member paths
     team_label_map: dict[str, str] = {}
@@ -343,7 +1041,14 @@ def main():
     )
     print(file=sys.stderr)
 
-    if args.cat:
+    if args.timeline:
+        labelled = [(transcripts[0], "Orchestrator")]
+        for t in transcripts[1:]:
+            agent_id = transcript_stem(t).removeprefix("agent-")
+            labelled.append((t, label_map.get(agent_id, agent_id)))
+        labelled.extend((t, team_label_map[str(t)]) for t in team_paths)
+        write_timeline(labelled)
+    elif args.cat:
         for t in all_transcripts:
             print(f"=== {t} ===", file=sys.stderr)
             cat_transcript(t)
@@ -356,7 +1061,7 @@ def main():
             if i == 0:
                 label = "Orchestrator"
             else:
-                agent_id = t.stem.removeprefix("agent-")
+                agent_id = transcript_stem(t).removeprefix("agent-")
                 label = label_map.get(agent_id, agent_id)
 
             if i > 0:
@@ -384,5 +1089,184 @@ def main():
                     print(f"  {path}")
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find and output all transcripts for Enact sessions."
+    )
+    parser.add_argument(
+        "enact_ids",
+        nargs="*",
+        metavar="enact_id",
+        help="Enact session IDs (defaults to most recent)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Every enact session under ~/.enact/",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="WHEN",
+        help="Enact sessions started at or after WHEN (epoch seconds"
+        " or ISO date/time); implies --all",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--cat",
+        action="store_true",
+        help="Output transcript contents instead of paths",
+    )
+    mode.add_argument(
+        "--paths",
+        action="store_true",
+        help="Output bare paths only (no labels)",
+    )
+    mode.add_argument(
+        "--timeline",
+        action="store_true",
+        help="Output every transcript line merged by timestamp,"
+        " tagged with its agent label",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Probe transcripts with N parallel workers (default 1)",
+    )
+    parser.add_argument(
+        "--tree",
+        action="store_true",
+        help="Show the full agent tree: subagents nested under the"
+        " agent that spawned them, and team members' own subagents",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        metavar="N",
+        help="Limit the agent tree to N levels below the orchestrator"
+        " (implies --tree; also limits --paths/--cat/--timeline)",
+    )
+    parser.add_argument(
+        "--probe-bytes",
+        type=int,
+        default=HEADER_PROBE_BYTES,
+        metavar="N",
+        help="Read at most N bytes of each transcript when probing"
+        " for timestamps and team names (default 1 MiB)",
+    )
+    parser.add_argument(
+        "--no-catalog",
+        action="store_true",
+        help="Scan transcripts directly instead of using the catalog",
+    )
+    args = parser.parse_args()
+
+    if args.enact_ids and (args.all or args.since):
+        print(
+            "Error: give enact IDs or --all/--since, not both",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    if args.all or args.since:
+        enact_ids = list_enact_ids()
+        if args.since:
+            try:
+                since = parse_since(args.since)
+            except ValueError:
+                print(
+                    f"Error: Invalid --since value: {args.since}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            enact_ids = [i for i in enact_ids if int(i) >= since]
+        if not enact_ids:
+            print(
+                "Error: No matching enact sessions under ~/.enact/",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    elif args.enact_ids:
+        enact_ids = list(dict.fromkeys(args.enact_ids))
+        for enact_id in enact_ids:
+            enact_dir = Path.home() / ".enact" / enact_id
+            if not enact_dir.is_dir():
+                print(
+                    f"Error: Enact scratch directory not found: {enact_dir}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+    else:
+        enact_id = find_latest_enact_id()
+        if enact_id is None:
+            print(
+                "Error: No enact sessions found under ~/.enact/",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        enact_ids = [enact_id]
+
+    project_dirs = find_project_dirs()
+    if not project_dirs:
+        print(
+            "Error: No project directories found under ~/.claude/projects/",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    if args.probe_bytes <= 0:
+        print("Error: --probe-bytes must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    if args.depth is not None and args.depth < 0:
+        print("Error: --depth must not be negative", file=sys.stderr)
+        sys.exit(1)
+
+    jobs = max(1, args.jobs)
+    catalog = None
+    if not args.no_catalog:
+        catalog = open_catalog(project_dirs, jobs)
+
+    sessions = find_orchestrator_sessions(
+        enact_ids, project_dirs, catalog, jobs
+    )
+    for enact_id in enact_ids:
+        if enact_id not in sessions:
+            level = "Error" if len(enact_ids) == 1 else "Warning"
+            print(
+                f"{level}: No session transcript found "
+                f"containing enact ID '{enact_id}'",
+                file=sys.stderr,
+            )
+    if not sessions:
+        sys.exit(1)
+
+    found_ids = [i for i in enact_ids if i in sessions]
+    team_members = find_team_members(
+        found_ids, project_dirs,
+        {i: sessions[i][1] for i in found_ids},
+        catalog, jobs, args.probe_bytes,
+    )
+
+    try:
+        for n, enact_id in enumerate(found_ids):
+            listing = not (args.cat or args.paths or args.timeline)
+            if len(found_ids) > 1 and listing:
+                if n > 0:
+                    print()
+                print(f"=== Enact ID: {enact_id} ===")
+            project_dir, orchestrator_jsonl = sessions[enact_id]
+            output_session(
+                args, enact_id, project_dir, orchestrator_jsonl,
+                team_members[enact_id], jobs,
+            )
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Summarize a Claude Code session transcript.
 
-Given a session ID or path to a .jsonl transcript, parses
+Given a session ID or path to a .jsonl transcript (optionally
+compressed as .jsonl.gz or .jsonl.xz), parses
 the transcript and prints a detailed markdown summary to
 STDOUT including: the initial prompt, thinking process,
 tool calls and their results, files modified, and the
@@ -11,11 +12,28 @@ Usage:
     summarize-session.py <session_id>
     summarize-session.py <path/to/agent.jsonl>
     summarize-session.py --latest
+    summarize-session.py --enact <enact_id> [--jobs N] [--output-dir DIR]
+
+--enact finds every transcript of an enact session once, as
+enact-transcripts.py --tree does, and summarizes them in parallel
+worker processes.
+
+Progress is cached in ~/.enact/summary-cache.sqlite (see
+summary_cache.py), so summarizing a transcript again only parses
+what was appended since; --no-cache starts from scratch.
 """
 
 import argparse
+import contextlib
+import importlib.util
 import json
+import os
+import shutil
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from summarize_formatters import (
@@ -23,6 +41,28 @@ from summarize_formatters import (
     format_tool_input,
     format_tool_result,
 )
+from transcript_io import (
+    READ_ERRORS,
+    find_transcript_file,
+    list_transcripts,
+    loads,
+    open_transcript,
+    record_type,
+    transcript_stem,
+)
+
+try:
+    from summary_cache import SummaryCache
+    from transcript_catalog import TranscriptCatalog
+except ImportError:  # Python built without sqlite3
+    SummaryCache = None
+    TranscriptCatalog = None
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Identifies the state and output of SummaryRenderer in the summary
+# cache; bump it whenever either changes.
+SUMMARY_CACHE_VERSION = "1"
 
 
 def find_project_dirs() -> list[Path]:
@@ -40,8 +80,8 @@ def find_transcript_by_session_id(
 ) -> Path | None:
     """Find a transcript .jsonl file by session UUID."""
     for project_dir in find_project_dirs():
-        candidate = project_dir / f"{session_id}.jsonl"
-        if candidate.is_file():
+        candidate = find_transcript_file(project_dir, session_id)
+        if candidate is not None:
             return candidate
     return None
 
@@ -58,10 +98,10 @@ def find_transcript_by_agent_id(
             subagents = session_dir / "subagents"
             if not subagents.is_dir():
                 continue
-            candidate = (
-                subagents / f"agent-{agent_id}.jsonl"
+            candidate = find_transcript_file(
+                subagents, f"agent-{agent_id}"
             )
-            if candidate.is_file():
+            if candidate is not None:
                 return candidate
     return None
 
@@ -81,12 +121,12 @@ def find_transcript_by_team_ref(
     team_part, agent_part = team_ref.rsplit("/", 1)
 
     for project_dir in find_project_dirs():
-        for jsonl_file in project_dir.glob("*.jsonl"):
+        for jsonl_file in list_transcripts(project_dir):
             try:
-                with open(jsonl_file) as f:
+                with open_transcript(jsonl_file) as f:
                     for line in f:
                         try:
-                            d = json.loads(line)
+                            d = loads(line)
                         except json.JSONDecodeError:
                             continue
                         team = d.get("teamName", "")
@@ -103,7 +143,7 @@ def find_transcript_by_team_ref(
                         ):
                             return jsonl_file
                         break
-            except (OSError, UnicodeDecodeError):
+            except (*READ_ERRORS, UnicodeDecodeError):
                 continue
     return None
 
@@ -113,7 +153,7 @@ def find_latest_transcript() -> Path | None:
     latest = None
     latest_mtime = 0
     for project_dir in find_project_dirs():
-        for jsonl_file in project_dir.glob("*.jsonl"):
+        for jsonl_file in list_transcripts(project_dir):
             mtime = jsonl_file.stat().st_mtime
             if mtime > latest_mtime:
                 latest_mtime = mtime
@@ -121,7 +161,100 @@ def find_latest_transcript() -> Path | None:
     return latest
 
 
-def resolve_transcript(identifier: str) -> Path | None:
+class AmbiguousIdentifier(Exception):
+    """An abbreviated ID matched more than one transcript."""
+
+    def __init__(self, identifier: str, matches: list[Path]):
+        super().__init__(identifier)
+        self.identifier = identifier
+        self.matches = matches
+
+
+def open_transcript_catalog():
+    """Open the transcript catalog used by enact-transcripts.py
+    without refreshing it, or return None (with a warning) if it is
+    unavailable."""
+    if TranscriptCatalog is None:
+        return None
+    try:
+        return TranscriptCatalog()
+    except Exception as e:  # sqlite3 errors, unwritable ~/.enact, ...
+        print(
+            f"Warning: transcript catalog unavailable ({e});"
+            " scanning transcripts directly",
+            file=sys.stderr,
+        )
+        return None
+
+
+def refresh_transcript_catalog(catalog, jobs: int = 1) -> None:
+    """Bring the transcript catalog up to date, as
+    enact-transcripts.py does, warning if that fails."""
+    et = load_enact_transcripts()
+    try:
+        catalog.refresh(
+            et.find_project_dirs(),
+            map_fn=partial(et.parallel_map, jobs=jobs, processes=True),
+        )
+    except Exception as e:  # sqlite3 errors, e.g. a locked database
+        print(
+            f"Warning: could not refresh the transcript catalog ({e})",
+            file=sys.stderr,
+        )
+
+
+def resolve_in_catalog(
+    identifier: str, catalog, jobs: int = 1
+) -> Path | None:
+    """Resolve an agent ID, team reference or abbreviated session
+    or agent ID through the transcript catalog's indexes.
+
+    An agent ID already in the catalog, whose transcript still
+    exists under ~/.claude/projects/, is returned without refreshing
+    the catalog; anything else is looked up after a refresh. A team
+    reference matching several sessions (the same team and agent
+    name in different enact sessions) resolves to the one that
+    started last. Raises AmbiguousIdentifier if an abbreviated ID
+    matches more than one transcript.
+    """
+    agent_id = identifier.removeprefix("agent-")
+    projects_dir = Path.home() / ".claude" / "projects"
+    for found_id, path in catalog.agents_by_id(agent_id):
+        if (
+            found_id == agent_id
+            and path.is_relative_to(projects_dir)
+            and path.exists()
+        ):
+            return path
+
+    refresh_transcript_catalog(catalog, jobs)
+    agents = catalog.agents_by_id(agent_id)
+    for found_id, path in agents:
+        if found_id == agent_id:
+            return path
+
+    if "/" in identifier:
+        team_part, agent_part = identifier.rsplit("/", 1)
+        members = [
+            (timestamp, str(path), path)
+            for path, team, timestamp
+            in catalog.sessions_by_agent_name(agent_part)
+            if team == team_part or team.endswith(f"-{team_part}")
+        ]
+        if members:
+            return max(members)[2]
+        return None
+
+    matches = [path for _, path in catalog.sessions_by_id(identifier)]
+    matches += [path for _, path in agents]
+    if len(matches) > 1:
+        raise AmbiguousIdentifier(identifier, matches)
+    return matches[0] if matches else None
+
+
+def resolve_transcript(
+    identifier: str, catalog=None, jobs: int = 1
+) -> Path | None:
     """Resolve an identifier to a transcript path.
 
     Tries in order:
@@ -129,6 +262,11 @@ def resolve_transcript(identifier: str) -> Path | None:
     2. Session UUID
     3. Agent ID (with or without 'agent-' prefix)
     4. Team reference (team-name/agent-name)
+    5. With a catalog, a unique prefix of a session UUID or agent ID
+
+    With a TranscriptCatalog, steps 3-5 are index lookups (see
+    resolve_in_catalog); without one, steps 3 and 4 scan the
+    projects tree.
     """
     p = Path(identifier)
     if p.is_file():
@@ -138,6 +276,9 @@ def resolve_transcript(identifier: str) -> Path | None:
     if result:
         return result
 
+    if catalog is not None:
+        return resolve_in_catalog(identifier, catalog, jobs)
+
     result = find_transcript_by_agent_id(identifier)
     if result:
         return result
@@ -149,58 +290,225 @@ def resolve_transcript(identifier: str) -> Path | None:
     return None
 
 
-def parse_transcript(path: Path) -> list[dict]:
-    """Parse a .jsonl transcript into JSON objects."""
-    entries = []
-    with open(path) as f:
+# Record types the summary renders; others only feed the header.
+SUMMARY_TYPES = frozenset({"user", "assistant"})
+
+# Header fields that any record type may supply, with the bytes that
+# must appear in a record for it to supply them.
+HEADER_NEEDLES = {
+    "sessionId": b'"sessionId"',
+    "cwd": b'"cwd"',
+    "version": b'"version"',
+    "teamName": b'"teamName"',
+    "agentName": b'"agentName"',
+    "timestamp": b'"timestamp"',
+}
+
+
+class SkippedRecord(dict):
+    """Stand-in for a record iter_transcript did not decode.
+
+    Behaves as a record with only a "type"; `raw` holds the line.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, record_type: str, raw: bytes):
+        super().__init__(type=record_type)
+        self.raw = raw
+
+
+def decode_line(line: bytes):
+    """Decode one stripped transcript line, or return None if it is
+    not JSON."""
+    try:
+        return loads(line)
+    except json.JSONDecodeError:
+        pass
+    # Matches how lines were read before: as text, with any Unicode
+    # whitespace stripped.
+    try:
+        return json.loads(line.decode("utf-8").strip())
+    except json.JSONDecodeError:
+        return None
+
+
+def iter_transcript(
+    path: Path,
+    keep_types=None,
+    start: int = 0,
+    header_keys: set[str] | None = None,
+    progress: dict | None = None,
+):
+    """Yield the JSON objects of a .jsonl transcript one at a time.
+
+    With `keep_types`, a record whose top-level type can be read from
+    the raw line and is not in keep_types is yielded as a
+    SkippedRecord without being decoded, unless it may hold a header
+    field no kept record has supplied yet.
+
+    To resume an earlier read, pass the byte offset it reached as
+    `start` and the `header_keys` (HEADER_NEEDLES keys) it left
+    unresolved; a set passed as header_keys is updated in place.
+    With a `progress` dict, reading stops before a final line with
+    no newline (one still being written), setting progress["offset"]
+    to the offset just past the last complete line and
+    progress["partial"] to whether such a line was left.
+    """
+    if header_keys is None:
+        header_keys = set(HEADER_NEEDLES)
+    needles = tuple(HEADER_NEEDLES[k] for k in header_keys)
+    offset = start
+    partial = False
+    with open_transcript(path) as f:
+        if start:
+            f.seek(start)
         for line in f:
+            if progress is not None:
+                if not line.endswith(b"\n"):
+                    partial = True
+                    break
+                offset += len(line)
             line = line.strip()
             if not line:
                 continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
+            if keep_types is not None:
+                rtype = record_type(line)
+                if rtype is not None and rtype not in keep_types:
+                    for needle in needles:
+                        if needle in line:
+                            break
+                    else:
+                        yield SkippedRecord(rtype, line)
+                        continue
+            entry = decode_line(line)
+            if entry is None:
                 continue
-    return entries
+            if (
+                needles
+                and isinstance(entry, dict)
+                and entry.get("type") != "assistant"
+            ):
+                # Only assistant records are ever deduplicated away,
+                # so any other record's header fields are final.
+                resolved = [k for k in header_keys if entry.get(k)]
+                if resolved:
+                    header_keys.difference_update(resolved)
+                    needles = tuple(
+                        HEADER_NEEDLES[k] for k in header_keys
+                    )
+            yield entry
+    if progress is not None:
+        progress["offset"] = offset
+        progress["partial"] = partial
 
 
-def deduplicate_assistant_messages(
-    entries: list[dict],
-) -> list[dict]:
-    """Deduplicate streamed assistant messages.
+def parse_transcript(path: Path) -> list[dict]:
+    """Parse a .jsonl transcript into JSON objects."""
+    return list(iter_transcript(path))
+
+
+def _assistant_message_id(entry: dict) -> str:
+    """Return an assistant entry's message ID, or "" for other
+    entries and assistant entries without one."""
+    if entry.get("type") == "assistant" and "message" in entry:
+        return entry["message"].get("id", "")
+    return ""
+
+
+class NonAdjacentChunks(Exception):
+    """A streamed assistant message's chunks were not adjacent."""
+
 
-    Keeps only the last occurrence for each message ID.
-    Returns entries in original order with earlier
-    duplicates removed.
+class AdjacentDeduplicator:
+    """Deduplicate streamed assistant messages one entry at a time.
+
+    Keeps only the last chunk of each message ID, holding back one
+    assistant entry until the next entry shows whether another chunk
+    of the same message follows. Raises NonAdjacentChunks if a
+    message's chunks turn out not to be adjacent, since an earlier
+    chunk has then already been passed on.
     """
-    last_index: dict[str, int] = {}
+
+    def __init__(self):
+        self.flushed: set[str] = set()
+        self.pending = None
+        self.pending_id = ""
+
+    def push(self, entry) -> list:
+        """Take the next entry; return the entries now final."""
+        msg_id = _assistant_message_id(entry)
+        if msg_id and msg_id == self.pending_id:
+            self.pending = entry
+            return []
+        out = self.flush()
+        if msg_id:
+            if msg_id in self.flushed:
+                raise NonAdjacentChunks(msg_id)
+            self.pending = entry
+            self.pending_id = msg_id
+        else:
+            out.append(entry)
+        return out
+
+    def flush(self) -> list:
+        """Return the held-back entry, if any, as final."""
+        if self.pending is None:
+            return []
+        self.flushed.add(self.pending_id)
+        out = [self.pending]
+        self.pending = None
+        self.pending_id = ""
+        return out
+
+    def to_state(self) -> dict:
+        return {
+            "flushed": list(self.flushed),
+            "pending": self.pending,
+            "pending_id": self.pending_id,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "AdjacentDeduplicator":
+        dedup = cls()
+        dedup.flushed = set(state["flushed"])
+        dedup.pending = state["pending"]
+        dedup.pending_id = state["pending_id"]
+        return dedup
+
+
+def deduplicate_adjacent(entries):
+    """Deduplicate streamed assistant messages, streaming; see
+    AdjacentDeduplicator."""
+    dedup = AdjacentDeduplicator()
+    for entry in entries:
+        yield from dedup.push(entry)
+    yield from dedup.flush()
+
+
+def deduplicate_indexed(entries, last_index: dict[str, int]):
+    """Deduplicate streamed assistant messages given the index of
+    each message ID's last chunk, as from last_chunk_index."""
     for i, entry in enumerate(entries):
-        if (
-            entry.get("type") == "assistant"
-            and "message" in entry
-        ):
-            msg_id = entry["message"].get("id", "")
-            if msg_id:
-                last_index[msg_id] = i
+        msg_id = _assistant_message_id(entry)
+        if msg_id and last_index[msg_id] != i:
+            continue
+        yield entry
 
-    last_indices = set(last_index.values())
 
-    result = []
+def last_chunk_index(entries) -> dict[str, int]:
+    """Map each assistant message ID to the index of its last
+    chunk in entries."""
+    last_index: dict[str, int] = {}
     for i, entry in enumerate(entries):
-        if (
-            entry.get("type") == "assistant"
-            and "message" in entry
-        ):
-            msg_id = entry["message"].get("id", "")
-            if msg_id and i not in last_indices:
-                continue
-        result.append(entry)
-    return result
+        msg_id = _assistant_message_id(entry)
+        if msg_id:
+            last_index[msg_id] = i
+    return last_index
 
 
-def _extract_metadata(entries: list[dict]) -> dict:
-    """Extract session metadata from transcript."""
-    meta = {
+def _new_metadata() -> dict:
+    return {
         "session_id": "",
         "cwd": "",
         "version": "",
@@ -210,36 +518,38 @@ def _extract_metadata(entries: list[dict]) -> dict:
         "team_name": "",
         "agent_name": "",
     }
-    for entry in entries:
-        if "sessionId" in entry and not meta["session_id"]:
-            meta["session_id"] = entry["sessionId"]
-        if "cwd" in entry and not meta["cwd"]:
-            meta["cwd"] = entry["cwd"]
-        if "version" in entry and not meta["version"]:
-            meta["version"] = entry["version"]
-        if "teamName" in entry and not meta["team_name"]:
-            meta["team_name"] = entry["teamName"]
-        if (
-            "agentName" in entry
-            and not meta["agent_name"]
-        ):
-            meta["agent_name"] = entry["agentName"]
-        if "timestamp" in entry:
-            if not meta["timestamp_start"]:
-                meta["timestamp_start"] = (
-                    entry["timestamp"]
-                )
-            meta["timestamp_end"] = entry["timestamp"]
-        if (
-            entry.get("type") == "assistant"
-            and not meta["model"]
-        ):
-            m = (
-                entry.get("message", {}).get("model", "")
+
+
+def _update_metadata(meta: dict, entry: dict) -> None:
+    """Fold one transcript entry into session metadata."""
+    if "sessionId" in entry and not meta["session_id"]:
+        meta["session_id"] = entry["sessionId"]
+    if "cwd" in entry and not meta["cwd"]:
+        meta["cwd"] = entry["cwd"]
+    if "version" in entry and not meta["version"]:
+        meta["version"] = entry["version"]
+    if "teamName" in entry and not meta["team_name"]:
+        meta["team_name"] = entry["teamName"]
+    if (
+        "agentName" in entry
+        and not meta["agent_name"]
+    ):
+        meta["agent_name"] = entry["agentName"]
+    if "timestamp" in entry:
+        if not meta["timestamp_start"]:
+            meta["timestamp_start"] = (
+                entry["timestamp"]
             )
-            if m:
-                meta["model"] = m
-    return meta
+        meta["timestamp_end"] = entry["timestamp"]
+    if (
+        entry.get("type") == "assistant"
+        and not meta["model"]
+    ):
+        m = (
+            entry.get("message", {}).get("model", "")
+        )
+        if m:
+            meta["model"] = m
 
 
 def _print_header(path: Path, meta: dict) -> None:
@@ -249,7 +559,7 @@ def _print_header(path: Path, meta: dict) -> None:
     if meta["session_id"]:
         print(f"- **Session**: `{meta['session_id']}`")
     if path.name.startswith("agent-"):
-        agent_id = path.stem.removeprefix("agent-")
+        agent_id = transcript_stem(path).removeprefix("agent-")
         print(f"- **Agent ID**: `{agent_id}`")
     if meta["team_name"]:
         print(f"- **Team**: {meta['team_name']}")
@@ -278,7 +588,7 @@ def _print_header(path: Path, meta: dict) -> None:
 def _process_user_entry(
     entry: dict,
     turn_number: int,
-    tool_call_map: dict,
+    tool_calls: set,
 ) -> int:
     """Process a user entry, return updated turn_number."""
     msg = entry.get("message", {})
@@ -302,7 +612,7 @@ def _process_user_entry(
             if c.get("type") != "tool_result":
                 continue
             tool_use_id = c.get("tool_use_id", "")
-            if tool_call_map.get(tool_use_id):
+            if tool_use_id in tool_calls:
                 result_text = format_tool_result(entry)
                 print(f"  - **Result**: {result_text}")
                 print()
@@ -312,7 +622,7 @@ def _process_user_entry(
 
 def _process_assistant_entry(
     entry: dict,
-    tool_call_map: dict,
+    tool_calls: set,
     files_modified: set,
     tools_used: dict,
 ) -> None:
@@ -358,10 +668,7 @@ def _process_assistant_entry(
             tools_used[tool_name] = (
                 tools_used.get(tool_name, 0) + 1
             )
-            tool_call_map[tool_id] = {
-                "name": tool_name,
-                "input": inp,
-            }
+            tool_calls.add(tool_id)
 
             if tool_name in ("Edit", "Write"):
                 fp = inp.get("file_path", "")
@@ -374,58 +681,464 @@ def _process_assistant_entry(
             print(f"- **{tool_name}**: {formatted}")
 
 
-def summarize_transcript(path: Path) -> None:
-    """Parse and print a summary of a transcript."""
-    entries = parse_transcript(path)
-    if not entries:
-        print("(empty transcript)")
-        return
+# How many undecoded records that may carry the final timestamp are
+# kept for SummaryRenderer to decode at the end.
+SKIPPED_TAIL = 64
+
 
-    entries = deduplicate_assistant_messages(entries)
-    meta = _extract_metadata(entries)
-    _print_header(path, meta)
+def _last_timestamp(path: Path, default):
+    """Return the last timestamp among a transcript's deduplicated
+    entries, decoding every record, or `default` if there is none."""
+    last_index = last_chunk_index(iter_transcript(path))
+    timestamp = default
+    for entry in deduplicate_indexed(iter_transcript(path), last_index):
+        if "timestamp" in entry:
+            timestamp = entry["timestamp"]
+    return timestamp
 
-    turn_number = 0
-    tool_call_map: dict[str, dict] = {}
-    files_modified: set[str] = set()
-    tools_used: dict[str, int] = {}
 
-    for entry in entries:
+class SummaryRenderer:
+    """Render deduplicated transcript entries into a summary.
+
+    render() prints each entry's part of the summary body while the
+    header metadata and statistics accumulate. The state can be saved
+    with to_state() and restored with from_state() to carry on where
+    an earlier run stopped.
+
+    The header's end timestamp comes from the last record with one,
+    which may be a SkippedRecord. The last SKIPPED_TAIL skipped
+    records that may carry it are decoded at the end; if none does
+    and older ones were dropped, the transcript is read again.
+    """
+
+    def __init__(self):
+        self.meta = _new_metadata()
+        self.turn_number = 0
+        self.tool_calls: set[str] = set()
+        self.files_modified: set[str] = set()
+        self.tools_used: dict[str, int] = {}
+        self.seen_any = False
+        self.skipped_tail: deque[bytes] = deque(maxlen=SKIPPED_TAIL)
+        self.dropped_tail = False
+
+    def render(self, entry) -> None:
+        """Print the summary body for one entry."""
+        if isinstance(entry, SkippedRecord):
+            if not self.seen_any:
+                self.seen_any = decode_line(entry.raw) is not None
+            if b'"timestamp"' in entry.raw:
+                if len(self.skipped_tail) == SKIPPED_TAIL:
+                    self.dropped_tail = True
+                self.skipped_tail.append(entry.raw)
+            return
+        self.seen_any = True
+        _update_metadata(self.meta, entry)
+        if "timestamp" in entry:
+            self.skipped_tail.clear()
+            self.dropped_tail = False
         entry_type = entry.get("type")
         if entry_type == "user":
-            turn_number = _process_user_entry(
-                entry, turn_number, tool_call_map,
+            self.turn_number = _process_user_entry(
+                entry, self.turn_number, self.tool_calls,
             )
         elif entry_type == "assistant":
             _process_assistant_entry(
                 entry,
-                tool_call_map,
-                files_modified,
-                tools_used,
+                self.tool_calls,
+                self.files_modified,
+                self.tools_used,
             )
 
-    print()
-    print("---")
-    print()
-    print("## Summary Statistics")
-    print()
-    print(f"- **Turns**: {turn_number}")
-    if tools_used:
-        total = sum(tools_used.values())
-        print(f"- **Total Tool Calls**: {total}")
-        tool_summary = ", ".join(
-            f"{name} ({count})"
-            for name, count in sorted(
-                tools_used.items(),
-                key=lambda x: -x[1],
+    def print_summary(self, path: Path, body) -> None:
+        """Print the header, the body rendered so far (a file
+        positioned at its start) and the statistics footer."""
+        if not self.seen_any:
+            print("(empty transcript)")
+            return
+
+        meta = dict(self.meta)
+        for raw in reversed(self.skipped_tail):
+            d = decode_line(raw)
+            if isinstance(d, dict) and "timestamp" in d:
+                meta["timestamp_end"] = d["timestamp"]
+                break
+        else:
+            if self.dropped_tail:
+                meta["timestamp_end"] = _last_timestamp(
+                    path, meta["timestamp_end"]
+                )
+
+        _print_header(path, meta)
+        shutil.copyfileobj(body, sys.stdout)
+
+        print()
+        print("---")
+        print()
+        print("## Summary Statistics")
+        print()
+        print(f"- **Turns**: {self.turn_number}")
+        if self.tools_used:
+            total = sum(self.tools_used.values())
+            print(f"- **Total Tool Calls**: {total}")
+            tool_summary = ", ".join(
+                f"{name} ({count})"
+                for name, count in sorted(
+                    self.tools_used.items(),
+                    key=lambda x: -x[1],
+                )
             )
+            print(f"- **Tools Used**: {tool_summary}")
+        if self.files_modified:
+            n = len(self.files_modified)
+            print(f"- **Files Modified**: {n}")
+            for fp in sorted(self.files_modified):
+                print(f"  - `{fp}`")
+
+    def to_state(self) -> dict:
+        """Return the renderer's state as JSON-compatible data."""
+        return {
+            "meta": self.meta,
+            "turn_number": self.turn_number,
+            "tool_calls": list(self.tool_calls),
+            "files_modified": list(self.files_modified),
+            # Pairs rather than an object: keeps insertion order,
+            # which breaks ties in the footer, and non-string names.
+            "tools_used": list(self.tools_used.items()),
+            "seen_any": self.seen_any,
+            "skipped_tail": [
+                raw.decode("utf-8", "surrogateescape")
+                for raw in self.skipped_tail
+            ],
+            "dropped_tail": self.dropped_tail,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "SummaryRenderer":
+        renderer = cls()
+        renderer.meta = state["meta"]
+        renderer.turn_number = state["turn_number"]
+        renderer.tool_calls = set(state["tool_calls"])
+        renderer.files_modified = set(state["files_modified"])
+        renderer.tools_used = dict(state["tools_used"])
+        renderer.seen_any = state["seen_any"]
+        renderer.skipped_tail.extend(
+            raw.encode("utf-8", "surrogateescape")
+            for raw in state["skipped_tail"]
+        )
+        renderer.dropped_tail = state["dropped_tail"]
+        return renderer
+
+
+# Summary body output is held in memory up to this size before the
+# spool moves to a temporary file.
+SPOOL_MAX_MEMORY = 8 << 20
+
+
+def _spool():
+    return tempfile.SpooledTemporaryFile(
+        max_size=SPOOL_MAX_MEMORY, mode="w+", encoding="utf-8",
+    )
+
+
+def summarize_transcript(path: Path, cache=None) -> None:
+    """Parse and print a summary of a transcript.
+
+    Entries are streamed rather than loaded: the body is rendered in
+    one pass into a spool while the header metadata accumulates, then
+    header and body are printed. Streamed chunks of an assistant
+    message are assumed adjacent; if they are not, the transcript is
+    indexed first and rendered again. Record types the summary does
+    not render are not decoded unless the header needs them.
+
+    With a SummaryCache, rendering resumes from the state cached by
+    an earlier run, so only bytes appended since are parsed.
+    """
+    try:
+        if cache is not None:
+            _summarize_cached(path, cache)
+        else:
+            _render_summary(
+                path,
+                deduplicate_adjacent(iter_transcript(path, SUMMARY_TYPES)),
+            )
+        return
+    except NonAdjacentChunks:
+        if cache is not None:
+            cache.discard(path)
+    last_index = last_chunk_index(iter_transcript(path, SUMMARY_TYPES))
+    _render_summary(
+        path,
+        deduplicate_indexed(
+            iter_transcript(path, SUMMARY_TYPES), last_index
+        ),
+    )
+
+
+def _render_summary(path: Path, entries) -> None:
+    """Print the summary of deduplicated transcript entries."""
+    renderer = SummaryRenderer()
+    with _spool() as body:
+        with contextlib.redirect_stdout(body):
+            for entry in entries:
+                renderer.render(entry)
+        body.seek(0)
+        renderer.print_summary(path, body)
+
+
+def _summarize_cached(path: Path, cache) -> None:
+    """Print a transcript's summary, resuming from and updating its
+    cache entry.
+
+    The cache is updated once every complete line has been rendered,
+    before a final line still being written and the held-back last
+    assistant entry are.
+    """
+    progress: dict = {}
+    with _spool() as body:
+        cached = cache.load(path, body)
+        if cached is None:
+            start = 0
+            renderer = SummaryRenderer()
+            dedup = AdjacentDeduplicator()
+            header_keys = set(HEADER_NEEDLES)
+        else:
+            start, state = cached
+            renderer = SummaryRenderer.from_state(state["renderer"])
+            dedup = AdjacentDeduplicator.from_state(state["dedup"])
+            header_keys = set(state["header_keys"])
+
+        with contextlib.redirect_stdout(body):
+            for entry in iter_transcript(
+                path, SUMMARY_TYPES, start, header_keys, progress
+            ):
+                for final in dedup.push(entry):
+                    renderer.render(final)
+
+            if progress["offset"] != start or cached is None:
+                body.seek(0)
+                cache.store(path, progress["offset"], {
+                    "renderer": renderer.to_state(),
+                    "dedup": dedup.to_state(),
+                    "header_keys": list(header_keys),
+                }, body)
+                body.seek(0, os.SEEK_END)
+
+            if progress["partial"]:
+                for entry in iter_transcript(
+                    path, SUMMARY_TYPES, progress["offset"], header_keys
+                ):
+                    for final in dedup.push(entry):
+                        renderer.render(final)
+            for final in dedup.flush():
+                renderer.render(final)
+        body.seek(0)
+        renderer.print_summary(path, body)
+
+
+def load_enact_transcripts():
+    """Import enact-transcripts.py, whose file name is not a valid
+    module name, for --enact.
+
+    It is registered in sys.modules so that the functions its
+    discovery sends to process-pool workers can be unpickled there.
+    """
+    name = "enact_transcripts"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            name, SCRIPTS_DIR / "enact-transcripts.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+# Workers started with spawn or forkserver (the default on macOS, and
+# on Linux from Python 3.14) re-import this script as __mp_main__, so
+# enact-transcripts must be loaded there as well.
+if __name__ == "__mp_main__":
+    load_enact_transcripts()
+
+
+def find_enact_transcripts(
+    enact_id: str, jobs: int, use_catalog: bool = True
+) -> list[tuple[Path, str]] | None:
+    """Return (path, agent label) for every transcript of an enact
+    session, orchestrator first, in enact-transcripts.py --tree
+    order; None if the orchestrator session is not found."""
+    et = load_enact_transcripts()
+    project_dirs = et.find_project_dirs()
+    catalog = et.open_catalog(project_dirs, jobs) if use_catalog else None
+    sessions = et.find_orchestrator_sessions(
+        [enact_id], project_dirs, catalog, jobs
+    )
+    if enact_id not in sessions:
+        return None
+    project_dir, orchestrator_jsonl = sessions[enact_id]
+    team_members = et.find_team_members(
+        [enact_id], project_dirs, {enact_id: orchestrator_jsonl},
+        catalog, jobs, et.HEADER_PROBE_BYTES,
+    )[enact_id]
+    root = et.build_hierarchy(
+        enact_id, project_dir, orchestrator_jsonl, team_members,
+        jobs=jobs,
+    )
+    return et.flatten_hierarchy(root)
+
+
+def open_summary_cache():
+    """Open the summary cache, or return None (with a warning) if it
+    is unavailable, in which case transcripts are summarized from
+    the start."""
+    if SummaryCache is None:
+        return None
+    try:
+        return SummaryCache(SUMMARY_CACHE_VERSION)
+    except Exception as e:  # sqlite3 errors, unwritable ~/.enact, ...
+        print(
+            f"Warning: summary cache unavailable ({e});"
+            " summarizing without it",
+            file=sys.stderr,
+        )
+        return None
+
+
+def _summarize_to_file(job: tuple[Path, Path, bool]) -> str | None:
+    """Write the summary of a (transcript, output path, use cache)
+    job.
+
+    Module-level so it can run in a process pool. Returns an error
+    message if the transcript could not be read, else None.
+    """
+    path, out_path, use_cache = job
+    cache = open_summary_cache() if use_cache else None
+    try:
+        with open(out_path, "w", encoding="utf-8") as f:
+            with contextlib.redirect_stdout(f):
+                summarize_transcript(path, cache)
+    except (*READ_ERRORS, UnicodeDecodeError) as e:
+        return str(e)
+    finally:
+        if cache is not None:
+            cache.close()
+    return None
+
+
+def summarize_transcripts(
+    jobs_list: list[tuple[Path, Path, bool]], jobs: int
+) -> list[str | None]:
+    """Run _summarize_to_file over jobs with up to `jobs` worker
+    processes, returning its results in input order.
+
+    Transcript sizes vary widely, so the largest are started first
+    and each worker takes one transcript at a time.
+    """
+    def size(job):
+        try:
+            return job[0].stat().st_size
+        except OSError:
+            return 0
+
+    order = sorted(range(len(jobs_list)), key=lambda i: -size(jobs_list[i]))
+    results: list[str | None] = [None] * len(jobs_list)
+    if jobs <= 1 or len(jobs_list) <= 1:
+        for i in order:
+            results[i] = _summarize_to_file(jobs_list[i])
+        return results
+    workers = min(jobs, len(jobs_list))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        done = pool.map(_summarize_to_file, [jobs_list[i] for i in order])
+        for i, result in zip(order, done):
+            results[i] = result
+    return results
+
+
+def summarize_enact_session(
+    enact_id: str,
+    jobs: int,
+    output_dir: Path | None,
+    use_cache: bool,
+    use_catalog: bool = True,
+) -> None:
+    """Summarize every transcript of an enact session (--enact).
+
+    With `output_dir`, writes one `<transcript name>.md` per agent
+    plus an index.md listing them; otherwise prints the summaries
+    one after another, each under a `=== <label> ===` line, in the
+    same order as the index.
+    """
+    labelled = find_enact_transcripts(enact_id, jobs, use_catalog)
+    if labelled is None:
+        print(
+            "Error: No session transcript found"
+            f" containing enact ID '{enact_id}'",
+            file=sys.stderr,
         )
-        print(f"- **Tools Used**: {tool_summary}")
-    if files_modified:
-        n = len(files_modified)
-        print(f"- **Files Modified**: {n}")
-        for fp in sorted(files_modified):
-            print(f"  - `{fp}`")
+        sys.exit(1)
+    print(f"Enact ID: {enact_id}", file=sys.stderr)
+    print(f"Found {len(labelled)} transcripts", file=sys.stderr)
+    print(file=sys.stderr)
+
+    with contextlib.ExitStack() as stack:
+        if output_dir is None:
+            target = Path(stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="summarize-session-")
+            ))
+        else:
+            target = output_dir
+            target.mkdir(parents=True, exist_ok=True)
+
+        names: list[str] = []
+        used: set[str] = set()
+        for path, _ in labelled:
+            name = f"{transcript_stem(path)}.md"
+            n = 2
+            while name in used:
+                name = f"{transcript_stem(path)}-{n}.md"
+                n += 1
+            used.add(name)
+            names.append(name)
+
+        errors = summarize_transcripts(
+            [
+                (path, target / name, use_cache)
+                for (path, _), name in zip(labelled, names)
+            ],
+            jobs,
+        )
+        for (path, _), error in zip(labelled, errors):
+            if error is not None:
+                print(
+                    f"Warning: Could not read {path}: {error}",
+                    file=sys.stderr,
+                )
+
+        if output_dir is not None:
+            with open(output_dir / "index.md", "w", encoding="utf-8") as f:
+                f.write(f"# Enact Session {enact_id}\n\n")
+                for (path, label), name, error in zip(
+                    labelled, names, errors
+                ):
+                    summary = (
+                        f"[{name}]({name})" if error is None
+                        else "(unreadable)"
+                    )
+                    f.write(f"- **{label}**: {summary} — `{path}`\n")
+            print(f"Wrote {output_dir / 'index.md'}", file=sys.stderr)
+            return
+
+        for n, ((path, label), name, error) in enumerate(
+            zip(labelled, names, errors)
+        ):
+            if n > 0:
+                print()
+            print(f"=== {label} ===")
+            print()
+            if error is not None:
+                print(f"(could not read `{path}`: {error})")
+                continue
+            with open(target / name, encoding="utf-8") as f:
+                shutil.copyfileobj(f, sys.stdout)
 
 
 def main():
@@ -449,8 +1162,57 @@ def main():
         action="store_true",
         help="Summarize the most recent session",
     )
+    parser.add_argument(
+        "--enact",
+        metavar="ENACT_ID",
+        help="Summarize every transcript of an enact session"
+        " (orchestrator, subagents and team members)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Use N worker processes to summarize (with --enact) and"
+        " to refresh the transcript catalog (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--no-catalog",
+        action="store_true",
+        help="Find transcripts by scanning instead of through the"
+        " transcript catalog",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Summarize from the start of each transcript instead of"
+        " resuming from the summary cache",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        metavar="DIR",
+        help="With --enact, write one summary file per agent and an"
+        " index.md to DIR instead of printing them all",
+    )
     args = parser.parse_args()
 
+    if args.enact is not None:
+        if args.latest or args.identifier is not None:
+            print(
+                "Error: --enact takes no identifier or --latest",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        summarize_enact_session(
+            args.enact, max(1, args.jobs), args.output_dir,
+            not args.no_cache, not args.no_catalog,
+        )
+        return
+    if args.output_dir is not None:
+        print("Error: --output-dir requires --enact", file=sys.stderr)
+        sys.exit(1)
+
     if args.latest or args.identifier is None:
         path = find_latest_transcript()
         if path is None:
@@ -461,7 +1223,23 @@ def main():
             )
             sys.exit(1)
     else:
-        path = resolve_transcript(args.identifier)
+        catalog = None if args.no_catalog else open_transcript_catalog()
+        try:
+            path = resolve_transcript(
+                args.identifier, catalog, max(1, args.jobs)
+            )
+        except AmbiguousIdentifier as e:
+            print(
+                f"Error: '{e.identifier}' matches"
+                f" {len(e.matches)} transcripts:",
+                file=sys.stderr,
+            )
+            for match in e.matches:
+                print(f"  {match}", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            if catalog is not None:
+                catalog.close()
         if path is None:
             print(
                 "Error: Could not find transcript"
@@ -469,7 +1247,8 @@ def main():
                 file=sys.stderr,
             )
             print(
-                "Provide a session UUID, agent ID,"
+                "Provide a session UUID, agent ID"
+                " (or a unique prefix of either),"
                 " team-name/agent-name, or"
                 " path to a .jsonl file.",
                 file=sys.stderr,
@@ -479,7 +1258,12 @@ def main():
     print(f"Transcript: {path}", file=sys.stderr)
     print(file=sys.stderr)
 
-    summarize_transcript(path)
+    cache = None if args.no_cache else open_summary_cache()
+    try:
+        summarize_transcript(path, cache)
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
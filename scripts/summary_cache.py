@@ -0,0 +1,231 @@
+"""Cache of summarize-session.py progress per transcript.
+
+Transcripts are append-only, and the same agents are summarized again
+and again, often while their sessions are still running. The cache is
+an SQLite database under ~/.enact/ holding, for each summarized
+transcript, the byte offset the summary reached, the summarizer's
+state at that point (JSON) and the summary body rendered so far. A
+rerun picks up from that offset, so only bytes appended since are
+parsed.
+
+Bodies are stored and loaded in chunks, streamed from and to the
+summarizer's spool file, so a cached body is never held in memory
+whole. Bodies over MAX_BODY_BYTES are not cached.
+
+An entry is used only if the transcript is still the same file: same
+path and inode, at least as long as the offset, and with the same
+leading bytes. Compressed transcripts (see transcript_io.py) are not
+appended to, so theirs must also match in size and mtime.
+"""
+
+import hashlib
+import itertools
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from transcript_io import is_compressed
+
+CACHE_PATH = Path.home() / ".enact" / "summary-cache.sqlite"
+
+# Bump when the schema or the meaning of a column changes; older
+# caches are discarded and rebuilt.
+SCHEMA_VERSION = 2
+
+# How many leading bytes of a transcript are checksummed to tell an
+# appended-to file from a replaced one.
+HEAD_BYTES = 4096
+
+# Least recently used entries beyond this many are dropped.
+MAX_ENTRIES = 2000
+
+# Summary bodies are stored in rows of this many characters.
+BODY_CHUNK_CHARS = 64 * 1024
+
+# Transcripts whose summary body is larger than this (UTF-8) are
+# not cached, bounding the cache's size on disk.
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    head_size INTEGER NOT NULL,
+    head_digest TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    used_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS summary_bodies (
+    path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (path, seq)
+);
+"""
+
+
+def head_digest(path: Path, size: int) -> str:
+    """Return the SHA-256 hex digest of a file's first `size` bytes."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read(size)).hexdigest()
+
+
+class SummaryCache:
+    """SQLite-backed store of resumable summary state.
+
+    `version` identifies the summarizer's state and output format;
+    entries written under another version are discarded.
+    """
+
+    def __init__(self, version: str, path: Path = CACHE_PATH):
+        self.path = path
+        self.version = f"{SCHEMA_VERSION}:{version}"
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache, rebuilding it if it is corrupt or from
+        another schema version."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return self._open()
+        except sqlite3.DatabaseError:
+            self.path.unlink(missing_ok=True)
+            return self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            conn.executescript(_SCHEMA)
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if row is not None and (
+                row[0].split(":", 1)[0] != str(SCHEMA_VERSION)
+            ):
+                raise sqlite3.DatabaseError(
+                    f"summary cache schema version {row[0]}"
+                )
+            if row is None or row[0] != self.version:
+                conn.execute("DELETE FROM summaries")
+                conn.execute("DELETE FROM summary_bodies")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                    (self.version,),
+                )
+                conn.commit()
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def load(self, path: Path, body) -> tuple[int, dict] | None:
+        """Return (offset, state) cached for a transcript, writing
+        the cached summary body to the text file `body`, or return
+        None (writing nothing) if there is no usable entry."""
+        key = str(Path(path).resolve())
+        try:
+            # One read transaction, so that the entry and its body
+            # chunks come from the same store.
+            self.conn.execute("BEGIN")
+            row = self.conn.execute(
+                "SELECT inode, size, mtime_ns, head_size, head_digest,"
+                " offset, state FROM summaries WHERE path = ?",
+                (key,),
+            ).fetchone()
+            if row is None or not self._matches(path, row):
+                return None
+            for (data,) in self.conn.execute(
+                "SELECT data FROM summary_bodies WHERE path = ?"
+                " ORDER BY seq",
+                (key,),
+            ):
+                body.write(data.decode("utf-8"))
+        finally:
+            self.conn.commit()
+        self.conn.execute(
+            "UPDATE summaries SET used_ns = ? WHERE path = ?",
+            (time.time_ns(), key),
+        )
+        self.conn.commit()
+        return row[5], json.loads(row[6])
+
+    def _matches(self, path: Path, row: tuple) -> bool:
+        """Check that a transcript is still the file a summaries
+        row was stored for."""
+        inode, size, mtime_ns, head_size, digest = row[:5]
+        try:
+            st = Path(path).stat()
+            if st.st_ino != inode or st.st_size < size:
+                return False
+            if is_compressed(path):
+                return st.st_size == size and st.st_mtime_ns == mtime_ns
+            return head_digest(path, head_size) == digest
+        except OSError:
+            return False
+
+    def store(self, path: Path, offset: int, state: dict, body) -> None:
+        """Cache a transcript's summary state as of byte `offset`,
+        reading the summary body from the text file `body` up to its
+        end. Bodies over MAX_BODY_BYTES are not cached, and any
+        older entry for the transcript is dropped instead."""
+        key = str(Path(path).resolve())
+        try:
+            st = Path(path).stat()
+            head_size = 0 if is_compressed(path) else min(offset, HEAD_BYTES)
+            digest = head_digest(path, head_size)
+        except OSError:
+            return
+        self._delete(key)
+        self.conn.execute(
+            "INSERT INTO summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key, st.st_ino, st.st_size, st.st_mtime_ns,
+                head_size, digest, offset, json.dumps(state),
+                time.time_ns(),
+            ),
+        )
+        total = 0
+        for seq in itertools.count():
+            chunk = body.read(BODY_CHUNK_CHARS)
+            if not chunk:
+                break
+            data = chunk.encode("utf-8")
+            total += len(data)
+            if total > MAX_BODY_BYTES:
+                self.conn.rollback()
+                self.discard(path)
+                return
+            self.conn.execute(
+                "INSERT INTO summary_bodies VALUES (?, ?, ?)",
+                (key, seq, data),
+            )
+        evicted = self.conn.execute(
+            "SELECT path FROM summaries ORDER BY used_ns DESC"
+            " LIMIT -1 OFFSET ?",
+            (MAX_ENTRIES,),
+        ).fetchall()
+        for (old,) in evicted:
+            self._delete(old)
+        self.conn.commit()
+
+    def _delete(self, key: str) -> None:
+        self.conn.execute("DELETE FROM summaries WHERE path = ?", (key,))
+        self.conn.execute(
+            "DELETE FROM summary_bodies WHERE path = ?", (key,)
+        )
+
+    def discard(self, path: Path) -> None:
+        """Drop a transcript's entry."""
+        self._delete(str(Path(path).resolve()))
+        self.conn.commit()
@@ -0,0 +1,453 @@
+"""Persistent catalog of Claude Code session transcripts.
+
+Scanning every transcript under ~/.claude/projects/ is slow once
+they add up to gigabytes. The catalog is an SQLite database under
+~/.enact/ that records, for each top-level session transcript, the
+facts the enact tooling looks up:
+
+- the session id and project directory
+- the enact IDs it references (via `.enact/<id>` paths)
+- the first teamName/agentName pair and the first timestamp
+- its subagent transcripts, by agent ID
+- which enact IDs a search for bare occurrences did or did not find
+  in it, and the mtime and size it was searched at
+
+refresh() re-reads only transcripts whose mtime or size changed.
+Transcripts are append-only, so a grown file is scanned from where
+the previous scan stopped. Compressed transcripts (see
+transcript_io.py) are rescanned whole when they change.
+"""
+
+import json
+import re
+import sqlite3
+from pathlib import Path
+
+from transcript_io import (
+    READ_ERRORS,
+    is_compressed,
+    list_transcripts,
+    loads,
+    open_transcript,
+    transcript_stem,
+)
+
+CATALOG_PATH = Path.home() / ".enact" / "transcript-catalog.sqlite"
+
+# Bump when the schema or the meaning of a column changes; older
+# catalogs are discarded and rebuilt.
+SCHEMA_VERSION = 3
+
+ENACT_REF_RE = re.compile(rb"\.enact/(\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transcripts (
+    path TEXT PRIMARY KEY,
+    project_dir TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    scanned_offset INTEGER NOT NULL,
+    team_name TEXT,
+    agent_name TEXT,
+    first_timestamp TEXT,
+    subagents_mtime_ns INTEGER,
+    subagent_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS enact_refs (
+    enact_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (enact_id, path)
+);
+CREATE INDEX IF NOT EXISTS enact_refs_path
+    ON enact_refs (path);
+CREATE INDEX IF NOT EXISTS transcripts_session_id
+    ON transcripts (session_id);
+CREATE INDEX IF NOT EXISTS transcripts_agent_name
+    ON transcripts (agent_name);
+CREATE TABLE IF NOT EXISTS agents (
+    path TEXT PRIMARY KEY,
+    agent_id TEXT NOT NULL,
+    session_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS agents_agent_id
+    ON agents (agent_id);
+CREATE INDEX IF NOT EXISTS agents_session_path
+    ON agents (session_path);
+CREATE TABLE IF NOT EXISTS id_scans (
+    enact_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    found INTEGER NOT NULL,
+    PRIMARY KEY (enact_id, path)
+);
+CREATE INDEX IF NOT EXISTS id_scans_path
+    ON id_scans (path);
+"""
+
+
+def _prefix_range(prefix: str) -> tuple[str, str]:
+    """Return (low, high) such that low <= s < high exactly when s
+    starts with a non-empty prefix, for an indexed range query."""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def scan_transcript(
+    path: Path, offset: int, state: dict
+) -> tuple[int, set[str]]:
+    """Scan complete lines of a transcript from `offset`.
+
+    Fills in `first_timestamp`, `team_name` and `agent_name` in
+    `state` if they are not already set. Only lines that mention
+    the relevant keys are JSON-decoded. Returns the offset just
+    past the last complete line and the enact IDs referenced.
+    """
+    enact_ids: set[str] = set()
+    with open_transcript(path) as f:
+        if offset:
+            f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Still being written; pick it up next refresh.
+                break
+            offset += len(line)
+            for m in ENACT_REF_RE.finditer(line):
+                enact_ids.add(m.group(1).decode("ascii"))
+
+            need_ts = not state.get("first_timestamp") and (
+                b'"timestamp"' in line
+            )
+            need_team = not state.get("team_name") and (
+                b'"teamName"' in line
+            )
+            if not (need_ts or need_team):
+                continue
+            try:
+                d = loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(d, dict):
+                continue
+            if need_ts and "timestamp" in d:
+                state["first_timestamp"] = d["timestamp"]
+            if need_team and d.get("teamName") and d.get("agentName"):
+                state["team_name"] = d["teamName"]
+                state["agent_name"] = d["agentName"]
+    return offset, enact_ids
+
+
+def _scan_job(
+    job: tuple[Path, int, dict]
+) -> tuple[int, set[str], dict] | None:
+    """Run scan_transcript for a (path, offset, state) job.
+
+    Module-level so it can run in a process pool. Returns
+    (offset, enact_ids, state), or None if the file is unreadable.
+    """
+    path, offset, state = job
+    try:
+        offset, enact_ids = scan_transcript(path, offset, state)
+    except READ_ERRORS:
+        return None
+    return offset, enact_ids, state
+
+
+class TranscriptCatalog:
+    """SQLite-backed index of session transcripts."""
+
+    def __init__(self, path: Path = CATALOG_PATH):
+        self.path = path
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the catalog, rebuilding it if it is corrupt or
+        from another schema version."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return self._open()
+        except sqlite3.DatabaseError:
+            self.path.unlink(missing_ok=True)
+            return self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            conn.executescript(_SCHEMA)
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT INTO meta VALUES ('version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+                conn.commit()
+            elif row[0] != str(SCHEMA_VERSION):
+                raise sqlite3.DatabaseError(
+                    f"catalog schema version {row[0]}"
+                )
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def refresh(self, project_dirs: list[Path], map_fn=map) -> None:
+        """Bring the catalog up to date with the transcripts on
+        disk, re-reading only files that changed.
+
+        Changed files are scanned through `map_fn(fn, items)`, which
+        may fan out to a thread or process pool as long as it returns
+        results in input order.
+        """
+        known = {
+            row[0]: row
+            for row in self.conn.execute(
+                "SELECT path, mtime_ns, size, inode, scanned_offset,"
+                " team_name, agent_name, first_timestamp,"
+                " subagents_mtime_ns FROM transcripts"
+            )
+        }
+        seen: set[str] = set()
+        jobs = []
+
+        for project_dir in project_dirs:
+            for path in list_transcripts(project_dir):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                seen.add(str(path))
+                job = self._plan_refresh(
+                    project_dir, path, st, known.get(str(path)),
+                )
+                if job is not None:
+                    jobs.append(job)
+
+        scans = map_fn(
+            _scan_job,
+            [(j["path"], j["offset"], j["state"]) for j in jobs],
+        )
+        for job, scan in zip(jobs, scans):
+            if scan is not None:
+                self._store(job, *scan)
+
+        gone = [p for p in known if p not in seen]
+        for p in gone:
+            self.conn.execute(
+                "DELETE FROM transcripts WHERE path = ?", (p,)
+            )
+            self.conn.execute(
+                "DELETE FROM enact_refs WHERE path = ?", (p,)
+            )
+            self.conn.execute(
+                "DELETE FROM agents WHERE session_path = ?", (p,)
+            )
+            self.conn.execute(
+                "DELETE FROM id_scans WHERE path = ?", (p,)
+            )
+        self.conn.commit()
+
+    def _plan_refresh(
+        self, project_dir: Path, path: Path, st, row
+    ) -> dict | None:
+        """Decide how to bring one transcript's row up to date.
+
+        Applies subagent-only changes directly. Returns a scan job
+        if the file itself changed, else None.
+        """
+        subagents_dir = path.parent / transcript_stem(path) / "subagents"
+        try:
+            sub_mtime = subagents_dir.stat().st_mtime_ns
+        except OSError:
+            sub_mtime = None
+
+        unchanged = (
+            row is not None
+            and row[1] == st.st_mtime_ns
+            and row[2] == st.st_size
+        )
+        if unchanged and row[8] == sub_mtime:
+            return None
+
+        if sub_mtime is None:
+            agent_paths = []
+        else:
+            agent_paths = list_transcripts(subagents_dir, "agent-")
+        sub_count = len(agent_paths)
+        self.conn.execute(
+            "DELETE FROM agents WHERE session_path = ?", (str(path),)
+        )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO agents VALUES (?, ?, ?)",
+            [
+                (
+                    str(p), transcript_stem(p).removeprefix("agent-"),
+                    str(path),
+                )
+                for p in agent_paths
+            ],
+        )
+
+        if unchanged:
+            self.conn.execute(
+                "UPDATE transcripts SET subagents_mtime_ns = ?,"
+                " subagent_count = ? WHERE path = ?",
+                (sub_mtime, sub_count, str(path)),
+            )
+            return None
+
+        # Append-only growth of the same plain file resumes the scan;
+        # anything else is rescanned from the start.
+        grew = (
+            row is not None
+            and not is_compressed(path)
+            and row[3] == st.st_ino
+            and st.st_size >= row[2]
+        )
+        if grew:
+            offset = row[4]
+            state = {
+                "team_name": row[5],
+                "agent_name": row[6],
+                "first_timestamp": row[7],
+            }
+        else:
+            offset = 0
+            state = {}
+            self.conn.execute(
+                "DELETE FROM enact_refs WHERE path = ?", (str(path),)
+            )
+
+        return {
+            "project_dir": project_dir,
+            "path": path,
+            "st": st,
+            "offset": offset,
+            "state": state,
+            "sub_mtime": sub_mtime,
+            "sub_count": sub_count,
+        }
+
+    def _store(
+        self, job: dict, offset: int, enact_ids: set[str], state: dict
+    ) -> None:
+        """Write one scanned transcript's row and references."""
+        path, st = job["path"], job["st"]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO transcripts VALUES"
+            " (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(path), str(job["project_dir"]), transcript_stem(path),
+                st.st_mtime_ns, st.st_size, st.st_ino, offset,
+                state.get("team_name"), state.get("agent_name"),
+                state.get("first_timestamp"),
+                job["sub_mtime"], job["sub_count"],
+            ),
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO enact_refs VALUES (?, ?)",
+            [(eid, str(path)) for eid in enact_ids],
+        )
+
+    def sessions_referencing(
+        self, enact_id: str
+    ) -> list[tuple[Path, Path, int]]:
+        """Return (project_dir, path, subagent_count) for every
+        transcript that references the enact ID."""
+        rows = self.conn.execute(
+            "SELECT t.project_dir, t.path, t.subagent_count"
+            " FROM enact_refs r JOIN transcripts t"
+            " ON t.path = r.path WHERE r.enact_id = ?"
+            " ORDER BY t.path",
+            (enact_id,),
+        )
+        return [(Path(p), Path(f), n) for p, f, n in rows]
+
+    def id_scans(
+        self, enact_ids: list[str]
+    ) -> dict[tuple[str, str], tuple[int, int, bool]]:
+        """Return recorded bare-ID search results for the enact IDs,
+        as {(enact_id, path): (mtime_ns, size, found)}."""
+        results = {}
+        for enact_id in enact_ids:
+            for path, mtime_ns, size, found in self.conn.execute(
+                "SELECT path, mtime_ns, size, found FROM id_scans"
+                " WHERE enact_id = ?",
+                (enact_id,),
+            ):
+                results[enact_id, path] = (mtime_ns, size, bool(found))
+        return results
+
+    def record_id_scans(
+        self, rows: list[tuple[str, str, int, int, bool]]
+    ) -> None:
+        """Record (enact_id, path, mtime_ns, size, found) results of
+        searching transcripts for bare enact IDs, so unchanged
+        transcripts are not searched again."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO id_scans VALUES (?, ?, ?, ?, ?)",
+            [(i, p, m, s, int(f)) for i, p, m, s, f in rows],
+        )
+        self.conn.commit()
+
+    def team_members(
+        self, team_prefix: str
+    ) -> list[tuple[Path, str, str, str]]:
+        """Return (path, teamName, agentName, first timestamp) for
+        transcripts whose teamName starts with team_prefix."""
+        rows = self.conn.execute(
+            "SELECT path, team_name, agent_name, first_timestamp"
+            " FROM transcripts"
+            " WHERE substr(team_name, 1, length(?1)) = ?1"
+            " AND agent_name IS NOT NULL AND agent_name != ''",
+            (team_prefix,),
+        )
+        return [(Path(p), t, a, ts or "") for p, t, a, ts in rows]
+
+    def sessions_by_id(self, prefix: str) -> list[tuple[str, Path]]:
+        """Return (session_id, path) for top-level transcripts whose
+        session ID starts with prefix, sorted by session ID."""
+        if not prefix:
+            return []
+        rows = self.conn.execute(
+            "SELECT session_id, path FROM transcripts"
+            " WHERE session_id >= ? AND session_id < ?"
+            " ORDER BY session_id, path",
+            _prefix_range(prefix),
+        )
+        return [(sid, Path(p)) for sid, p in rows]
+
+    def agents_by_id(self, prefix: str) -> list[tuple[str, Path]]:
+        """Return (agent_id, path) for subagent transcripts whose
+        agent ID starts with prefix, sorted by agent ID."""
+        if not prefix:
+            return []
+        rows = self.conn.execute(
+            "SELECT agent_id, path FROM agents"
+            " WHERE agent_id >= ? AND agent_id < ?"
+            " ORDER BY agent_id, path",
+            _prefix_range(prefix),
+        )
+        return [(aid, Path(p)) for aid, p in rows]
+
+    def sessions_by_agent_name(
+        self, agent_name: str
+    ) -> list[tuple[Path, str, str]]:
+        """Return (path, teamName, first timestamp) for transcripts
+        whose first agentName is agent_name."""
+        rows = self.conn.execute(
+            "SELECT path, team_name, first_timestamp FROM transcripts"
+            " WHERE agent_name = ? AND team_name IS NOT NULL"
+            " AND team_name != '' ORDER BY path",
+            (agent_name,),
+        )
+        return [(Path(p), t, ts or "") for p, t, ts in rows]
@@ -0,0 +1,159 @@
+"""Reading Claude Code transcripts, plain or compressed.
+
+Old transcripts under ~/.claude/projects/ may be compressed in place
+to `<name>.jsonl.gz` or `<name>.jsonl.xz`. These helpers let the enact
+tooling find and stream them like plain `.jsonl` files, decompressing
+on the fly with the stdlib gzip and lzma modules.
+
+Records are decoded with orjson when it is installed (set
+ENACT_JSON=stdlib to force the json module), and record_type reads a
+record's top-level "type" from the raw line so that callers can skip
+record types they do not need without decoding them.
+"""
+
+import gzip
+import json
+import lzma
+import os
+import re
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if os.environ.get("ENACT_JSON") == "stdlib":
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+TRANSCRIPT_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.xz")
+_SUFFIXES_LONGEST_FIRST = sorted(TRANSCRIPT_SUFFIXES, key=len, reverse=True)
+
+# What reading a transcript can raise: I/O errors, plus truncated or
+# corrupt compressed data (gzip.BadGzipFile is an OSError).
+READ_ERRORS = (OSError, EOFError, lzma.LZMAError)
+
+_OPENERS = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+}
+
+
+# Integers of 19 or more digits may exceed 64 bits, which orjson does
+# not read as Python ints. Mapping digits to "0" and everything else
+# to " " finds such runs far faster than a regex.
+_DIGIT_MASK = bytes(0x30 if 0x30 <= i <= 0x39 else 0x20 for i in range(256))
+_LONG_DIGITS = b"0" * 19
+
+
+def loads(data: bytes | str):
+    """Decode one JSON document, preferring orjson.
+
+    Input orjson rejects or reads differently from the json module
+    (NaN, lone surrogates, integers beyond 64 bits) goes to json, so
+    results never depend on the backend. Raises json.JSONDecodeError
+    (a ValueError), or UnicodeDecodeError for bytes that are not UTF-8.
+    """
+    if orjson is not None and isinstance(data, bytes):
+        if _LONG_DIGITS not in data.translate(_DIGIT_MASK):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+_TYPE_VALUE_RE = re.compile(rb'\s*:\s*"([A-Za-z0-9_-]*)"')
+
+
+def record_type(line: bytes) -> str | None:
+    """Read a JSONL record's top-level "type" without decoding it.
+
+    Returns None when that cannot be done safely: no "type" key, or
+    the first one may be nested or inside a string. Callers should
+    then decode the line.
+    """
+    start = line.find(b'"type"')
+    if start <= 0 or line[start - 1] == 0x5C:  # backslash: in a string
+        return None
+    # Only the record's own "{" may precede its "type" key; any other
+    # brace or bracket means the match may belong to a nested value.
+    if (
+        line.find(b"{", line.find(b"{") + 1, start) != -1
+        or line.find(b"[", 0, start) != -1
+    ):
+        return None
+    m = _TYPE_VALUE_RE.match(line, start + 6)
+    if m is None:
+        return None
+    return m.group(1).decode("ascii")
+
+
+def is_transcript_name(name: str) -> bool:
+    """Check whether a file name is a (possibly compressed) transcript."""
+    return name.endswith(TRANSCRIPT_SUFFIXES)
+
+
+def is_compressed(path: Path) -> bool:
+    """Check whether a transcript is stored compressed."""
+    return path.suffix in _OPENERS
+
+
+def transcript_stem(path: Path) -> str:
+    """Return a transcript's name without its suffixes, e.g. the
+    session ID or `agent-<id>`."""
+    name = path.name
+    for suffix in _SUFFIXES_LONGEST_FIRST:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return path.stem
+
+
+def open_transcript(path: Path, mode: str = "rb"):
+    """Open a transcript for streaming, decompressing if needed.
+
+    `mode` is "rb" or "r"; text mode decodes UTF-8.
+    """
+    opener = _OPENERS.get(Path(path).suffix)
+    if opener is None:
+        if "b" in mode:
+            return open(path, mode)
+        return open(path, mode, encoding="utf-8")
+    if "b" in mode:
+        return opener(path, mode)
+    return opener(path, "rt", encoding="utf-8")
+
+
+def list_transcripts(directory: Path, prefix: str = "") -> list[Path]:
+    """List transcripts in a directory whose names start with
+    `prefix`, sorted by name.
+
+    If a transcript exists both plain and compressed (e.g. while it
+    is being compressed), only the plain file is listed.
+    """
+    try:
+        names = [
+            e.name for e in os.scandir(directory)
+            if e.name.startswith(prefix) and is_transcript_name(e.name)
+        ]
+    except OSError:
+        return []
+    by_stem: dict[str, str] = {}
+    for name in names:
+        stem = transcript_stem(Path(name))
+        current = by_stem.get(stem)
+        if current is None or name.endswith(".jsonl"):
+            by_stem[stem] = name
+    return sorted(Path(directory) / name for name in by_stem.values())
+
+
+def find_transcript_file(directory: Path, stem: str) -> Path | None:
+    """Return the transcript named `stem` in a directory, preferring
+    the plain file over compressed ones, or None."""
+    for suffix in TRANSCRIPT_SUFFIXES:
+        candidate = Path(directory) / f"{stem}{suffix}"
+        if candidate.is_file():
+            return candidate
+    return None